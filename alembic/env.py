@@ -9,9 +9,14 @@ from src.core.config import settings
 from src.db.base import Base
 
 # Import all models to register them with Base's metadata
-from src.models.user import User, Profile
+from src.models.user import User, Profile, ProfileFacet, RefreshToken
 from src.models.committee import CommitteeSession, CommitteeMember
 from src.models.content import Event, Notice
+from src.models.upload_job import (
+    BulkUploadCredentials,
+    BulkUploadJob,
+    BulkUploadJobError,
+)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -28,6 +33,15 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names) -> bool:
+    # The FTS5 search index (profiles_fts and its shadow tables) is created
+    # with raw SQL, so autogenerate must not try to drop it
+    if type_ == "table":
+        return not name.startswith("profiles_fts")
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -50,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -72,7 +87,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -0,0 +1,67 @@
+"""Added profile search index
+
+Revision ID: c7e3df2f2c5b
+Revises: 947e2f98da01
+Create Date: 2026-10-17 03:08:48.933695
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3df2f2c5b'
+down_revision: Union[str, Sequence[str], None] = '947e2f98da01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = "full_name, current_company, designation, work_location, department, series"
+NEW = "new.full_name, new.current_company, new.designation, new.work_location, new.department, new.series"
+OLD = "old.full_name, old.current_company, old.designation, old.work_location, old.department, old.series"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FTS5 is SQLite-only; other databases fall back to LIKE search
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute(
+        f"CREATE VIRTUAL TABLE profiles_fts USING fts5({COLUMNS}, "
+        "content='profiles', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute(
+        "CREATE TRIGGER profiles_fts_ai AFTER INSERT ON profiles BEGIN "
+        f"INSERT INTO profiles_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW}); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER profiles_fts_ad AFTER DELETE ON profiles BEGIN "
+        f"INSERT INTO profiles_fts(profiles_fts, rowid, {COLUMNS}) "
+        f"VALUES ('delete', old.id, {OLD}); "
+        "END"
+    )
+    op.execute(
+        f"CREATE TRIGGER profiles_fts_au AFTER UPDATE OF {COLUMNS} ON profiles BEGIN "
+        f"INSERT INTO profiles_fts(profiles_fts, rowid, {COLUMNS}) "
+        f"VALUES ('delete', old.id, {OLD}); "
+        f"INSERT INTO profiles_fts(rowid, {COLUMNS}) VALUES (new.id, {NEW}); "
+        "END"
+    )
+    # Index the existing profiles
+    op.execute("INSERT INTO profiles_fts(profiles_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS profiles_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS profiles_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS profiles_fts_ai")
+    op.execute("DROP TABLE IF EXISTS profiles_fts")
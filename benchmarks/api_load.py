@@ -0,0 +1,338 @@
+"""
+Benchmark: a realistic request mix (login, /users/me, the directory, events,
+notices, the active committee, bulk upload) against `src.main:app` on a
+temporary SQLite database.
+
+The app is driven either in-process through an ASGI client (no network, one
+event loop) or over HTTP against `uvicorn --workers N`. Throughput and
+p50/p95/p99 latency per route are printed and saved as JSON; pass a previous
+run's file with --compare to see what changed.
+
+Usage:
+    python -m benchmarks.api_load [--mode inprocess|uvicorn] [--workers N]
+        [--users N] [--concurrency N] [--duration S] [--output FILE]
+        [--compare FILE]
+"""
+
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+import typer
+
+PASSWORD = "benchmark-password"
+ADMIN_EMAIL = "admin@bench.rca.com"
+UPLOAD_ROWS = 10
+
+# Relative frequency of each request in the mix
+MIX = {
+    "POST /auth/login": 1,
+    "GET /users/me": 20,
+    "GET /users/": 10,
+    "GET /content/events": 10,
+    "GET /content/notices": 10,
+    "GET /committees/active": 10,
+    "POST /users/bulk-upload-alumni": 0.2,
+}
+
+
+def seed(url: str, users: int, events: int, notices: int, sessions: int) -> None:
+    # Every account shares one password hash, so seeding stays fast while
+    # logins still verify a real hash
+    from sqlalchemy import update
+    from sqlalchemy.orm import sessionmaker
+
+    from src.core.security import get_password_hash
+    from src.db.base import Base
+    from src.db.database import create_db_engine
+    from src.models.enums import UserRole
+    from src.models.upload_job import BulkUploadJob  # Registers its table
+    from src.models.user import Profile, User
+    from src.services.seed import seed_database
+
+    engine = create_db_engine(url)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    hashed_password = get_password_hash(PASSWORD)
+
+    with Session() as session:
+        # Alumni first, so their user ids are 1..users
+        seed_database(
+            session,
+            hashed_password=hashed_password,
+            users=users,
+            events=events,
+            notices=notices,
+            committee_sessions=sessions,
+        )
+        # Any seeded alumni may be picked to log in
+        session.execute(update(User).values(is_active=True))
+        admin = User(
+            email=ADMIN_EMAIL,
+            hashed_password=hashed_password,
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        session.add(admin)
+        session.flush()
+        session.add(
+            Profile(
+                user_id=admin.id,
+                full_name="Admin User",
+                university_id="ADMIN001",
+                department="CSE",
+                series="2010",
+            )
+        )
+        session.commit()
+    engine.dispose()
+
+
+class LoadTest:
+    """
+    Requests of the mix sent by `concurrency` virtual users; latencies are
+    recorded per route.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, users: int, seed: int = 0):
+        self.client = client
+        self.users = users
+        self.rng = random.Random(seed)
+        self.routes = list(MIX)
+        self.weights = list(MIX.values())
+        self.uploads = itertools.count()
+        self.tokens: dict[str, str] = {}
+        self.latencies: dict[str, list[float]] = {route: [] for route in MIX}
+        self.errors: dict[str, int] = {route: 0 for route in MIX}
+
+    def _email(self, user_id: int | None = None) -> str:
+        from src.services.seed import alumni_email
+
+        return alumni_email(user_id or self.rng.randrange(1, self.users + 1))
+
+    async def login(self, email: str) -> httpx.Response:
+        response = await self.client.post(
+            "/api/v1/auth/login", data={"username": email, "password": PASSWORD}
+        )
+        if response.status_code == 200:
+            self.tokens[email] = response.json()["access_token"]
+        return response
+
+    def _auth(self, email: str) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.tokens[email]}"}
+
+    def _upload(self) -> tuple[str, bytes, str]:
+        batch = next(self.uploads)
+        # Distinct university ids keep generated emails unique across
+        # concurrent uploads
+        rows = ["full_name,series,university_id,department,work_location"] + [
+            f"Upload {batch} {i},2024,U{batch}-{i},CSE,Dhaka"
+            for i in range(UPLOAD_ROWS)
+        ]
+        return ("alumni.csv", "\n".join(rows).encode(), "text/csv")
+
+    async def request(self, route: str, email: str) -> httpx.Response:
+        if route == "POST /auth/login":
+            return await self.login(self._email())
+        if route == "GET /users/me":
+            return await self.client.get("/api/v1/users/me", headers=self._auth(email))
+        if route == "GET /users/":
+            return await self.client.get(
+                "/api/v1/users/", params={"limit": 20}, headers=self._auth(email)
+            )
+        if route == "POST /users/bulk-upload-alumni":
+            return await self.client.post(
+                "/api/v1/users/bulk-upload-alumni",
+                files={"file": self._upload()},
+                headers=self._auth(ADMIN_EMAIL),
+            )
+        method, path = route.split(" ", 1)
+        return await self.client.request(method, f"/api/v1{path}")
+
+    async def virtual_user(self, email: str, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            route = self.rng.choices(self.routes, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await self.request(route, email)
+                ok = response.status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            if ok:
+                self.latencies[route].append(time.perf_counter() - started)
+            else:
+                self.errors[route] += 1
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        # Each virtual user logs in once up front, like a browser session
+        emails = [self._email(i % self.users + 1) for i in range(concurrency)]
+        for email in [ADMIN_EMAIL] + emails:
+            if email not in self.tokens:
+                response = await self.login(email)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(self.virtual_user(e, deadline) for e in emails))
+        return time.perf_counter() - started
+
+
+def percentile(times: list[float], fraction: float) -> float:
+    if not times:
+        return 0.0
+    times = sorted(times)
+    return times[min(len(times) - 1, int(len(times) * fraction))] * 1000
+
+
+def stats(times: list[float], errors: int, elapsed: float) -> dict:
+    return {
+        "requests": len(times),
+        "errors": errors,
+        "requests_per_second": len(times) / elapsed,
+        "p50_ms": percentile(times, 0.5),
+        "p95_ms": percentile(times, 0.95),
+        "p99_ms": percentile(times, 0.99),
+    }
+
+
+def summarize(test: LoadTest, elapsed: float) -> dict:
+    routes = {
+        route: stats(times, test.errors[route], elapsed)
+        for route, times in test.latencies.items()
+    }
+    everything = [t for times in test.latencies.values() for t in times]
+    routes["total"] = stats(everything, sum(test.errors.values()), elapsed)
+    return routes
+
+
+async def run_inprocess(users: int, concurrency: int, duration: float) -> tuple:
+    from src.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            test = LoadTest(client, users)
+            elapsed = await test.run(concurrency, duration)
+    return test, elapsed
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_uvicorn(
+    users: int, concurrency: int, duration: float, workers: int
+) -> tuple:
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.main:app", "--port", str(port)]
+        + ["--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        env=os.environ.copy(),
+    )
+    try:
+        limits = httpx.Limits(max_connections=concurrency + 1)
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=60
+        ) as client:
+            for _ in range(300):  # Wait up to 30s for the workers to start
+                try:
+                    await client.get("/")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("uvicorn did not start")
+
+            test = LoadTest(client, users)
+            elapsed = await test.run(concurrency, duration)
+    finally:
+        server.terminate()
+        server.wait()
+    return test, elapsed
+
+
+def print_results(routes: dict, previous: dict | None) -> None:
+    typer.echo(
+        f"{'Route':<32} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50':>9} {'p95':>9} {'p99':>9}"
+        + (f" {'p99 before':>11}" if previous else "")
+    )
+    for route, r in routes.items():
+        line = (
+            f"{route:<32} {r['requests']:>9} {r['errors']:>7} "
+            f"{r['requests_per_second']:>8,.1f} {r['p50_ms']:>7.1f}ms "
+            f"{r['p95_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms"
+        )
+        if previous and route in previous:
+            line += f" {previous[route]['p99_ms']:>9.1f}ms"
+        typer.echo(line)
+
+
+def main(
+    mode: str = typer.Option("inprocess", help="inprocess or uvicorn"),
+    workers: int = typer.Option(2, help="uvicorn worker processes"),
+    users: int = typer.Option(10_000, help="Alumni seeded into the database"),
+    events: int = typer.Option(500, help="Events seeded"),
+    notices: int = typer.Option(1_000, help="Notices seeded"),
+    sessions: int = typer.Option(20, help="Committee sessions seeded"),
+    concurrency: int = typer.Option(20, help="Virtual users sending requests"),
+    duration: float = typer.Option(30, help="Seconds to send requests for"),
+    output: Path = typer.Option(None, help="JSON results file"),
+    compare: Path = typer.Option(None, help="Previous results file to compare"),
+):
+    if mode not in ("inprocess", "uvicorn"):
+        raise typer.BadParameter("mode must be inprocess or uvicorn")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # The app reads its settings on import, so point them at the
+        # temporary database before anything from src is loaded
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        os.environ["DATABASE_URL"] = url
+        os.environ["UPLOAD_JOBS_DIR"] = os.path.join(tmp, "upload_jobs")
+
+        started = time.perf_counter()
+        seed(url, users, events, notices, sessions)
+        typer.echo(f"Seeded {users:,} users in {time.perf_counter() - started:.1f}s")
+
+        if mode == "inprocess":
+            test, elapsed = asyncio.run(run_inprocess(users, concurrency, duration))
+        else:
+            test, elapsed = asyncio.run(
+                run_uvicorn(users, concurrency, duration, workers)
+            )
+
+    routes = summarize(test, elapsed)
+    previous = json.loads(compare.read_text())["routes"] if compare else None
+    print_results(routes, previous)
+
+    results = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "mode": mode,
+        "workers": workers if mode == "uvicorn" else 1,
+        "users": users,
+        "concurrency": concurrency,
+        "duration_seconds": elapsed,
+        "mix": MIX,
+        "routes": routes,
+    }
+    output = output or Path(f"api_load_{mode}_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.write_text(json.dumps(results, indent=2))
+    typer.echo(f"\nSaved results to {output}")
+
+
+if __name__ == "__main__":
+    typer.run(main)
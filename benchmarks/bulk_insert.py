@@ -0,0 +1,71 @@
+"""
+Benchmark: per-row ORM flushes vs. set-based bulk insert for alumni imports.
+
+Usage:
+    python -m benchmarks.bulk_insert [SIZES...]
+"""
+
+import os
+import tempfile
+import time
+
+import typer
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.common import make_accounts
+from src.db.base import Base
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+from src.services.alumni_import import bulk_create_alumni
+
+
+def insert_per_row(session, accounts: list[dict]) -> None:
+    # The previous implementation: two flushes per row
+    for account in accounts:
+        user = User(
+            email=account["email"],
+            hashed_password=account["hashed_password"],
+            role=UserRole.ALUMNI,
+            is_active=True,
+        )
+        session.add(user)
+        session.flush()
+        session.add(Profile(user_id=user.id, **account["profile"]))
+        session.flush()
+
+
+def insert_bulk(session, accounts: list[dict]) -> None:
+    chunk_size = 500
+    for start in range(0, len(accounts), chunk_size):
+        bulk_create_alumni(session, accounts[start : start + chunk_size])
+
+
+def run(strategy, n: int) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        accounts = make_accounts(n)
+
+        started = time.perf_counter()
+        strategy(session, accounts)
+        session.commit()
+        elapsed = time.perf_counter() - started
+
+        session.close()
+        engine.dispose()
+    return n / elapsed
+
+
+def main(sizes: list[int] = typer.Argument(None, help="Row counts to benchmark")):
+    sizes = sizes or [1_000, 10_000, 100_000]
+    typer.echo(f"{'Rows':>8} {'per-row rows/s':>16} {'bulk rows/s':>14} {'speedup':>8}")
+    for n in sizes:
+        before = run(insert_per_row, n)
+        after = run(insert_bulk, n)
+        typer.echo(f"{n:>8} {before:>16,.0f} {after:>14,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    typer.run(main)
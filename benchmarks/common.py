@@ -0,0 +1,29 @@
+"""
+Test data shared by the benchmarks.
+"""
+
+# Hashing is benchmarked separately; every row reuses one precomputed hash
+HASHED_PASSWORD = "$argon2id$v=19$m=65536,t=3,p=4$benchmark$benchmark"
+
+
+def make_accounts(n: int, start: int = 0) -> list[dict]:
+    """
+    `n` alumni accounts in the form `bulk_create_alumni` takes, numbered from
+    `start`.
+    """
+    return [
+        {
+            "email": f"alumni.{i}.2020@alumni.rca.com",
+            "hashed_password": HASHED_PASSWORD,
+            "profile": {
+                "full_name": f"Alumni {i}",
+                "university_id": str(2020000000 + i),
+                "department": "CSE",
+                "series": "2020",
+                "is_employed": i % 2 == 0,
+                "current_company": "Tech Corp",
+                "work_location": "Dhaka",
+            },
+        }
+        for i in range(start, start + n)
+    ]
@@ -0,0 +1,92 @@
+"""
+Benchmark: per-request overhead of MetricsMiddleware (budget: 20 µs).
+
+A minimal ASGI app answers every request; the same requests are sent with
+and without the middleware in front of it, and the difference per request is
+the cost of recording metrics.
+
+Usage:
+    python -m benchmarks.metrics_overhead [--requests N]
+"""
+
+import asyncio
+import time
+
+import typer
+
+from src.api.middleware import MetricsMiddleware
+from src.core.metrics import RequestMetrics, render_metrics
+from src.main import app as api
+
+BUDGET_MICROSECONDS = 20
+BODY = b'{"items": [], "next_cursor": null}'
+
+
+def make_app(route):
+    # Stands in for the FastAPI app: sets the matched route like the router
+    # does, then sends a small JSON response
+    async def app(scope, receive, send):
+        scope["route"] = route
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": BODY})
+
+    return app
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def run(app, routes: list, requests: int) -> float:
+    started = time.perf_counter()
+    for i in range(requests):
+        route = routes[i % len(routes)]
+        scope = {"type": "http", "method": "GET", "path": route.path_format}
+        await app(scope, receive, send)
+    return time.perf_counter() - started
+
+
+def main(requests: int = typer.Option(200_000, help="Requests per measurement")):
+    # The real routes of the API, so labels and series count are realistic
+    routes = [r for r in api.routes if hasattr(r, "path_format")]
+    bare = make_app(routes[0])
+    metrics = RequestMetrics()
+    measured = MetricsMiddleware(bare, metrics=metrics)
+
+    # Best of a few rounds, alternating, to keep noise out
+    bare_times, measured_times = [], []
+    for _ in range(5):
+        bare_times.append(asyncio.run(run(bare, routes, requests)))
+        measured_times.append(asyncio.run(run(measured, routes, requests)))
+
+    bare_us = min(bare_times) / requests * 1e6
+    measured_us = min(measured_times) / requests * 1e6
+    overhead = measured_us - bare_us
+    typer.echo(f"{'without middleware':<22} {bare_us:>7.2f} µs/request")
+    typer.echo(f"{'with middleware':<22} {measured_us:>7.2f} µs/request")
+    typer.echo(
+        f"{'overhead':<22} {overhead:>7.2f} µs/request "
+        f"({'within' if overhead <= BUDGET_MICROSECONDS else 'OVER'} the "
+        f"{BUDGET_MICROSECONDS} µs budget)"
+    )
+
+    started = time.perf_counter()
+    text = render_metrics(metrics)
+    typer.echo(
+        f"{'render /metrics':<22} {(time.perf_counter() - started) * 1000:>7.2f} ms "
+        f"({len(text.splitlines())} lines)"
+    )
+
+
+if __name__ == "__main__":
+    typer.run(main)
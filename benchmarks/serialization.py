@@ -0,0 +1,163 @@
+"""
+Benchmark: cost per item of serializing a list response (a Page of users
+with nested profiles) through FastAPI's response_model handling, the same
+with ORJSONResponse, and through a prebuilt TypeAdapter straight to JSON
+bytes (src.api.serialization). The first variant re-validates every email
+with email-validator, as UserResponse used to.
+
+Each variant is an endpoint of a small app returning the same in-memory ORM
+objects (no database), called through the ASGI interface; the per-item cost
+is the time difference between a page of N items and an empty page.
+
+Usage:
+    python -m benchmarks.serialization [--items N] [--requests N]
+"""
+
+import asyncio
+import time
+import warnings
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import typer
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from pydantic import EmailStr
+
+from src.api.serialization import json_response
+from src.models.enums import BloodGroup, UserRole
+from src.models.user import Profile, User
+from src.schemas.adapters import USER_PAGE
+from src.schemas.pagination import Page
+from src.schemas.user import UserResponse
+
+# Deprecated by newer FastAPI versions, which no longer need it
+warnings.filterwarnings("ignore", message="ORJSONResponse is deprecated")
+
+VARIANTS = {
+    "revalidated": "response_model, EmailStr (before)",
+    "default": "response_model",
+    "orjson": "response_model + ORJSONResponse",
+    "adapter": "TypeAdapter.dump_json",
+}
+
+
+class RevalidatedUserResponse(UserResponse):
+    # UserResponse as it was: stored emails checked again on every response
+    email: EmailStr
+
+
+def make_users(n: int) -> list[User]:
+    now = datetime.now(timezone.utc)
+    users = []
+    for i in range(n):
+        user = User(
+            id=i + 1,
+            email=f"alumni.{i}@alumni.rca.com",
+            role=UserRole.ALUMNI,
+            is_active=True,
+            created_at=now,
+        )
+        user.profile = Profile(
+            id=i + 1,
+            user_id=i + 1,
+            full_name=f"Alumni {i}",
+            phone_number="+8801712345678",
+            blood_group=BloodGroup.A_POS,
+            bio="Software engineer and RCA alumni. " * 4,
+            university_id=str(2020000000 + i),
+            department="CSE",
+            series="2020",
+            is_employed=True,
+            current_company="Tech Corp",
+            designation="Software Engineer",
+            work_location="Dhaka",
+            linkedin_profile=f"https://linkedin.com/in/alumni-{i}",
+            created_at=now,
+            updated_at=now,
+        )
+        users.append(user)
+    return users
+
+
+def make_app(pages: dict[int, list[User]]) -> FastAPI:
+    app = FastAPI()
+
+    def page(n: int) -> dict[str, Any]:
+        return {"items": pages[n], "next_cursor": "cursor"}
+
+    @app.get("/revalidated/{n}", response_model=Page[RevalidatedUserResponse])
+    async def revalidated(n: int) -> Any:
+        return page(n)
+
+    @app.get("/default/{n}", response_model=Page[UserResponse])
+    async def default(n: int) -> Any:
+        return page(n)
+
+    @app.get(
+        "/orjson/{n}",
+        response_model=Page[UserResponse],
+        response_class=ORJSONResponse,
+    )
+    async def orjson(n: int) -> Any:
+        return page(n)
+
+    @app.get("/adapter/{n}", response_model=Page[UserResponse])
+    async def adapter(n: int) -> Any:
+        return json_response(USER_PAGE, page(n))
+
+    return app
+
+
+async def time_requests(client: httpx.AsyncClient, url: str, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(url)
+        response.raise_for_status()
+    return (time.perf_counter() - started) / requests
+
+
+async def run(items: int, requests: int) -> dict[str, float]:
+    app = make_app({0: [], items: make_users(items)})
+    results = {}
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        # Every variant must produce the same body
+        bodies = {(await client.get(f"/{v}/{items}")).content for v in VARIANTS}
+        assert len(bodies) == 1, "variants differ"
+
+        for variant in VARIANTS:
+            # Best of a few rounds, to keep noise out
+            empty = min(
+                [
+                    await time_requests(client, f"/{variant}/0", requests)
+                    for _ in range(3)
+                ]
+            )
+            full = min(
+                [
+                    await time_requests(client, f"/{variant}/{items}", requests)
+                    for _ in range(3)
+                ]
+            )
+            results[variant] = (full - empty) / items * 1e6
+    return results
+
+
+def main(
+    items: int = typer.Option(100, help="Users per page"),
+    requests: int = typer.Option(200, help="Requests per measurement"),
+):
+    results = asyncio.run(run(items, requests))
+    baseline = results["revalidated"]
+    typer.echo(f"{'Serialization path':<36} {'µs/item':>8} {'speedup':>8}")
+    for variant, per_item in results.items():
+        typer.echo(
+            f"{VARIANTS[variant]:<36} {per_item:>8.1f} {baseline / per_item:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
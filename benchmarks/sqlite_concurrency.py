@@ -0,0 +1,163 @@
+"""
+Benchmark: directory reads and profile edits running during a bulk import,
+with the default SQLite settings vs. the tuned engine profile (WAL, pragmas).
+
+Usage:
+    python -m benchmarks.sqlite_concurrency [--rows N] [--readers N] [--writers N]
+"""
+
+import multiprocessing
+import os
+import tempfile
+import time
+
+import typer
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import selectinload, sessionmaker
+
+from benchmarks.common import make_accounts
+from src.db.base import Base
+from src.db.database import SQLITE_PRAGMAS, create_db_engine
+from src.models.user import Profile, User
+from src.services.alumni_import import bulk_create_alumni
+
+CHUNK_SIZE = 500
+
+
+def read_directory(url: str, pragmas: dict, done, results) -> None:
+    # First page of the user list, as served by GET /users
+    engine = create_db_engine(url, sqlite_pragmas=pragmas)
+    Session = sessionmaker(bind=engine)
+    times, errors = [], 0
+    while not done.is_set():
+        started = time.perf_counter()
+        try:
+            with Session() as session:
+                session.query(User).options(selectinload(User.profile)).order_by(
+                    User.id.desc()
+                ).limit(20).all()
+        except OperationalError:
+            errors += 1
+            continue
+        times.append(time.perf_counter() - started)
+    results.put(("read", times, errors))
+
+
+def edit_profiles(url: str, pragmas: dict, done, results) -> None:
+    # Members updating their own profile, one commit each
+    engine = create_db_engine(url, sqlite_pragmas=pragmas)
+    Session = sessionmaker(bind=engine)
+    times, errors, profile_id = [], 0, 0
+    while not done.is_set():
+        profile_id = profile_id % 1_000 + 1
+        started = time.perf_counter()
+        try:
+            with Session() as session:
+                session.execute(
+                    update(Profile)
+                    .where(Profile.id == profile_id)
+                    .values(designation=f"Engineer {profile_id}")
+                )
+                session.commit()
+        except OperationalError:
+            errors += 1
+            continue
+        times.append(time.perf_counter() - started)
+        time.sleep(0.01)
+    results.put(("write", times, errors))
+
+
+def percentile(times: list[float], fraction: float) -> float:
+    if not times:
+        return 0.0
+    times = sorted(times)
+    return times[min(len(times) - 1, int(len(times) * fraction))] * 1000
+
+
+def run(pragmas: dict, rows: int, readers: int, writers: int) -> dict:
+    # Readers and writers are separate processes, like uvicorn workers
+    # sharing one database file
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        engine = create_db_engine(url, sqlite_pragmas=pragmas)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        # Something to read and edit before the import starts
+        with Session() as session:
+            bulk_create_alumni(session, make_accounts(1_000))
+            session.commit()
+        engine.dispose()
+
+        context = multiprocessing.get_context("spawn")
+        done = context.Event()
+        results = context.Queue()
+        workers = [
+            context.Process(target=read_directory, args=(url, pragmas, done, results))
+            for _ in range(readers)
+        ] + [
+            context.Process(target=edit_profiles, args=(url, pragmas, done, results))
+            for _ in range(writers)
+        ]
+        for worker in workers:
+            worker.start()
+        time.sleep(1)  # Let the workers start up
+
+        engine = create_db_engine(url, sqlite_pragmas=pragmas)
+        Session = sessionmaker(bind=engine)
+        started = time.perf_counter()
+        with Session() as session:
+            for start in range(1_000, 1_000 + rows, CHUNK_SIZE):
+                bulk_create_alumni(session, make_accounts(CHUNK_SIZE, start=start))
+                session.commit()
+        import_seconds = time.perf_counter() - started
+        engine.dispose()
+
+        done.set()
+        collected = {"read": ([], 0), "write": ([], 0)}
+        for _ in workers:
+            kind, times, errors = results.get()
+            collected[kind] = (collected[kind][0] + times, collected[kind][1] + errors)
+        for worker in workers:
+            worker.join()
+
+    (read_times, read_errors), (write_times, write_errors) = (
+        collected["read"],
+        collected["write"],
+    )
+    return {
+        "import_rows_per_second": rows / import_seconds,
+        "reads_per_second": len(read_times) / import_seconds,
+        "read_p50_ms": percentile(read_times, 0.5),
+        "read_p99_ms": percentile(read_times, 0.99),
+        "read_errors": read_errors,
+        "writes": len(write_times),
+        "write_p99_ms": percentile(write_times, 0.99),
+        "write_errors": write_errors,
+    }
+
+
+def main(
+    rows: int = typer.Option(50_000, help="Rows imported while readers run"),
+    readers: int = typer.Option(4, help="Reader processes"),
+    writers: int = typer.Option(2, help="Profile editor processes"),
+):
+    profiles = {"default": {}, "tuned": SQLITE_PRAGMAS}
+    typer.echo(
+        f"{'Profile':<8} {'import rows/s':>14} {'reads/s':>8} {'read p50':>9} "
+        f"{'read p99':>9} {'read err':>9} {'writes':>7} {'write p99':>10} "
+        f"{'write err':>10}"
+    )
+    for name, pragmas in profiles.items():
+        r = run(pragmas, rows, readers, writers)
+        typer.echo(
+            f"{name:<8} {r['import_rows_per_second']:>14,.0f} "
+            f"{r['reads_per_second']:>8,.0f} {r['read_p50_ms']:>7.1f}ms "
+            f"{r['read_p99_ms']:>7.1f}ms {r['read_errors']:>9} {r['writes']:>7} "
+            f"{r['write_p99_ms']:>8.1f}ms {r['write_errors']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    typer.run(main)
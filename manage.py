@@ -2,13 +2,23 @@
 Management commands for RCA backend.
 """
 
+import csv
+import enum
+import json
+import os
+import sys
+import time
 import typer
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from src.db.database import SessionLocal, engine
 from src.models.user import User, Profile
 from src.models.enums import UserRole
 from src.core.security import get_password_hash
 from src.db.base import Base
+from src.services.profile_facets import rebuild_profile_facets
+from src.services.refresh_tokens import delete_expired_refresh_tokens
+from src.services.seed import seed_database
 
 app = typer.Typer(help="RCA Backend Management Commands")
 
@@ -89,44 +99,221 @@ def init_db():
 
 
 @app.command()
-def list_users(
-    role: str = typer.Option(
-        None, help="Filter by role (admin/alumni/student/pending)"
+def rebuild_facets():
+    """
+    Recompute the alumni directory facet counts from the profiles table.
+    """
+    db = SessionLocal()
+
+    try:
+        values = rebuild_profile_facets(db)
+        db.commit()
+        typer.secho(
+            f"✅ Rebuilt directory facets ({values} values)", fg=typer.colors.GREEN
+        )
+    except Exception as e:
+        typer.secho(f"❌ Error: {e}", fg=typer.colors.RED)
+        db.rollback()
+        raise typer.Exit(1)
+    finally:
+        db.close()
+
+
+@app.command()
+def seed(
+    users: int = typer.Option(10_000, help="Alumni (with profiles) to generate"),
+    events: int = typer.Option(200, help="Events to generate"),
+    notices: int = typer.Option(1_000, help="Notices to generate"),
+    sessions: int = typer.Option(20, help="Committee sessions to generate"),
+    seed: int = typer.Option(0, help="Random seed; the same seed gives the same data"),
+    password: str = typer.Option("password123", help="Password of every seeded user"),
+    password_hash: str = typer.Option(
+        None, help="Precomputed hash to use instead of hashing --password"
     ),
+    batch_size: int = typer.Option(10_000, help="Rows per INSERT batch"),
 ):
     """
-    List all users in the system.
+    Fill the database with realistic synthetic data for load testing.
     """
     db = SessionLocal()
 
     try:
-        query = db.query(User)
+        # Hashed once and shared by every user
+        hashed_password = password_hash or get_password_hash(password)
+        started = time.perf_counter()
+        counts = seed_database(
+            db,
+            hashed_password=hashed_password,
+            users=users,
+            events=events,
+            notices=notices,
+            committee_sessions=sessions,
+            seed=seed,
+            batch_size=batch_size,
+        )
+        db.commit()
+        elapsed = time.perf_counter() - started
 
-        if role:
-            role_enum = UserRole[role.upper()]
-            query = query.filter(User.role == role_enum)
+        typer.secho(f"✅ Seeded in {elapsed:.1f}s", fg=typer.colors.GREEN)
+        for kind, count in counts.items():
+            typer.secho(f"{kind}: {count:,}", fg=typer.colors.CYAN)
 
-        users = query.all()
+    except Exception as e:
+        typer.secho(f"❌ Error: {e}", fg=typer.colors.RED)
+        db.rollback()
+        raise typer.Exit(1)
+    finally:
+        db.close()
 
-        if not users:
-            typer.secho("No users found.", fg=typer.colors.YELLOW)
-            return
 
+@app.command()
+def prune_refresh_tokens():
+    """
+    Delete expired refresh tokens (run it periodically, e.g. daily from cron).
+    """
+    db = SessionLocal()
+
+    try:
+        deleted = db.execute(delete_expired_refresh_tokens()).rowcount
+        db.commit()
         typer.secho(
-            f"\n{'Email':<30} {'Role':<10} {'Active':<8} {'Created'}",
-            fg=typer.colors.CYAN,
+            f"✅ Deleted {deleted} expired refresh tokens", fg=typer.colors.GREEN
+        )
+    except Exception as e:
+        db.rollback()
+        typer.secho(f"❌ Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    finally:
+        db.close()
+
+
+class OutputFormat(str, enum.Enum):
+    TABLE = "table"
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+@app.command()
+def list_users(
+    role: str = typer.Option(
+        None, help="Filter by role (admin/alumni/student/pending)"
+    ),
+    series: str = typer.Option(None, help="Filter by batch/series, e.g. 2020"),
+    department: str = typer.Option(None, help="Filter by department, e.g. CSE"),
+    limit: int = typer.Option(None, help="Stop after this many users"),
+    format: OutputFormat = typer.Option(OutputFormat.TABLE, help="Output format"),
+    batch_size: int = typer.Option(1_000, help="Rows fetched per database batch"),
+):
+    """
+    List users in the system, oldest first.
+
+    Rows are streamed from the database a batch at a time and written as they
+    arrive, so output starts immediately and memory use doesn't grow with the
+    number of users.
+    """
+    db = SessionLocal()
+    total = 0
+
+    try:
+        # Plain columns, not User entities: no identity map or ORM state per row
+        statement = (
+            select(
+                User.email,
+                User.role,
+                User.is_active,
+                User.created_at,
+                Profile.full_name,
+                Profile.series,
+                Profile.department,
+            )
+            .outerjoin(User.profile)
+            .order_by(User.id)
         )
-        typer.secho("-" * 70, fg=typer.colors.CYAN)
+        if role:
+            statement = statement.where(User.role == UserRole[role.upper()])
+        if series:
+            statement = statement.where(Profile.series == series)
+        if department:
+            statement = statement.where(Profile.department == department)
+        if limit is not None:
+            statement = statement.limit(limit)
 
-        for user in users:
-            active = "✓" if user.is_active else "✗"
-            created = user.created_at.strftime("%Y-%m-%d") if user.created_at else "N/A"
-            typer.echo(f"{user.email:<30} {user.role.value:<10} {active:<8} {created}")
+        result = db.execute(statement.execution_options(yield_per=batch_size))
+        out = sys.stdout
 
-        typer.secho(f"\nTotal: {len(users)} users\n", fg=typer.colors.GREEN)
+        if format == OutputFormat.CSV:
+            writer = csv.writer(out)
+            writer.writerow(
+                [
+                    "email",
+                    "full_name",
+                    "role",
+                    "is_active",
+                    "series",
+                    "department",
+                    "created_at",
+                ]
+            )
+
+        for rows in result.partitions():
+            if format == OutputFormat.TABLE and not total:
+                typer.secho(
+                    f"\n{'Email':<30} {'Role':<10} {'Active':<8} {'Series':<8} "
+                    f"{'Department':<12} {'Created'}",
+                    fg=typer.colors.CYAN,
+                )
+                typer.secho("-" * 82, fg=typer.colors.CYAN)
+            for row in rows:
+                created = row.created_at.isoformat() if row.created_at else None
+                if format == OutputFormat.TABLE:
+                    active = "✓" if row.is_active else "✗"
+                    out.write(
+                        f"{row.email:<30} {row.role.value:<10} {active:<8} "
+                        f"{row.series or '':<8} {row.department or '':<12} "
+                        f"{created[:10] if created else 'N/A'}\n"
+                    )
+                elif format == OutputFormat.CSV:
+                    writer.writerow(
+                        [
+                            row.email,
+                            row.full_name or "",
+                            row.role.value,
+                            "true" if row.is_active else "false",
+                            row.series or "",
+                            row.department or "",
+                            created or "",
+                        ]
+                    )
+                else:
+                    out.write(
+                        json.dumps(
+                            {
+                                "email": row.email,
+                                "full_name": row.full_name,
+                                "role": row.role.value,
+                                "is_active": row.is_active,
+                                "series": row.series,
+                                "department": row.department,
+                                "created_at": created,
+                            }
+                        )
+                        + "\n"
+                    )
+            total += len(rows)
+            # One write to the terminal or pipe per batch, not per row
+            out.flush()
 
+        if format == OutputFormat.TABLE:
+            if total:
+                typer.secho(f"\nTotal: {total} users\n", fg=typer.colors.GREEN)
+            else:
+                typer.secho("No users found.", fg=typer.colors.YELLOW)
+
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into `head`); stop quietly
+        sys.stdout = open(os.devnull, "w")
     except Exception as e:
-        typer.secho(f"❌ Error: {e}", fg=typer.colors.RED)
+        typer.secho(f"❌ Error: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(1)
     finally:
         db.close()
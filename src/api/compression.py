@@ -0,0 +1,95 @@
+"""
+Response compression: Accept-Encoding negotiation and gzip / brotli
+compressors, shared by CompressionMiddleware and the response cache (which
+keeps the compressed variants of its bodies).
+
+Brotli is used when the optional `brotli` package is installed (the `brotli`
+extra: `uv sync --extra brotli`); gzip always is.
+"""
+
+import zlib
+from src.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Supported encodings, preferred first when the client weighs them equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+)
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """
+    The supported encoding the client ranks highest in its Accept-Encoding
+    header, or None for an uncompressed (identity) response.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class Compressor:
+    """
+    Incremental compressor for a streamed body. Every chunk is flushed, so
+    the client can decode what it has received so far.
+    """
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+        else:
+            # wbits=31: deflate with a gzip header and trailer
+            self._zlib = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    A complete body compressed with `encoding`.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
@@ -1,11 +1,14 @@
-from typing import Annotated, Generator
+from dataclasses import dataclass
+from typing import Annotated, AsyncGenerator
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.database import SessionLocal
+from src.db.database import AsyncSessionLocal
+from src.core.cache import TTLCache
 from src.core.config import settings
 from src.models.user import User
 from src.models.enums import UserRole
@@ -15,49 +18,136 @@ from src.schemas.auth import TokenData
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Creates a new database session for each request and closes it afterwards.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 # Type shortcuts
-SessionDep = Annotated[Session, Depends(get_db)]
+SessionDep = Annotated[AsyncSession, Depends(get_db)]
 TokenDep = Annotated[str, Depends(oauth2_scheme)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> User:
+@dataclass(frozen=True)
+class Principal:
+    """
+    The authenticated user's fields needed for authorization checks.
+    """
+
+    id: int
+    email: str
+    role: UserRole
+    is_active: bool
+
+
+# Principals by token subject (email), so most requests skip the user lookup.
+# Only read for legacy access tokens, which carry no uid/role claims; tokens
+# issued now are self-contained and never touch it. Legacy tokens can't be
+# refreshed (their refresh tokens have no jti), so once every deployment has
+# issued self-contained tokens for ACCESS_TOKEN_EXPIRE_MINUTES none is left:
+# remove this cache, its invalidation and the legacy branch of
+# get_current_user then.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+# Current token version per subject (email), as stored in users.token_version.
+# Tokens with an older version were revoked. Re-read from the database once
+# an entry expires, so a revocation made by another worker process is seen
+# within PRINCIPAL_CACHE_TTL_SECONDS; an evicted entry only costs a lookup.
+token_versions = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_principal(email: str, token_version: int | None = None) -> None:
+    """
+    Drop a cached principal after its user was deleted or had role/active
+    status changed. With `token_version`, self-contained access tokens older
+    than that version are rejected from now on.
+    """
+    principal_cache.pop(email)
+    if token_version is not None:
+        # Takes effect in this process at once, in others when their entry
+        # expires
+        token_versions.set(email, token_version)
+
+
+async def current_token_version(session: AsyncSession, email: str) -> int | None:
+    """
+    The user's token version (None if the user no longer exists).
+    """
+    version = token_versions.get(email)
+    if version is None:
+        version = await session.scalar(
+            select(User.token_version).where(User.email == email)
+        )
+        if version is not None:
+            token_versions.set(email, version)
+    return version
+
+
+async def get_current_user(session: SessionDep, token: TokenDep) -> Principal:
     """
     Validates the JWT token and returns the current user.
     """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Could not validate credentials",
+    )
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         token_data = TokenData(**payload)
     except (JWTError, ValidationError):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Could not validate credentials",
+        raise credentials_exception
+
+    if token_data.type == "refresh":
+        raise credentials_exception
+    if token_data.ver is not None:
+        version = await current_token_version(session, token_data.sub)
+        if version is None or token_data.ver < version:
+            raise credentials_exception
+
+    # Self-contained tokens carry everything authorization needs (no DB read);
+    # they are only issued to active users
+    if token_data.uid is not None and token_data.role is not None:
+        return Principal(
+            id=token_data.uid,
+            email=token_data.sub,
+            role=token_data.role,
+            is_active=True,
+        )
+
+    # Older tokens only carry the subject (see principal_cache for when this
+    # path can go)
+    user = principal_cache.get(token_data.sub)
+    if user is None:
+        db_user = await session.scalar(select(User).where(User.email == token_data.sub))
+        if not db_user:
+            raise HTTPException(status_code=404, detail="User not found")
+        user = Principal(
+            id=db_user.id,
+            email=db_user.email,
+            role=db_user.role,
+            is_active=db_user.is_active,
         )
+        principal_cache.set(token_data.sub, user)
 
-    user = session.query(User).filter(User.email == token_data.sub).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return user
 
 
-CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUser = Annotated[Principal, Depends(get_current_user)]
 
 
-def get_current_active_superuser(current_user: CurrentUser) -> User:
+async def get_current_active_superuser(current_user: CurrentUser) -> Principal:
     """
     Dependency to restrict access to ADMINS only.
     """
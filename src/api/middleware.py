@@ -0,0 +1,220 @@
+"""
+ASGI middleware. These are plain ASGI callables rather than
+BaseHTTPMiddleware subclasses, which would add a task and a memory stream to
+every request.
+"""
+
+import logging
+import time
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.api.compression import (
+    Compressor,
+    compress,
+    is_compressible,
+    negotiate_encoding,
+)
+from src.core import settings
+from src.core.metrics import RequestMetrics, request_metrics
+from src.db.instrumentation import QueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+# Route label for requests that matched no route (e.g. 404s), so random
+# paths don't each become a new time series
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the route that handled the request, e.g.
+    /api/v1/content/events/{event_id}.
+    """
+    # The router stores the matched route in the scope
+    template = getattr(scope.get("route"), "path_format", None)
+    if template is None:
+        return UNMATCHED_ROUTE
+    # Depending on the FastAPI version, routes of an included router carry
+    # the full path or only their own part of it; take the (static) prefix
+    # from the request path in the latter case
+    segments = scope["path"].split("/")
+    prefix = segments[: len(segments) - template.count("/")]
+    return "/".join(prefix) + template
+
+
+class MetricsMiddleware:
+    """
+    Records every HTTP request in `RequestMetrics`, labelled with the route
+    template (e.g. /api/v1/content/events/{event_id}), not the raw path.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics | None = None):
+        self.app = app
+        self.metrics = metrics or request_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.started(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.metrics.finished(
+                method,
+                route_template(scope),
+                status,
+                time.perf_counter() - started,
+                size,
+            )
+
+
+class ServerTimingMiddleware:
+    """
+    Collects the queries each request runs and reports them in a
+    Server-Timing header: `db` (query time and count) and `app` (time until
+    the response started). SELECTs repeated N_PLUS_ONE_THRESHOLD times or
+    more are logged as likely N+1 queries.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                app_ms = (time.perf_counter() - started) * 1000
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+                    f"app;dur={app_ms:.1f}",
+                )
+            await send(message)
+
+        token = current_query_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            if settings.N_PLUS_ONE_THRESHOLD:
+                repeated = stats.repeated_selects(settings.N_PLUS_ONE_THRESHOLD)
+                for statement, count in repeated:
+                    logger.warning(
+                        "Likely N+1 query in %s %s (run %d times): %s",
+                        scope["method"],
+                        route_template(scope),
+                        count,
+                        statement,
+                    )
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the encoding negotiated from Accept-Encoding
+    (see src.api.compression). Complete bodies smaller than `minimum_size`
+    are sent as they are; streamed bodies (StreamingResponse) are compressed
+    chunk by chunk as they go out. Responses the endpoint already negotiated
+    (with a Content-Encoding, or varying on Accept-Encoding), like those of
+    the response cache, pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = (
+            settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        # Response start held back until the first body chunk shows whether
+        # the body is complete, and how big it is
+        start: Message | None = None
+        compressor: Compressor | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] in (204, 304)
+                    or not is_compressible(headers.get("content-type", ""))
+                    # Already compressed, or negotiated by the endpoint
+                    or "content-encoding" in headers
+                    or "accept-encoding" in headers.get("vary", "").lower()
+                ):
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                held, start = start, None
+                if not more_body and len(body) < self.minimum_size:
+                    await send(held)
+                    await send(message)
+                    return
+
+                headers = MutableHeaders(scope=held)
+                headers.add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    await send(held)
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                if more_body:
+                    compressor = Compressor(encoding)
+                    del headers["Content-Length"]
+                    body = compressor.compress(body)
+                else:
+                    body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                await send(held)
+                await send(
+                    {"type": "http.response.body", "body": body, "more_body": more_body}
+                )
+                return
+
+            if compressor is not None:
+                body = compressor.compress(body) if body else b""
+                if not more_body:
+                    body += compressor.finish()
+                message = {
+                    "type": "http.response.body",
+                    "body": body,
+                    "more_body": more_body,
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
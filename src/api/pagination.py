@@ -0,0 +1,107 @@
+import base64
+import enum
+import json
+from datetime import date, datetime
+from typing import Any
+from fastapi import HTTPException
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def encode_cursor(values: list[Any]) -> str:
+    raw = json.dumps(
+        [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: list[InstrumentedAttribute]) -> list[Any]:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(raw, list) or len(raw) != len(columns):
+            raise ValueError
+        values = []
+        for column, value in zip(columns, raw):
+            python_type = column.type.python_type
+            if value is not None and python_type in (date, datetime):
+                value = python_type.fromisoformat(value)
+            elif value is not None and issubclass(python_type, enum.Enum):
+                value = python_type(value)
+            elif value is not None and not isinstance(value, python_type):
+                raise ValueError
+            values.append(value)
+        return values
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def paginate(
+    session: AsyncSession,
+    statement: Select,
+    *,
+    id_column: InstrumentedAttribute,
+    sort_column: InstrumentedAttribute | None = None,
+    cursor: str | None = None,
+    limit: int = 100,
+    descending: bool = True,
+) -> dict[str, Any]:
+    """
+    Keyset (cursor) pagination: order by `sort_column` with `id_column` as the
+    tiebreaker and continue strictly after the row encoded in `cursor`.
+    Unlike OFFSET, the database seeks straight to the next page, so every page
+    costs the same. NULL sort values come last.
+    """
+    limit = max(1, limit)
+
+    def before(column, value):
+        return column < value if descending else column > value
+
+    async def fetch(statement: Select, n: int) -> list:
+        return list(await session.scalars(statement.order_by(*order).limit(n)))
+
+    if sort_column is None:
+        columns = [id_column]
+        order = [id_column.desc() if descending else id_column.asc()]
+    else:
+        columns = [sort_column, id_column]
+        order = [
+            (sort_column.desc() if descending else sort_column.asc()).nulls_last(),
+            id_column.desc() if descending else id_column.asc(),
+        ]
+
+    # Fetch one extra row to know whether there is a next page
+    if not cursor:
+        rows = await fetch(statement, limit + 1)
+    else:
+        values = decode_cursor(cursor, columns)
+        if sort_column is None:
+            rows = await fetch(statement.where(before(id_column, values[0])), limit + 1)
+        elif values[0] is None:
+            rows = await fetch(
+                statement.where(sort_column.is_(None), before(id_column, values[1])),
+                limit + 1,
+            )
+        else:
+            # A row-value comparison lets the database seek on the
+            # (sort_column, id) index; NULL sort values never match it, so
+            # they are fetched separately once the non-NULL rows run out
+            rows = await fetch(
+                statement.where(
+                    before(tuple_(sort_column, id_column), tuple_(*values))
+                ),
+                limit + 1,
+            )
+            if len(rows) <= limit:
+                rows += await fetch(
+                    statement.where(sort_column.is_(None)), limit + 1 - len(rows)
+                )
+
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in columns])
+
+    return {"items": items, "next_cursor": next_cursor}
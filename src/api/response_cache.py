@@ -0,0 +1,106 @@
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+from fastapi import Request, Response
+from src.api.compression import compress, negotiate_encoding
+from src.api.serialization import dump_json
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.schemas.adapters import adapter_for
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    # Content-Encoding -> compressed body, filled in as clients ask for them
+    compressed: dict[str, bytes] = field(default_factory=dict, compare=False)
+
+    def encoded(self, encoding: str) -> bytes:
+        body = self.compressed.get(encoding)
+        if body is None:
+            body = self.compressed[encoding] = compress(self.body, encoding)
+        return body
+
+
+_cache = TTLCache(
+    maxsize=settings.RESPONSE_CACHE_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
+
+# Bumped on every write to a namespace, which makes its old entries unreachable
+_generations: dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags
+
+
+def invalidate(namespace: str) -> None:
+    """
+    Drop every cached response of a namespace; call after writes to it.
+    """
+    with _generations_lock:
+        _generations[namespace] = _generations.get(namespace, 0) + 1
+
+
+def clear() -> None:
+    """
+    Drop every cached response.
+    """
+    _cache.clear()
+
+
+async def cached_json_response(
+    request: Request, namespace: str, model: Any, load: Callable[[], Awaitable[Any]]
+) -> Response:
+    """
+    Serve a read endpoint from the response cache.
+
+    On a miss `load()` is awaited and its result serialized with `model` (the
+    endpoint's response model). Responses carry a strong ETag, and a matching
+    If-None-Match is answered with 304 and no body. Bodies are compressed
+    here, once per entry and encoding, so CompressionMiddleware doesn't
+    compress them again on every hit.
+    """
+    key = (
+        namespace,
+        _generations.get(namespace, 0),
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+    )
+    entry = _cache.get(key)
+    if entry is None:
+        body = dump_json(adapter_for(model), await load())
+        entry = CachedResponse(
+            body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        )
+        _cache.set(key, entry)
+
+    encoding = None
+    # Clients may keep the body but must revalidate it with the ETag
+    headers = {"Cache-Control": "no-cache"}
+    if (
+        settings.COMPRESSION_ENABLED
+        and len(entry.body) >= settings.COMPRESSION_MIN_SIZE
+    ):
+        encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+        headers["Vary"] = "Accept-Encoding"
+    # Each encoding is a different representation, with an ETag of its own
+    etag = entry.etag if encoding is None else f'{entry.etag[:-1]}-{encoding}"'
+    headers["ETag"] = etag
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        return Response(entry.body, media_type="application/json", headers=headers)
+    headers["Content-Encoding"] = encoding
+    return Response(
+        entry.encoded(encoding), media_type="application/json", headers=headers
+    )
@@ -0,0 +1,21 @@
+from typing import Any
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def dump_json(adapter: TypeAdapter, data: Any) -> bytes:
+    """
+    Validate `data` (ORM objects or dicts of them) with `adapter` and
+    serialize it straight to JSON bytes.
+    """
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def json_response(adapter: TypeAdapter, data: Any) -> Response:
+    """
+    Response for an endpoint returning `data`, bypassing FastAPI's
+    response_model handling (which validates, converts to plain Python
+    objects, then encodes them). Keep `response_model` on the route for the
+    OpenAPI schema.
+    """
+    return Response(dump_json(adapter, data), media_type="application/json")
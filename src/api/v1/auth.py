@@ -1,48 +1,157 @@
-from datetime import timedelta
+import secrets
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
+from jose import JWTError, jwt
+from pydantic import ValidationError
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
+from starlette.concurrency import run_in_threadpool
 from src.api import deps
 from src.core import security, settings
 from src.models.enums import UserRole
-from src.models.user import Profile, User
-from src.schemas.auth import Token
+from src.models.user import Profile, RefreshToken, User
+from src.schemas.auth import RefreshTokenRequest, Token, TokenData
 from src.schemas.user import AlumniRegister, StudentRegister, UserResponse
+from src.services.refresh_tokens import delete_expired_refresh_tokens
 
 router = APIRouter()
 
 
+def issue_tokens(session: deps.SessionDep, user: User) -> dict[str, str]:
+    """
+    Create an access token carrying the user's id, role and token version,
+    plus a single-use refresh token recorded in the database.
+    The caller commits the session.
+    """
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = security.create_access_token(
+        user.email,
+        expires_delta=access_token_expires,
+        claims={"uid": user.id, "role": user.role.value, "ver": user.token_version},
+    )
+
+    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    jti = secrets.token_urlsafe(16)
+    session.add(
+        RefreshToken(
+            jti=jti,
+            user_id=user.id,
+            expires_at=datetime.now(timezone.utc) + refresh_token_expires,
+        )
+    )
+    refresh_token = security.create_refresh_token(
+        user.email,
+        jti=jti,
+        version=user.token_version,
+        expires_delta=refresh_token_expires,
+    )
+
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    }
+
+
 @router.post("/login", response_model=Token)
-def login_access_token(
+async def login_access_token(
     session: deps.SessionDep, form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests.
     """
     # 1. Check if user exists
-    user = session.query(User).filter(User.email == form_data.username).first()
+    user = await session.scalar(select(User).where(User.email == form_data.username))
+    if not user:
+        raise HTTPException(status_code=400, detail="Incorrect email or password")
 
-    # 2. Check password
-    if not user or not security.verify_password(
+    # 2. Check password (on the dedicated, size-limited login executor)
+    valid, new_hash = await security.verify_and_update_password(
         form_data.password, user.hashed_password
-    ):
+    )
+    if not valid:
         raise HTTPException(status_code=400, detail="Incorrect email or password")
 
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    # 3. Generate Token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return {
-        "access_token": security.create_access_token(
-            user.email, expires_delta=access_token_expires
-        ),
-        "token_type": "bearer",
-    }
+    # 3. Generate Tokens (and drop the user's expired ones)
+    await session.execute(delete_expired_refresh_tokens(user.id))
+    tokens = issue_tokens(session, user)
+
+    # Upgrade hashes with outdated parameters or legacy schemes transparently
+    if new_hash:
+        user.hashed_password = new_hash
+
+    await session.commit()
+    return tokens
+
+
+@router.post("/refresh", response_model=Token)
+async def refresh_access_token(
+    session: deps.SessionDep,
+    token_in: RefreshTokenRequest,
+) -> Any:
+    """
+    Exchange a refresh token for a new access and refresh token (rotation).
+    """
+    credentials_exception = HTTPException(
+        status_code=403, detail="Could not validate credentials"
+    )
+    try:
+        payload = jwt.decode(
+            token_in.refresh_token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )
+        token_data = TokenData(**payload)
+    except (JWTError, ValidationError):
+        raise credentials_exception
+
+    if token_data.type != "refresh" or not token_data.jti:
+        raise credentials_exception
+
+    stored = await session.scalar(
+        select(RefreshToken).where(RefreshToken.jti == token_data.jti)
+    )
+    if not stored:
+        raise credentials_exception
+    user = await session.get(User, stored.user_id)
+    if not user or token_data.ver != user.token_version:
+        raise credentials_exception
+
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    # Spend the token with one conditional UPDATE: of concurrent requests
+    # presenting the same token, only one can mark it used
+    spent = await session.execute(
+        update(RefreshToken)
+        .where(RefreshToken.jti == token_data.jti, RefreshToken.used_at.is_(None))
+        .values(used_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+    if spent.rowcount == 0:
+        # A spent token was presented again: assume it leaked, revoke all tokens
+        await session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(token_version=User.token_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+        deps.invalidate_principal(user.email, token_version=user.token_version + 1)
+        raise credentials_exception
+
+    tokens = issue_tokens(session, user)
+    await session.commit()
+    return tokens
 
 
 @router.post("/register/student", response_model=UserResponse)
-def register_student(
+async def register_student(
     *,
     session: deps.SessionDep,
     user_in: StudentRegister,
@@ -51,44 +160,45 @@ def register_student(
     Register a new STUDENT.
     """
     # 1. Check if email exists
-    if session.query(User).filter(User.email == user_in.email).first():
+    if await session.scalar(select(User.id).where(User.email == user_in.email)):
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists.",
         )
 
-    # 2. Create User (Force Role = STUDENT)
+    # 2. Create User (Force Role = STUDENT) with the Student Data profile
     db_user = User(
         email=user_in.email,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await run_in_threadpool(
+            security.get_password_hash, user_in.password
+        ),
         role=UserRole.STUDENT,
         is_active=True,
+        profile=Profile(
+            full_name=user_in.full_name,
+            phone_number=user_in.phone_number,
+            blood_group=user_in.blood_group,
+            university_id=user_in.university_id,
+            department=user_in.department,
+            series=user_in.series,
+        ),
     )
 
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
-
-    # 3. Create Profile with Student Data
-    db_profile = Profile(
-        user_id=db_user.id,
-        full_name=user_in.full_name,
-        phone_number=user_in.phone_number,
-        blood_group=user_in.blood_group,
-        university_id=user_in.university_id,
-        department=user_in.department,
-        series=user_in.series,
+    await session.commit()
+
+    # Reload user and profile together for the response (with the stored
+    # column values rather than the Python-side defaults)
+    return await session.scalar(
+        select(User)
+        .options(selectinload(User.profile))
+        .where(User.id == db_user.id)
+        .execution_options(populate_existing=True)
     )
 
-    session.add(db_profile)
-    session.commit()
-    session.refresh(db_profile)
-
-    return db_user
-
 
 @router.post("/register/alumni", response_model=UserResponse)
-def register_alumni(
+async def register_alumni(
     *,
     session: deps.SessionDep,
     user_in: AlumniRegister,
@@ -96,7 +206,7 @@ def register_alumni(
     """
     Register a new ALUMNI.
     """
-    if session.query(User).filter(User.email == user_in.email).first():
+    if await session.scalar(select(User.id).where(User.email == user_in.email)):
         raise HTTPException(status_code=400, detail="Email already registered.")
 
     # 1. Create User (Force Role = PENDING or ALUMNI)
@@ -104,31 +214,34 @@ def register_alumni(
     # But for now, let's set them as ALUMNI.
     db_user = User(
         email=user_in.email,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await run_in_threadpool(
+            security.get_password_hash, user_in.password
+        ),
         role=UserRole.ALUMNI,
         is_active=True,
+        # 2. Create Profile with Alumni Data
+        profile=Profile(
+            full_name=user_in.full_name,
+            phone_number=user_in.phone_number,
+            blood_group=user_in.blood_group,
+            university_id="",  # Alumni may not have current university ID
+            department=user_in.department or "",  # Optional for alumni
+            series=user_in.series,  # Batch
+            is_employed=user_in.is_employed,
+            current_company=user_in.current_company,
+            designation=user_in.designation,
+            work_location=user_in.work_location,
+            linkedin_profile=user_in.linkedin_profile,
+        ),
     )
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
-
-    # 2. Create Profile with Alumni Data
-    db_profile = Profile(
-        user_id=db_user.id,
-        full_name=user_in.full_name,
-        phone_number=user_in.phone_number,
-        blood_group=user_in.blood_group,
-        university_id="",  # Alumni may not have current university ID
-        department=user_in.department or "",  # Optional for alumni
-        series=user_in.series,  # Batch
-        is_employed=user_in.is_employed,
-        current_company=user_in.current_company,
-        designation=user_in.designation,
-        work_location=user_in.work_location,
-        linkedin_profile=user_in.linkedin_profile,
+    await session.commit()
+
+    # Reload user and profile together for the response (with the stored
+    # column values rather than the Python-side defaults)
+    return await session.scalar(
+        select(User)
+        .options(selectinload(User.profile))
+        .where(User.id == db_user.id)
+        .execution_options(populate_existing=True)
     )
-    session.add(db_profile)
-    session.commit()
-    session.refresh(db_profile)
-
-    return db_user
@@ -1,8 +1,11 @@
-from typing import Any, List
-from fastapi import APIRouter, HTTPException
+from typing import Any
+from fastapi import APIRouter, HTTPException, Request
+from sqlalchemy import select, update
 from sqlalchemy.orm import joinedload
 
-from src.api import deps
+from src.api import deps, response_cache
+from src.api.pagination import paginate
+from src.api.serialization import json_response
 from src.models.committee import CommitteeSession, CommitteeMember
 from src.schemas.committee import (
     CommitteeSessionCreate,
@@ -11,30 +14,44 @@ from src.schemas.committee import (
     CommitteeMemberCreate,
     CommitteeMemberResponse,
 )
+from src.schemas.adapters import COMMITTEE_SESSION_PAGE
+from src.schemas.pagination import Page
 
 router = APIRouter()
 
 
 @router.get("/active", response_model=CommitteeSessionDetail)
-def get_active_committee(
+async def get_active_committee(
+    request: Request,
     session: deps.SessionDep,
 ) -> Any:
     """
     Get the currently active committee and its members.
     """
-    committee = (
-        session.query(CommitteeSession)
-        .filter(CommitteeSession.is_active)
-        .options(joinedload(CommitteeSession.members))
-        .first()
+
+    async def load() -> CommitteeSession:
+        committee = (
+            (
+                await session.scalars(
+                    select(CommitteeSession)
+                    .where(CommitteeSession.is_active)
+                    .options(joinedload(CommitteeSession.members))
+                )
+            )
+            .unique()
+            .first()
+        )
+        if not committee:
+            raise HTTPException(status_code=404, detail="No active committee found")
+        return committee
+
+    return await response_cache.cached_json_response(
+        request, "committees", CommitteeSessionDetail, load
     )
-    if not committee:
-        raise HTTPException(status_code=404, detail="No active committee found")
-    return committee
 
 
 @router.post("/sessions", response_model=CommitteeSessionResponse)
-def create_committee_session(
+async def create_committee_session(
     *,
     session: deps.SessionDep,
     committee_in: CommitteeSessionCreate,
@@ -46,19 +63,21 @@ def create_committee_session(
     """
     # If setting to active, deactivate others first
     if committee_in.is_active:
-        session.query(CommitteeSession).update(
-            {CommitteeSession.is_active: False}, synchronize_session=False
+        await session.execute(
+            update(CommitteeSession).values(is_active=False),
+            execution_options={"synchronize_session": False},
         )
 
     db_obj = CommitteeSession(**committee_in.model_dump())
     session.add(db_obj)
-    session.commit()
-    session.refresh(db_obj)
+    await session.commit()
+    await session.refresh(db_obj)
+    response_cache.invalidate("committees")
     return db_obj
 
 
 @router.post("/members", response_model=CommitteeMemberResponse)
-def add_committee_member(
+async def add_committee_member(
     *,
     session: deps.SessionDep,
     member_in: CommitteeMemberCreate,
@@ -69,24 +88,27 @@ def add_committee_member(
     """
     db_obj = CommitteeMember(**member_in.model_dump())
     session.add(db_obj)
-    session.commit()
-    session.refresh(db_obj)
+    await session.commit()
+    await session.refresh(db_obj)
+    response_cache.invalidate("committees")
     return db_obj
 
 
-@router.get("/history", response_model=List[CommitteeSessionResponse])
-def get_committee_history(
+@router.get("/history", response_model=Page[CommitteeSessionResponse])
+async def get_committee_history(
     session: deps.SessionDep,
-    skip: int = 0,
+    cursor: str | None = None,
     limit: int = 100,
 ) -> Any:
     """
-    Get list of past committees.
+    Get list of past committees, most recent first.
     """
-    return (
-        session.query(CommitteeSession)
-        .order_by(CommitteeSession.start_date.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    page = await paginate(
+        session,
+        select(CommitteeSession),
+        sort_column=CommitteeSession.start_date,
+        id_column=CommitteeSession.id,
+        cursor=cursor,
+        limit=limit,
     )
+    return json_response(COMMITTEE_SESSION_PAGE, page)
@@ -1,30 +1,40 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
 
-from src.api import deps
+from src.api import deps, response_cache
+from src.api.pagination import paginate
 from src.models.content import Event, Notice
 from src.models.enums import UserRole
 from src.schemas.content import EventCreate, EventResponse, NoticeCreate, NoticeResponse
+from src.schemas.pagination import Page
 
 router = APIRouter()
 
 
 # --- Events ---
-@router.get("/events", response_model=List[EventResponse])
-def read_events(
+@router.get("/events", response_model=Page[EventResponse])
+async def read_events(
+    request: Request,
     session: deps.SessionDep,
-    skip: int = 0,
+    cursor: str | None = None,
     limit: int = 100,
 ) -> Any:
     """
-    Get all events.
+    Get all events, latest first.
     """
-    return (
-        session.query(Event)
-        .order_by(Event.event_date.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    return await response_cache.cached_json_response(
+        request,
+        "events",
+        Page[EventResponse],
+        lambda: paginate(
+            session,
+            select(Event),
+            sort_column=Event.event_date,
+            id_column=Event.id,
+            cursor=cursor,
+            limit=limit,
+        ),
     )
 
 
@@ -33,7 +43,7 @@ def read_events(
     response_model=EventResponse,
     dependencies=[Depends(deps.get_current_active_superuser)],
 )
-def create_event(
+async def create_event(
     *,
     session: deps.SessionDep,
     event_in: EventCreate,
@@ -44,44 +54,61 @@ def create_event(
     """
     db_obj = Event(**event_in.model_dump())
     session.add(db_obj)
-    session.commit()
-    session.refresh(db_obj)
+    await session.commit()
+    await session.refresh(db_obj)
+    response_cache.invalidate("events")
     return db_obj
 
 
 @router.get("/events/{event_id}", response_model=EventResponse)
-def read_event(
+async def read_event(
+    request: Request,
     event_id: int,
     session: deps.SessionDep,
 ) -> Any:
     """
     Get event by ID.
     """
-    return session.query(Event).filter(Event.id == event_id).first()
+
+    async def load() -> Event:
+        event = await session.get(Event, event_id)
+        if not event:
+            raise HTTPException(status_code=404, detail="Event not found")
+        return event
+
+    return await response_cache.cached_json_response(
+        request, "events", EventResponse, load
+    )
 
 
 # --- Notices ---
-@router.get("/notices", response_model=List[NoticeResponse])
-def read_notices(
+@router.get("/notices", response_model=Page[NoticeResponse])
+async def read_notices(
+    request: Request,
     session: deps.SessionDep,
-    skip: int = 0,
+    cursor: str | None = None,
     limit: int = 100,
 ) -> Any:
     """
-    Get public notices.
+    Get public notices, newest first.
     """
-    return (
-        session.query(Notice)
-        .filter(Notice.is_published)
-        .order_by(Notice.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    return await response_cache.cached_json_response(
+        request,
+        "notices",
+        Page[NoticeResponse],
+        lambda: paginate(
+            session,
+            select(Notice).where(Notice.is_published),
+            sort_column=Notice.created_at,
+            id_column=Notice.id,
+            cursor=cursor,
+            limit=limit,
+        ),
     )
 
 
 @router.post("/notices", response_model=NoticeResponse)
-def create_notice(
+async def create_notice(
     *,
     session: deps.SessionDep,
     notice_in: NoticeCreate,
@@ -92,13 +119,14 @@ def create_notice(
     """
     db_obj = Notice(**notice_in.model_dump(), author_id=current_user.id)
     session.add(db_obj)
-    session.commit()
-    session.refresh(db_obj)
+    await session.commit()
+    await session.refresh(db_obj)
+    response_cache.invalidate("notices")
     return db_obj
 
 
 @router.put("/notices/{notice_id}", response_model=NoticeResponse)
-def update_notice(
+async def update_notice(
     *,
     session: deps.SessionDep,
     notice_id: int,
@@ -108,7 +136,7 @@ def update_notice(
     """
     Update a notice.
     """
-    db_obj = session.query(Notice).filter(Notice.id == notice_id).first()
+    db_obj = await session.get(Notice, notice_id)
     if current_user.id != db_obj.author_id or current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=403, detail="Not authorized to update this notice."
@@ -116,6 +144,7 @@ def update_notice(
     for field, value in notice_in.model_dump().items():
         setattr(db_obj, field, value)
     session.add(db_obj)
-    session.commit()
-    session.refresh(db_obj)
+    await session.commit()
+    await session.refresh(db_obj)
+    response_cache.invalidate("notices")
     return db_obj
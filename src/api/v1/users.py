@@ -1,18 +1,43 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from io import BytesIO
 import csv
-import secrets
-import string
-from src.api import deps
-from src.core import security
-from src.models.user import User, Profile
-from src.models.enums import UserRole, BloodGroup
+import io
+import re
+from typing import Any, List, Literal
+from fastapi import APIRouter, Depends, HTTPException, Response, UploadFile, File
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy import delete, exists, or_, select, text, update
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from src.api import deps, response_cache
+from src.api.pagination import paginate
+from src.api.serialization import json_response
+from src.core import security, settings
+from src.models.committee import CommitteeMember
+from src.models.content import Notice
+from src.models.enums import BloodGroup, UploadJobStatus
+from src.models.user import PROFILE_SEARCH_COLUMNS, User, Profile, RefreshToken
+from src.models.upload_job import (
+    BulkUploadCredentials,
+    BulkUploadJob,
+    BulkUploadJobError,
+)
 from src.schemas.user import (
     UserCreate,
     UserResponse,
     ProfileCreate,
     ProfileResponse,
+    ProfileFacetsResponse,
+)
+from src.schemas.adapters import USER_LIST, USER_PAGE
+from src.schemas.pagination import Page
+from src.schemas.upload_job import BulkUploadJobResponse, BulkUploadRowError
+from src.services.alumni_export import stream_csv, stream_xlsx
+from src.services.alumni_import import AlumniImporter, iter_upload_rows
+from src.services.donors import find_donors
+from src.services.profile_facets import read_profile_facets
+from src.services.upload_jobs import (
+    save_upload,
+    start_upload_job,
+    take_upload_credentials,
 )
 
 router = APIRouter()
@@ -23,7 +48,7 @@ router = APIRouter()
     response_model=UserResponse,
     dependencies=[Depends(deps.get_current_active_superuser)],
 )
-def create_user(
+async def create_user(
     *,
     session: deps.SessionDep,
     user_in: UserCreate,
@@ -31,51 +56,57 @@ def create_user(
     """
     Create new user (Open Registration).
     """
-    user = session.query(User).filter(User.email == user_in.email).first()
+    user = await session.scalar(select(User.id).where(User.email == user_in.email))
     if user:
         raise HTTPException(
             status_code=400,
             detail="The user with this email already exists in the system.",
         )
 
-    # Create User
+    # Create User with an empty Profile (required fields filled in later)
     db_user = User(
         email=user_in.email,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await run_in_threadpool(
+            security.get_password_hash, user_in.password
+        ),
         role=user_in.role,
         is_active=user_in.is_active,
+        profile=Profile(
+            full_name=user_in.email.split("@")[0],
+            university_id="",  # Will be updated by user later
+            department="",  # Will be updated by user later
+            series="",  # Will be updated by user later
+        ),
     )
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
-
-    # Create Empty Profile for the user automatically with required fields
-    db_profile = Profile(
-        user_id=db_user.id,
-        full_name=user_in.email.split("@")[0],
-        university_id="",  # Will be updated by user later
-        department="",  # Will be updated by user later
-        series="",  # Will be updated by user later
+    await session.commit()
+
+    # Reload user and profile together for the response (with the stored
+    # column values rather than the Python-side defaults)
+    return await session.scalar(
+        select(User)
+        .options(joinedload(User.profile))
+        .where(User.id == db_user.id)
+        .execution_options(populate_existing=True)
     )
-    session.add(db_profile)
-    session.commit()
-    session.refresh(db_profile)
-
-    return db_user
 
 
 @router.get("/me", response_model=UserResponse)
-def read_user_me(
+async def read_user_me(
+    session: deps.SessionDep,
     current_user: deps.CurrentUser,
 ) -> Any:
     """
     Get current logged-in user.
     """
-    return current_user
+    # Load the profile in the same query instead of lazily during serialization
+    return await session.scalar(
+        select(User).options(joinedload(User.profile)).where(User.id == current_user.id)
+    )
 
 
 @router.put("/me/profile", response_model=ProfileResponse)
-def update_user_profile(
+async def update_user_profile(
     *,
     session: deps.SessionDep,
     current_user: deps.CurrentUser,
@@ -85,7 +116,9 @@ def update_user_profile(
     Update own profile.
     """
     # Query profile directly from database to avoid stale data
-    profile = session.query(Profile).filter(Profile.user_id == current_user.id).first()
+    profile = await session.scalar(
+        select(Profile).where(Profile.user_id == current_user.id)
+    )
 
     if not profile:
         # Create profile if it doesn't exist (safety check)
@@ -97,7 +130,7 @@ def update_user_profile(
             series="",
         )
         session.add(profile)
-        session.flush()
+        await session.flush()
 
     # Update profile fields
     profile_data = profile_in.model_dump(exclude_unset=True)
@@ -105,8 +138,8 @@ def update_user_profile(
         setattr(profile, field, value)
 
     session.add(profile)
-    session.commit()
-    session.refresh(profile)
+    await session.commit()
+    await session.refresh(profile)
     return profile
 
 
@@ -115,7 +148,7 @@ def update_user_profile(
     response_model=UserResponse,
     dependencies=[Depends(deps.get_current_active_superuser)],
 )
-def delete_user(
+async def delete_user(
     *,
     session: deps.SessionDep,
     user_id: int,
@@ -125,27 +158,139 @@ def delete_user(
     Delete a user by ID.
     Admin only endpoint.
     """
-    user = session.query(User).filter(User.id == user_id).first()
+    user = await session.scalar(
+        select(User).options(selectinload(User.profile)).where(User.id == user_id)
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    session.query(Profile).filter(Profile.user_id == user.id).delete()
-    session.commit()
-    session.delete(user)
-    session.commit()
+    await session.execute(delete(RefreshToken).where(RefreshToken.user_id == user.id))
+    # Keep what the user authored or is linked to, just without the link
+    # (foreign keys are enforced)
+    await session.execute(
+        update(Notice).where(Notice.author_id == user.id).values(author_id=None)
+    )
+    await session.execute(
+        update(CommitteeMember)
+        .where(CommitteeMember.user_id == user.id)
+        .values(user_id=None)
+    )
+    await session.execute(
+        update(BulkUploadJob)
+        .where(BulkUploadJob.created_by == user.id)
+        .values(created_by=None)
+    )
+    # Deletes the profile too (cascade)
+    await session.delete(user)
+    await session.commit()
+    deps.invalidate_principal(user.email, token_version=user.token_version + 1)
+    # Cached notices and committees may still link to the user
+    response_cache.invalidate("notices")
+    response_cache.invalidate("committees")
     return user
 
 
-@router.get("/", response_model=List[UserResponse])
-def read_users(
+@router.get("/", response_model=Page[UserResponse])
+async def read_users(
     session: deps.SessionDep,
-    skip: int = 0,
+    cursor: str | None = None,
     limit: int = 100,
 ) -> Any:
     """
-    Retrieve users.
+    Retrieve users, oldest first.
+    Pass `next_cursor` from the response as `cursor` to get the next page.
+    """
+    # Load all profiles of the page in one extra query (avoids N+1)
+    page = await paginate(
+        session,
+        select(User).options(selectinload(User.profile)),
+        id_column=User.id,
+        cursor=cursor,
+        limit=limit,
+        descending=False,
+    )
+    return json_response(USER_PAGE, page)
+
+
+@router.get("/search", response_model=List[UserResponse])
+async def search_users(
+    session: deps.SessionDep,
+    q: str,
+    limit: int = 20,
+) -> Any:
+    """
+    Search the alumni directory by name, company, designation, work location,
+    department or series. Best matches first.
+    """
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        return []
+    limit = max(1, min(limit, 100))
+
+    if session.get_bind().dialect.name == "sqlite":
+        # Every term must match (as a prefix) somewhere; name hits rank highest
+        profile_ids = (
+            await session.scalars(
+                text(
+                    "SELECT rowid FROM profiles_fts WHERE profiles_fts MATCH :match "
+                    "ORDER BY bm25(profiles_fts, 10.0, 4.0, 4.0, 2.0, 1.0, 1.0) "
+                    "LIMIT :limit"
+                ),
+                {"match": " ".join(f'"{term}"*' for term in terms), "limit": limit},
+            )
+        ).all()
+    else:
+        # No FTS5 outside SQLite: fall back to unranked substring matching
+        query = select(Profile.id)
+        for term in terms:
+            query = query.where(
+                or_(
+                    *(
+                        getattr(Profile, column).ilike(f"%{term}%")
+                        for column in PROFILE_SEARCH_COLUMNS
+                    )
+                )
+            )
+        profile_ids = (await session.scalars(query.limit(limit))).all()
+
+    users = await session.scalars(
+        select(User)
+        .join(User.profile)
+        .options(contains_eager(User.profile))
+        .where(Profile.id.in_(profile_ids))
+    )
+    rank = {profile_id: position for position, profile_id in enumerate(profile_ids)}
+    return json_response(
+        USER_LIST, sorted(users, key=lambda user: rank[user.profile.id])
+    )
+
+
+@router.get("/facets", response_model=ProfileFacetsResponse)
+async def read_user_facets(session: deps.SessionDep) -> Any:
+    """
+    Profile counts by series, department, employer, work location and blood
+    group for the alumni directory, most common values first.
+    """
+    return await read_profile_facets(session)
+
+
+@router.get("/donors", response_model=Page[UserResponse])
+async def read_donors(
+    session: deps.SessionDep,
+    needs: BloodGroup,
+    location: str | None = None,
+    cursor: str | None = None,
+    limit: int = 20,
+) -> Any:
+    """
+    Find blood donors compatible with a recipient of blood group `needs`
+    (URL-encode "+" as "%2B"), optionally only those working in `location`.
+    Same-group donors come first.
+    Pass `next_cursor` from the response as `cursor` to get the next page.
     """
-    users = session.query(User).offset(skip).limit(limit).all()
-    return users
+    page = await find_donors(
+        session, needs, location=location, cursor=cursor, limit=limit
+    )
+    return json_response(USER_PAGE, page)
 
 
 @router.post(
@@ -153,7 +298,10 @@ def read_users(
 )
 async def bulk_upload_alumni(
     session: deps.SessionDep,
+    current_user: deps.CurrentUser,
+    response: Response,
     file: UploadFile = File(...),
+    background: bool = False,
 ) -> Any:
     """
     Bulk upload alumni from CSV or Excel file.
@@ -173,6 +321,12 @@ async def bulk_upload_alumni(
     - work_location, linkedin_profile
 
     Note: Auto-generated credentials will be returned in the response
+
+    With `background=true` the file is imported by a background job instead;
+    the job is returned right away and can be polled at
+    `/users/bulk-upload-jobs/{job_id}`. Its generated credentials are not
+    returned there: download them once from
+    `/users/bulk-upload-jobs/{job_id}/credentials` when the job is done.
     """
     # Check file extension
     if not file.filename:
@@ -185,212 +339,148 @@ async def bulk_upload_alumni(
             detail="Invalid file format. Please upload CSV or Excel file.",
         )
 
-    # Read file content
-    content = await file.read()
-
-    results = {
-        "total": 0,
-        "success": 0,
-        "failed": 0,
-        "errors": [],
-        "created_users": [],
-        "auto_generated_credentials": [],
-    }
-
-    def generate_email(full_name: str, series: str, university_id: str = "") -> str:
-        """Generate email from name and series"""
-        # Use university_id if available, otherwise use name
-        if university_id:
-            base = university_id.lower()
-        else:
-            # Take first name and last name
-            name_parts = full_name.lower().strip().split()
-            if len(name_parts) >= 2:
-                base = f"{name_parts[0]}.{name_parts[-1]}"
-            else:
-                base = name_parts[0] if name_parts else "alumni"
-
-        email = f"{base}.{series}@alumni.rca.com"
-
-        # Check if email exists, add number if needed
-        counter = 1
-        original_email = email
-        while session.query(User).filter(User.email == email).first():
-            email = f"{base}.{series}.{counter}@alumni.rca.com"
-            counter += 1
-            if counter > 100:  # Safety limit
-                email = f"{base}.{secrets.token_hex(4)}@alumni.rca.com"
-                break
-
-        return email
-
-    def generate_password(length: int = 12) -> str:
-        """Generate a random secure password"""
-        alphabet = string.ascii_letters + string.digits
-        password = "".join(secrets.choice(alphabet) for _ in range(length))
-        return password
+    if background:
+        # Keep a copy of the upload and let a background job import it
+        file_path = await run_in_threadpool(save_upload, file.file, file_ext)
+        job = BulkUploadJob(
+            filename=file.filename, file_path=file_path, created_by=current_user.id
+        )
+        session.add(job)
+        await session.commit()
+        await session.refresh(job)
+
+        start_upload_job(job.id)
+        response.status_code = 202
+        return BulkUploadJobResponse.model_validate(job)
 
     try:
-        if file_ext == "csv":
-            # Parse CSV
-            csv_content = content.decode("utf-8")
-            csv_reader = csv.DictReader(csv_content.splitlines())
-            rows = list(csv_reader)
-        else:
-            # Parse Excel
-            try:
-                import openpyxl
-            except ImportError:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Excel support not installed. Please use CSV or install openpyxl.",
-                )
+        importer = AlumniImporter(session)
 
-            workbook = openpyxl.load_workbook(BytesIO(content))
-            sheet = workbook.active
-
-            # Get headers from first row
-            headers = [cell.value for cell in sheet[1]]
-
-            # Convert to list of dicts
-            rows = []
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                if any(row):  # Skip empty rows
-                    row_dict = {
-                        headers[i]: row[i] for i in range(len(headers)) if i < len(row)
-                    }
-                    rows.append(row_dict)
-
-        results["total"] = len(rows)
-
-        # Process each row
-        for idx, row in enumerate(rows, start=1):
-            try:
-                # Get values with defaults
-                full_name = str(row.get("full_name", "")).strip()
-                series = str(row.get("series", "")).strip()
-                university_id = str(row.get("university_id", "")).strip()
-
-                # Validate minimum required fields
-                if not full_name or not series:
-                    results["errors"].append(
-                        {
-                            "row": idx,
-                            "error": "Missing required fields: full_name and series are mandatory",
-                            "data": {"full_name": full_name, "series": series},
-                        }
-                    )
-                    results["failed"] += 1
-                    continue
-
-                # Get or generate email
-                email = str(row.get("email", "")).strip()
-                email_generated = False
-                if not email:
-                    email = generate_email(full_name, series, university_id)
-                    email_generated = True
-
-                # Check if user already exists
-                existing = session.query(User).filter(User.email == email).first()
-                if existing:
-                    results["errors"].append(
-                        {"row": idx, "email": email, "error": "User already exists"}
-                    )
-                    results["failed"] += 1
-                    continue
-
-                # Get or generate password
-                password = str(row.get("password", "")).strip()
-                password_generated = False
-                if not password:
-                    password = generate_password()
-                    password_generated = True
-
-                # Parse blood group if provided
-                blood_group = None
-                blood_group_str = str(row.get("blood_group", "")).strip()
-                if blood_group_str:
-                    try:
-                        # Convert A+ to A_POS format
-                        bg_map = {
-                            "A+": "A_POS",
-                            "A-": "A_NEG",
-                            "B+": "B_POS",
-                            "B-": "B_NEG",
-                            "O+": "O_POS",
-                            "O-": "O_NEG",
-                            "AB+": "AB_POS",
-                            "AB-": "AB_NEG",
-                        }
-                        blood_group = BloodGroup[
-                            bg_map.get(blood_group_str, blood_group_str.upper())
-                        ]
-                    except (KeyError, ValueError):
-                        pass  # Ignore invalid blood group
-
-                # Parse is_employed
-                is_employed_str = str(row.get("is_employed", "false")).strip().lower()
-                is_employed = is_employed_str in ["true", "yes", "1", "t", "y"]
-
-                # Create User
-                new_user = User(
-                    email=email,
-                    hashed_password=security.get_password_hash(password),
-                    role=UserRole.ALUMNI,
-                    is_active=True,
-                )
-                session.add(new_user)
-                session.flush()
-
-                # Create Profile
-                new_profile = Profile(
-                    user_id=new_user.id,
-                    full_name=full_name,
-                    phone_number=str(row.get("phone_number", "")).strip() or None,
-                    blood_group=blood_group,
-                    university_id=university_id or "",
-                    department=str(row.get("department", "")).strip() or "",
-                    series=series,
-                    is_employed=is_employed,
-                    current_company=str(row.get("current_company", "")).strip() or None,
-                    designation=str(row.get("designation", "")).strip() or None,
-                    work_location=str(row.get("work_location", "")).strip() or None,
-                    linkedin_profile=str(row.get("linkedin_profile", "")).strip()
-                    or None,
-                )
-                session.add(new_profile)
-                session.flush()
-
-                results["success"] += 1
-                user_info = {"email": email, "full_name": full_name, "series": series}
-                results["created_users"].append(user_info)
-
-                # Track auto-generated credentials
-                if email_generated or password_generated:
-                    cred_info = {
-                        "row": idx,
-                        "email": email,
-                        "full_name": full_name,
-                    }
-                    if email_generated:
-                        cred_info["email_generated"] = True
-                    if password_generated:
-                        cred_info["password"] = password  # Include generated password
-                        cred_info["password_generated"] = True
-                    results["auto_generated_credentials"].append(cred_info)
-
-            except Exception as e:
-                results["errors"].append(
-                    {"row": idx, "email": row.get("email", "N/A"), "error": str(e)}
-                )
-                results["failed"] += 1
+        # Parse the file lazily and process it one chunk of rows at a time
+        chunks = iter_upload_rows(file.file, file_ext, settings.BULK_UPLOAD_CHUNK_SIZE)
+        async for rows in iterate_in_threadpool(chunks):
+            await importer.import_chunk(rows)
+        results = importer.results
 
         # Commit all changes
         if results["success"] > 0:
-            session.commit()
+            await session.commit()
 
         return results
 
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    dependencies=[Depends(deps.get_current_active_superuser)],
+)
+async def export_alumni(format: Literal["csv", "xlsx"] = "csv") -> Any:
+    """
+    Download all users with their profiles as CSV or Excel.
+    Admin only endpoint.
+
+    The columns are those of the bulk upload, so an export can be uploaded
+    again. Passwords are left empty (new ones are generated on upload).
+    """
+    if format == "xlsx":
+        try:
+            body = stream_xlsx()
+        except RuntimeError as e:
+            raise HTTPException(status_code=500, detail=str(e))
+        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    else:
+        body = stream_csv()
+        media_type = "text/csv"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="alumni_export.{format}"'
+        },
+    )
+
+
+@router.get(
+    "/bulk-upload-jobs/{job_id}",
+    response_model=BulkUploadJobResponse,
+    dependencies=[Depends(deps.get_current_active_superuser)],
+)
+async def read_bulk_upload_job(
+    job_id: int,
+    session: deps.SessionDep,
+) -> Any:
+    """
+    Get progress and result of a background bulk upload.
+    Admin only endpoint.
+    """
+    job = await session.get(BulkUploadJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+
+    response = BulkUploadJobResponse.model_validate(job)
+    errors = await session.scalars(
+        select(BulkUploadJobError)
+        .where(BulkUploadJobError.job_id == job_id)
+        .order_by(BulkUploadJobError.row)
+    )
+    response.errors = [BulkUploadRowError.model_validate(error) for error in errors]
+    response.credentials_available = await session.scalar(
+        select(exists().where(BulkUploadCredentials.job_id == job_id))
+    )
+    return response
+
+
+@router.get(
+    "/bulk-upload-jobs/{job_id}/credentials",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(deps.get_current_active_superuser)],
+)
+async def download_bulk_upload_credentials(
+    job_id: int,
+    session: deps.SessionDep,
+) -> Any:
+    """
+    Download the emails and passwords generated by a finished background
+    upload, as CSV. Admin only endpoint.
+
+    The credentials are deleted as they are handed out: this works once.
+    """
+    job = await session.get(BulkUploadJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    if job.status not in (UploadJobStatus.COMPLETED, UploadJobStatus.FAILED):
+        raise HTTPException(status_code=409, detail="Upload job is still running")
+
+    credentials = await take_upload_credentials(session, job_id)
+    if not credentials:
+        raise HTTPException(
+            status_code=410, detail="No credentials to download (or already downloaded)"
+        )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["row", "email", "full_name", "password"])
+    for credential in credentials:
+        writer.writerow(
+            [
+                credential["row"],
+                credential["email"],
+                credential["full_name"],
+                credential.get("password", ""),
+            ]
+        )
+    return PlainTextResponse(
+        buffer.getvalue(),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="upload_{job_id}_credentials.csv"'
+            ),
+            "Cache-Control": "no-store",
+        },
+    )
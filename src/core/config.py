@@ -3,9 +3,84 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./rca.db"
+    # Used by the API; derived from DATABASE_URL when unset (aiosqlite for
+    # SQLite, asyncpg for PostgreSQL)
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Connection pool (per process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+
+    # SQLite pragmas applied to every new connection. WAL lets readers run
+    # alongside a writer; busy_timeout makes writers wait for the lock instead
+    # of failing with "database is locked".
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5_000
+    SQLITE_CACHE_SIZE: int = -64_000  # Negative: KiB, i.e. 64 MB per connection
+    SQLITE_MMAP_SIZE: int = 268_435_456  # 256 MB
+    SQLITE_FOREIGN_KEYS: bool = True
     SECRET_KEY: str = "super-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+
+    # Authenticated users (and their token versions) are cached per token
+    # subject to skip the DB lookup. The TTL is also the longest a revocation
+    # (token reuse, deleted user) takes to reach the other worker processes
+    PRINCIPAL_CACHE_SIZE: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+
+    # Passwords verified concurrently by /auth/login; extra logins queue up
+    LOGIN_VERIFY_CONCURRENCY: int = 4
+
+    # Cached bodies of public read endpoints (dropped on writes; the TTL bounds
+    # staleness across worker processes)
+    RESPONSE_CACHE_SIZE: int = 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+
+    # Worker processes used for batch password hashing (defaults to CPU count)
+    PASSWORD_HASH_WORKERS: int | None = None
+
+    # Rows parsed, hashed and inserted together during bulk alumni upload
+    BULK_UPLOAD_CHUNK_SIZE: int = 500
+
+    # Where uploads are kept while a background import job processes them
+    UPLOAD_JOBS_DIR: str = "./upload_jobs"
+    # A running job whose worker hasn't reported progress for this long is
+    # presumed dead and may be taken over; keep it well above the time one
+    # chunk takes to import
+    UPLOAD_JOB_LEASE_SECONDS: int = 300
+    # How often each API process looks for jobs to take over
+    UPLOAD_JOB_SWEEP_SECONDS: int = 60
+
+    # Rows fetched from the database per batch while streaming an export
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Per-route request metrics, served at /metrics in Prometheus format.
+    # With METRICS_TOKEN set, scrapers must send "Authorization: Bearer
+    # <token>". Without it /metrics is open to anyone who can reach the API:
+    # only then expose it inside the private network (e.g. block /metrics at
+    # the reverse proxy)
+    METRICS_ENABLED: bool = True
+    METRICS_TOKEN: str | None = None
+
+    # Queries at least this slow are logged with their parameters
+    SLOW_QUERY_MS: float = 200
+    # A SELECT run this many times in one request is logged as a likely N+1
+    # query (0 disables the check)
+    N_PLUS_ONE_THRESHOLD: int = 10
+    # Report each request's query count and time in a Server-Timing header
+    SERVER_TIMING_ENABLED: bool = True
+
+    # Compress responses (gzip, or brotli if installed) for clients that
+    # accept it; smaller bodies aren't worth the CPU and header overhead
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    GZIP_LEVEL: int = 6
+    # 0-11; the top levels are far too slow for dynamic responses
+    BROTLI_QUALITY: int = 4
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,140 @@
+"""
+In-process request metrics, rendered in the Prometheus text format.
+
+Metrics live in the worker process that recorded them; with several uvicorn
+workers, each one reports its own (scrape them per worker, or aggregate in
+Prometheus).
+"""
+
+from bisect import bisect_left
+from typing import Iterable
+from src.core.security import verify_queue_time
+
+# Upper bounds of the histogram buckets (the +Inf bucket is implicit)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class Histogram:
+    """
+    Bucketed observations with their count and sum. Updated from the event
+    loop only, so there is no lock.
+    """
+
+    __slots__ = ("bounds", "buckets", "count", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class RequestMetrics:
+    """
+    Per-route request counts, latency and response size histograms, and the
+    number of requests in progress.
+    """
+
+    def __init__(self):
+        # (method, route, status) -> count
+        self.requests: dict[tuple[str, str, int], int] = {}
+        # (method, route) -> histogram
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.response_size: dict[tuple[str, str], Histogram] = {}
+        # method -> requests started but not finished
+        self.in_progress: dict[str, int] = {}
+
+    def started(self, method: str) -> None:
+        self.in_progress[method] = self.in_progress.get(method, 0) + 1
+
+    def finished(
+        self, method: str, route: str, status: int, seconds: float, size: int
+    ) -> None:
+        self.in_progress[method] -= 1
+        key = (method, route, status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        key = (method, route)
+        latency = self.latency.get(key)
+        if latency is None:
+            latency = self.latency[key] = Histogram(LATENCY_BUCKETS)
+            self.response_size[key] = Histogram(SIZE_BUCKETS)
+        latency.observe(seconds)
+        self.response_size[key].observe(size)
+
+    def clear(self) -> None:
+        self.requests.clear()
+        self.latency.clear()
+        self.response_size.clear()
+        self.in_progress.clear()
+
+
+request_metrics = RequestMetrics()
+
+
+def _labels(**labels: object) -> str:
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in labels.values()
+    )
+    return "{" + ",".join(f'{n}="{v}"' for n, v in zip(labels, escaped)) + "}"
+
+
+def _histogram_lines(
+    name: str, histograms: dict[tuple[str, str], Histogram]
+) -> Iterable[str]:
+    for (method, route), histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(histogram.bounds + ("+Inf",), histogram.buckets):
+            cumulative += count
+            labels = _labels(method=method, route=route, le=bound)
+            yield f"{name}_bucket{labels} {cumulative}"
+        labels = _labels(method=method, route=route)
+        yield f"{name}_sum{labels} {histogram.sum}"
+        yield f"{name}_count{labels} {histogram.count}"
+
+
+def render_metrics(metrics: RequestMetrics | None = None) -> str:
+    """
+    All metrics in the Prometheus text exposition format (version 0.0.4).
+    """
+    metrics = metrics or request_metrics
+    lines = [
+        "# HELP http_requests_total Requests handled, by route template and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (method, route, status), count in sorted(metrics.requests.items()):
+        labels = _labels(method=method, route=route, status=status)
+        lines.append(f"http_requests_total{labels} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds Time to handle a request.",
+        "# TYPE http_request_duration_seconds histogram",
+        *_histogram_lines("http_request_duration_seconds", metrics.latency),
+        "# HELP http_response_size_bytes Size of response bodies.",
+        "# TYPE http_response_size_bytes histogram",
+        *_histogram_lines("http_response_size_bytes", metrics.response_size),
+        "# HELP http_requests_in_progress Requests being handled.",
+        "# TYPE http_requests_in_progress gauge",
+    ]
+    for method, count in sorted(metrics.in_progress.items()):
+        lines.append(f"http_requests_in_progress{_labels(method=method)} {count}")
+
+    lines += [
+        "# HELP login_verify_queue_seconds Time logins waited for a password "
+        "verification worker.",
+        "# TYPE login_verify_queue_seconds summary",
+        f"login_verify_queue_seconds_sum {verify_queue_time.total_seconds}",
+        f"login_verify_queue_seconds_count {verify_queue_time.count}",
+        "# HELP login_verify_queue_max_seconds Longest wait for a verification "
+        "worker.",
+        "# TYPE login_verify_queue_max_seconds gauge",
+        f"login_verify_queue_max_seconds {verify_queue_time.max_seconds}",
+    ]
+    return "\n".join(lines) + "\n"
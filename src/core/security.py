@@ -1,5 +1,15 @@
+import asyncio
+import base64
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Union
+from cryptography.fernet import Fernet
 from jose import jwt
 from passlib.context import CryptContext
 from src.core.config import settings
@@ -7,9 +17,42 @@ from src.core.config import settings
 # Password hashing configuration
 pwd_context = CryptContext(schemes=["argon2", "bcrypt"], deprecated="auto")
 
+# Process pool for hashing many passwords at once (started and shut down with
+# the app, see start_hash_executor)
+_hash_executor: ProcessPoolExecutor | None = None
+
+# Dedicated threads for login verification, so a burst of logins queues here
+# instead of taking over the shared threadpool (argon2/bcrypt release the GIL)
+_verify_executor = ThreadPoolExecutor(
+    max_workers=settings.LOGIN_VERIFY_CONCURRENCY, thread_name_prefix="verify"
+)
+
+
+class QueueTimeStats:
+    """
+    Running count/sum/max of how long login verifications waited for a worker.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+
+verify_queue_time = QueueTimeStats()
+
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: timedelta | None = None
+    subject: Union[str, Any],
+    expires_delta: timedelta | None = None,
+    claims: dict[str, Any] | None = None,
 ) -> str:
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -17,13 +60,26 @@ def create_access_token(
         # Default to 30 minutes if not set
         expire = datetime.now(timezone.utc) + timedelta(minutes=30)
 
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {**(claims or {}), "exp": expire, "sub": str(subject)}
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
 
 
+def create_refresh_token(
+    subject: Union[str, Any], jti: str, version: int, expires_delta: timedelta
+) -> str:
+    to_encode = {
+        "exp": datetime.now(timezone.utc) + expires_delta,
+        "sub": str(subject),
+        "type": "refresh",
+        "jti": jti,
+        "ver": version,
+    }
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     # Truncate to 72 bytes for consistency with hashing
     plain_password = plain_password.encode("utf-8")[:72].decode(
@@ -32,7 +88,104 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password on the dedicated login executor.
+    Returns (valid, new_hash); new_hash is set when the stored hash uses
+    deprecated parameters or a legacy scheme (bcrypt) and should be replaced.
+    """
+    plain_password = plain_password.encode("utf-8")[:72].decode(
+        "utf-8", errors="ignore"
+    )
+    submitted = time.perf_counter()
+
+    def verify() -> tuple[bool, str | None]:
+        verify_queue_time.observe(time.perf_counter() - submitted)
+        return pwd_context.verify_and_update(plain_password, hashed_password)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_verify_executor, verify)
+
+
+@lru_cache
+def _fernet() -> Fernet:
+    # Derived from SECRET_KEY, with a label so it never equals the JWT key
+    digest = hashlib.sha256(f"secrets:{settings.SECRET_KEY}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+
+def encrypt_secret(data: bytes) -> bytes:
+    """
+    Encrypt data (e.g. generated passwords) before it is stored.
+    """
+    return _fernet().encrypt(data)
+
+
+def decrypt_secret(token: bytes) -> bytes:
+    return _fernet().decrypt(token)
+
+
 def get_password_hash(password: str) -> str:
     # Truncate password to 72 bytes (bcrypt limit)
     password = password.encode("utf-8")[:72].decode("utf-8", errors="ignore")
     return pwd_context.hash(password)
+
+
+def start_hash_executor() -> None:
+    """
+    Start the process pool used by `get_password_hashes`. Workers come from a
+    forkserver (spawn where there is none) rather than a fork of the app
+    process, which would copy its event loop, threads, held locks and open
+    database connections into every worker.
+    """
+    global _hash_executor
+    if _hash_executor is not None:
+        return
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Imported once by the server instead of by every worker
+        context.set_forkserver_preload([__name__])
+    else:
+        context = multiprocessing.get_context("spawn")
+    _hash_executor = ProcessPoolExecutor(
+        max_workers=settings.PASSWORD_HASH_WORKERS or os.cpu_count(),
+        mp_context=context,
+    )
+
+
+def shutdown_hash_executor() -> None:
+    """
+    Stop the hashing processes. Queued batches are dropped; running ones are
+    waited for.
+    """
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(cancel_futures=True)
+        _hash_executor = None
+
+
+def _hash_batch(passwords: list[str]) -> list[str]:
+    return [get_password_hash(password) for password in passwords]
+
+
+async def get_password_hashes(passwords: list[str]) -> list[str]:
+    """
+    Hash a batch of passwords on the process pool without blocking the event loop.
+    The batch is split into one slice per worker; hashes keep the input order.
+    """
+    if not passwords:
+        return []
+
+    workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+    size = -(-len(passwords) // workers)  # ceil division
+    slices = [passwords[i : i + size] for i in range(0, len(passwords), size)]
+
+    if _hash_executor is None:
+        raise RuntimeError("Password hashing pool not started (start_hash_executor)")
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(_hash_executor, _hash_batch, chunk) for chunk in slices)
+    )
+    return [hashed for chunk in results for hashed in chunk]
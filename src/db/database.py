@@ -1,16 +1,113 @@
-from sqlalchemy import create_engine
+from typing import Any
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from src.core.config import settings
+from src.db.instrumentation import instrument_engine
 
+# Applied on connect to every SQLite connection
+SQLITE_PRAGMAS = {
+    "journal_mode": settings.SQLITE_JOURNAL_MODE,
+    "synchronous": settings.SQLITE_SYNCHRONOUS,
+    "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    "cache_size": settings.SQLITE_CACHE_SIZE,
+    "mmap_size": settings.SQLITE_MMAP_SIZE,
+    "foreign_keys": "ON" if settings.SQLITE_FOREIGN_KEYS else "OFF",
+}
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+
+def set_sqlite_pragmas(engine: Engine, pragmas: dict[str, Any]) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+
+def _pool_options(url: URL) -> dict[str, Any]:
+    # In-memory SQLite uses a single-connection pool that can't be sized
+    if url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+
+
+def create_db_engine(url: str, sqlite_pragmas: dict[str, Any] | None = None) -> Engine:
+    """
+    Create an engine with the pool sized from settings. SQLite connections
+    get `sqlite_pragmas` (default: SQLITE_PRAGMAS).
+    """
+    parsed = make_url(url)
+    kwargs = _pool_options(parsed)
+    if parsed.get_backend_name() == "sqlite":
+        kwargs["connect_args"] = {"check_same_thread": False}
+
+    engine = create_engine(url, **kwargs)
+    if engine.dialect.name == "sqlite":
+        set_sqlite_pragmas(
+            engine, SQLITE_PRAGMAS if sqlite_pragmas is None else sqlite_pragmas
+        )
+    return engine
+
+
+def async_database_url(url: str) -> str:
+    """
+    The async-driver form of a database URL: aiosqlite for SQLite, asyncpg
+    for PostgreSQL. URLs that already name a driver other than the default
+    sync one are kept as they are.
+    """
+    parsed = make_url(url)
+    drivers = {
+        "sqlite": "sqlite+aiosqlite",
+        "postgresql": "postgresql+asyncpg",
+        "postgresql+psycopg2": "postgresql+asyncpg",
+    }
+    if parsed.drivername in drivers:
+        parsed = parsed.set(drivername=drivers[parsed.drivername])
+    return parsed.render_as_string(hide_password=False)
+
+
+def create_async_db_engine(
+    url: str, sqlite_pragmas: dict[str, Any] | None = None
+) -> AsyncEngine:
+    """
+    Async counterpart of `create_db_engine`, with the same pool settings
+    and SQLite pragmas.
+    """
+    engine = create_async_engine(url, **_pool_options(make_url(url)))
+    if engine.dialect.name == "sqlite":
+        set_sqlite_pragmas(
+            engine.sync_engine,
+            SQLITE_PRAGMAS if sqlite_pragmas is None else sqlite_pragmas,
+        )
+    return engine
+
+
+# Create SQLAlchemy engine (used by scripts, migrations and benchmarks)
+engine = create_db_engine(settings.DATABASE_URL)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and sessions used by the API
+async_engine = create_async_db_engine(
+    settings.ASYNC_DATABASE_URL or async_database_url(settings.DATABASE_URL)
+)
+# Objects stay loaded after commit: an expired attribute would need a lazy
+# load, which async sessions can't do implicitly
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Per-request query stats, slow query log and N+1 detection
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
 # Create base class for database models
 class Base(DeclarativeBase):
     pass
@@ -22,4 +119,3 @@ def get_db():
         yield db
     finally:
         db.close()
-
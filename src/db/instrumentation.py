@@ -0,0 +1,80 @@
+"""
+SQL query instrumentation: per-request query counts and time, slow query
+logging, and detection of likely N+1 query patterns.
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """
+    Queries run while handling one request.
+    """
+
+    __slots__ = ("count", "seconds", "selects")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        # SELECT statement -> times run. Statements are parameterized, so
+        # the same query for different ids shares one entry
+        self.selects: dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if statement.lstrip()[:6].upper() == "SELECT":
+            self.selects[statement] = self.selects.get(statement, 0) + 1
+
+    def repeated_selects(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        SELECTs run at least `threshold` times: usually a query issued once
+        per row of an earlier result (lazy loads, lookups in a loop).
+        """
+        return [(s, n) for s, n in self.selects.items() if n >= threshold]
+
+
+# Stats of the request being handled (None outside requests)
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def _truncate(value: object, limit: int = 500) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement run on `engine` (for an AsyncEngine, pass
+    `engine.sync_engine`).
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        # Statements on one connection run one at a time
+        conn.info["query_started"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info.pop("query_started")
+
+        stats = current_query_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+
+        if seconds * 1000 >= settings.SLOW_QUERY_MS:
+            logger.warning(
+                "Slow query (%.1f ms): %s\nParameters: %s",
+                seconds * 1000,
+                statement,
+                _truncate(parameters),
+            )
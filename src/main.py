@@ -1,12 +1,70 @@
-from fastapi import FastAPI
+import asyncio
+import secrets
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
+from src.api.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    ServerTimingMiddleware,
+)
 from src.api.v1.api import api_router
+from src.core import security, settings
+from src.core.metrics import render_metrics
+from src.db.database import async_engine
+from src.services.upload_jobs import stop_upload_jobs, watch_upload_jobs
 
-app = FastAPI(title="Alumni Association API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    security.start_hash_executor()
+    # Pick up bulk upload jobs interrupted by a restart, and later those of
+    # workers that died
+    watcher = asyncio.create_task(watch_upload_jobs())
+    yield
+    watcher.cancel()
+    await stop_upload_jobs()
+    # Waits for running hash batches without blocking the event loop
+    await run_in_threadpool(security.shutdown_hash_executor)
+    await async_engine.dispose()
+
+
+app = FastAPI(title="Alumni Association API", lifespan=lifespan)
+
+# Added first, so it runs innermost and metrics record compressed sizes
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 # Include the router
 app.include_router(api_router, prefix="/api/v1")
 
 
 @app.get("/")
-def root():
+async def root():
     return {"message": "Welcome to the Alumni Association API"}
+
+
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    async def metrics(authorization: str | None = Header(None)):
+        """
+        Request metrics of this worker process, in Prometheus text format.
+        Requires the METRICS_TOKEN bearer token when one is configured.
+        """
+        if settings.METRICS_TOKEN and not secrets.compare_digest(
+            (authorization or "").encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+        ):
+            raise HTTPException(
+                status_code=401,
+                detail="Not authenticated",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return PlainTextResponse(
+            render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
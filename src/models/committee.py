@@ -1,5 +1,15 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Date
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    ForeignKey,
+    DateTime,
+    Date,
+    Index,
+    text,
+)
 from sqlalchemy.orm import relationship
 from src.db.database import Base
 
@@ -10,6 +20,17 @@ class CommitteeSession(Base):
     """
 
     __tablename__ = "committee_sessions"
+    __table_args__ = (
+        # Only one session is active; keep a tiny index of just that row
+        Index(
+            "ix_committee_sessions_active",
+            "is_active",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active"),
+        ),
+        # Committee history: ORDER BY start_date DESC, id DESC
+        Index("ix_committee_sessions_start_date_id", "start_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)  # e.g. "EC 2024-25"
@@ -36,6 +57,10 @@ class CommitteeMember(Base):
     """
 
     __tablename__ = "committee_members"
+    __table_args__ = (
+        # Members of a session, in display order
+        Index("ix_committee_members_session_id_rank", "session_id", "rank"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("committee_sessions.id"))
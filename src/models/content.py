@@ -1,6 +1,16 @@
 from datetime import datetime, timezone
 from operator import is_
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Boolean
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    ForeignKey,
+    DateTime,
+    Text,
+    Boolean,
+    Index,
+    text,
+)
 from src.db.database import Base
 
 
@@ -10,6 +20,10 @@ class Event(Base):
     """
 
     __tablename__ = "events"
+    __table_args__ = (
+        # Event listing: ORDER BY event_date DESC, id DESC
+        Index("ix_events_event_date_id", "event_date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -33,6 +47,16 @@ class Notice(Base):
     """
 
     __tablename__ = "notices"
+    __table_args__ = (
+        # Public notice listing: published only, ORDER BY created_at DESC, id DESC
+        Index(
+            "ix_notices_published_created_at_id",
+            "created_at",
+            "id",
+            sqlite_where=text("is_published = 1"),
+            postgresql_where=text("is_published"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
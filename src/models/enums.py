@@ -17,3 +17,48 @@ class BloodGroup(str, enum.Enum):
     O_NEG = "O-"
     AB_POS = "AB+"
     AB_NEG = "AB-"
+
+
+# Recipient -> groups that can donate red cells to them, preferred first:
+# the same group, then the rest, with O- (the scarcest donors) last
+COMPATIBLE_DONORS: dict[BloodGroup, tuple[BloodGroup, ...]] = {
+    BloodGroup.O_NEG: (BloodGroup.O_NEG,),
+    BloodGroup.O_POS: (BloodGroup.O_POS, BloodGroup.O_NEG),
+    BloodGroup.A_NEG: (BloodGroup.A_NEG, BloodGroup.O_NEG),
+    BloodGroup.A_POS: (
+        BloodGroup.A_POS,
+        BloodGroup.A_NEG,
+        BloodGroup.O_POS,
+        BloodGroup.O_NEG,
+    ),
+    BloodGroup.B_NEG: (BloodGroup.B_NEG, BloodGroup.O_NEG),
+    BloodGroup.B_POS: (
+        BloodGroup.B_POS,
+        BloodGroup.B_NEG,
+        BloodGroup.O_POS,
+        BloodGroup.O_NEG,
+    ),
+    BloodGroup.AB_NEG: (
+        BloodGroup.AB_NEG,
+        BloodGroup.A_NEG,
+        BloodGroup.B_NEG,
+        BloodGroup.O_NEG,
+    ),
+    BloodGroup.AB_POS: (
+        BloodGroup.AB_POS,
+        BloodGroup.AB_NEG,
+        BloodGroup.A_POS,
+        BloodGroup.A_NEG,
+        BloodGroup.B_POS,
+        BloodGroup.B_NEG,
+        BloodGroup.O_POS,
+        BloodGroup.O_NEG,
+    ),
+}
+
+
+class UploadJobStatus(str, enum.Enum):
+    PENDING = "pending"  # waiting for a worker
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
+from src.db.base import Base
+from src.models.enums import UploadJobStatus
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class BulkUploadJob(Base):
+    """
+    A bulk alumni upload processed in the background.
+    Progress is committed together with each imported chunk of rows, so a
+    job can resume where it stopped after a worker restart.
+    """
+
+    __tablename__ = "bulk_upload_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    filename = Column(String, nullable=False)  # Name of the uploaded file
+    file_path = Column(String, nullable=False)  # Saved copy being processed
+    status = Column(Enum(UploadJobStatus), default=UploadJobStatus.PENDING, index=True)
+
+    # --- Lease ---
+    # Worker running the job, and when it last committed progress. Only one
+    # worker holds a job at a time; another may take it over once the
+    # heartbeat is older than UPLOAD_JOB_LEASE_SECONDS
+    claimed_by = Column(String, nullable=True)
+    heartbeat = Column(DateTime, nullable=True)
+
+    # --- Progress ---
+    processed_rows = Column(Integer, default=0)
+    succeeded = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    rows_per_second = Column(Float, nullable=True)
+
+    # Why the job failed; row errors are kept in bulk_upload_job_errors
+    error = Column(Text, nullable=True)
+
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, default=_utcnow)
+    updated_at = Column(DateTime, default=_utcnow, onupdate=_utcnow)
+
+
+class BulkUploadJobError(Base):
+    """
+    A row of a background upload that couldn't be imported. Appended with the
+    chunk it belongs to, so progress commits don't rewrite earlier errors.
+    """
+
+    __tablename__ = "bulk_upload_job_errors"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(
+        Integer, ForeignKey("bulk_upload_jobs.id"), nullable=False, index=True
+    )
+    row = Column(Integer, nullable=False)
+    email = Column(String, nullable=True)
+    error = Column(Text, nullable=False)
+
+
+class BulkUploadCredentials(Base):
+    """
+    Credentials generated for one chunk of a background upload, encrypted
+    (see security.encrypt_secret). Handed out by a single download, which
+    deletes them.
+    """
+
+    __tablename__ = "bulk_upload_credentials"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(
+        Integer, ForeignKey("bulk_upload_jobs.id"), nullable=False, index=True
+    )
+    data = Column(LargeBinary, nullable=False)
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from sqlalchemy import (
+    DDL,
     Column,
     Enum,
     Integer,
@@ -8,6 +9,8 @@ from sqlalchemy import (
     DateTime,
     Text,
     ForeignKey,
+    Index,
+    event,
 )
 from sqlalchemy.orm import relationship
 from src.db.base import Base
@@ -28,6 +31,8 @@ class User(Base):
 
     role = Column(Enum(UserRole), default=UserRole.PENDING)
     is_active = Column(Boolean, default=True)
+    # Carried in tokens; bumped to revoke every token issued to the user
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
@@ -47,6 +52,12 @@ class Profile(Base):
     """
 
     __tablename__ = "profiles"
+    __table_args__ = (
+        # Directory filters by batch, then department
+        Index("ix_profiles_series_department", "series", "department"),
+        # Donor lookup: compatible blood group, optionally in one location
+        Index("ix_profiles_blood_group_work_location", "blood_group", "work_location"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True)
@@ -78,3 +89,142 @@ class Profile(Base):
     )
 
     user = relationship("User", back_populates="profile")
+
+
+# --- Directory search (SQLite FTS5) ---
+# External-content full-text index over the searchable profile fields, kept in
+# sync by triggers (so bulk inserts are indexed too). The Alembic migration
+# "Added profile search index" creates the same objects on existing databases.
+PROFILE_SEARCH_COLUMNS = (
+    "full_name",
+    "current_company",
+    "designation",
+    "work_location",
+    "department",
+    "series",
+)
+
+_columns = ", ".join(PROFILE_SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{c}" for c in PROFILE_SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{c}" for c in PROFILE_SEARCH_COLUMNS)
+
+PROFILE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE profiles_fts USING fts5({_columns}, "
+    "content='profiles', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER profiles_fts_ai AFTER INSERT ON profiles BEGIN "
+    f"INSERT INTO profiles_fts(rowid, {_columns}) VALUES (new.id, {_new_values}); "
+    "END",
+    f"CREATE TRIGGER profiles_fts_ad AFTER DELETE ON profiles BEGIN "
+    f"INSERT INTO profiles_fts(profiles_fts, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old_values}); "
+    "END",
+    f"CREATE TRIGGER profiles_fts_au AFTER UPDATE OF {_columns} ON profiles BEGIN "
+    f"INSERT INTO profiles_fts(profiles_fts, rowid, {_columns}) "
+    f"VALUES ('delete', old.id, {_old_values}); "
+    f"INSERT INTO profiles_fts(rowid, {_columns}) VALUES (new.id, {_new_values}); "
+    "END",
+]
+
+for _statement in PROFILE_SEARCH_DDL:
+    event.listen(
+        Profile.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+
+class ProfileFacet(Base):
+    """
+    Directory facet counts: number of profiles per value of each facet
+    (e.g. facet "series", value "2018"). Maintained incrementally by triggers
+    on `profiles`; rebuild with `manage.py rebuild-facets`.
+    """
+
+    __tablename__ = "profile_facets"
+
+    facet = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+# --- Directory facets (SQLite triggers) ---
+# Facet name -> profile column. Empty and NULL values are not counted.
+PROFILE_FACET_COLUMNS = {
+    "series": "series",
+    "department": "department",
+    "employer": "current_company",
+    "work_location": "work_location",
+    "blood_group": "blood_group",
+}
+
+
+def _count_facet(facet: str, value: str, condition: str) -> str:
+    return (
+        f"INSERT INTO profile_facets (facet, value, count) "
+        f"SELECT '{facet}', {value}, 1 WHERE {condition} "
+        "ON CONFLICT (facet, value) DO UPDATE SET count = count + 1; "
+    )
+
+
+def _uncount_facet(facet: str, value: str, condition: str) -> str:
+    return (
+        f"UPDATE profile_facets SET count = count - 1 "
+        f"WHERE facet = '{facet}' AND value = {value} AND {condition}; "
+        f"DELETE FROM profile_facets "
+        f"WHERE facet = '{facet}' AND value = {value} AND count <= 0; "
+    )
+
+
+_facet_columns = ", ".join(PROFILE_FACET_COLUMNS.values())
+
+PROFILE_FACET_DDL = [
+    "CREATE TRIGGER profile_facets_ai AFTER INSERT ON profiles BEGIN "
+    + "".join(
+        _count_facet(facet, f"new.{column}", f"new.{column} <> ''")
+        for facet, column in PROFILE_FACET_COLUMNS.items()
+    )
+    + "END",
+    "CREATE TRIGGER profile_facets_ad AFTER DELETE ON profiles BEGIN "
+    + "".join(
+        _uncount_facet(facet, f"old.{column}", "1")
+        for facet, column in PROFILE_FACET_COLUMNS.items()
+    )
+    + "END",
+    f"CREATE TRIGGER profile_facets_au AFTER UPDATE OF {_facet_columns} "
+    "ON profiles BEGIN "
+    + "".join(
+        _uncount_facet(facet, f"old.{column}", f"old.{column} IS NOT new.{column}")
+        + _count_facet(
+            facet,
+            f"new.{column}",
+            f"new.{column} <> '' AND new.{column} IS NOT old.{column}",
+        )
+        for facet, column in PROFILE_FACET_COLUMNS.items()
+    )
+    + "END",
+]
+
+for _statement in PROFILE_FACET_DDL:
+    event.listen(
+        Profile.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+
+
+class RefreshToken(Base):
+    """
+    Issued refresh tokens. Each one can be exchanged only once (rotation);
+    presenting a spent token again revokes all of the user's tokens.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String, unique=True, index=True, nullable=False)  # Token ID
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    used_at = Column(DateTime, nullable=True)  # Set once exchanged
+
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -0,0 +1,24 @@
+"""
+Prebuilt TypeAdapters for the list responses. Building an adapter compiles
+its validator and serializer, so each one is built once, at import.
+"""
+
+from functools import lru_cache
+from typing import Any
+from pydantic import TypeAdapter
+from src.schemas.committee import CommitteeSessionResponse
+from src.schemas.content import EventResponse, NoticeResponse
+from src.schemas.pagination import Page
+from src.schemas.user import UserResponse
+
+
+@lru_cache
+def adapter_for(model: Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+USER_PAGE = adapter_for(Page[UserResponse])
+USER_LIST = adapter_for(list[UserResponse])
+EVENT_PAGE = adapter_for(Page[EventResponse])
+NOTICE_PAGE = adapter_for(Page[NoticeResponse])
+COMMITTEE_SESSION_PAGE = adapter_for(Page[CommitteeSessionResponse])
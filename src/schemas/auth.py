@@ -1,13 +1,26 @@
 from pydantic import BaseModel, EmailStr
+from src.models.enums import UserRole
 
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str | None = None
     token_type: str
 
 
 class TokenData(BaseModel):
     sub: str | None = None
+    # Self-contained access tokens also carry the user's id, role and
+    # token version; refresh tokens have type="refresh" and a jti
+    uid: int | None = None
+    role: UserRole | None = None
+    ver: int | None = None
+    type: str | None = None
+    jti: str | None = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 
 class Login(BaseModel):
@@ -49,7 +49,7 @@ class NoticeUpdate(NoticeBase):
 
 class NoticeResponse(NoticeBase):
     id: int
-    author_id: int
+    author_id: int | None = None  # None once the author is deleted
     created_at: datetime
     updated_at: datetime
 
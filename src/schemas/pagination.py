@@ -0,0 +1,10 @@
+from typing import Generic, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    # Pass as `cursor` to get the next page; None on the last page
+    next_cursor: str | None = None
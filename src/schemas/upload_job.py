@@ -0,0 +1,34 @@
+from datetime import datetime
+from pydantic import BaseModel
+from src.models.enums import UploadJobStatus
+
+
+class BulkUploadRowError(BaseModel):
+    row: int
+    email: str | None = None
+    error: str
+
+    class Config:
+        from_attributes = True
+
+
+class BulkUploadJobResponse(BaseModel):
+    id: int
+    filename: str
+    status: UploadJobStatus
+    processed_rows: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    rows_per_second: float | None = None
+    error: str | None = None
+    # Rows that couldn't be imported so far
+    errors: list[BulkUploadRowError] = []
+    # Generated emails/passwords waiting to be downloaded (once) from
+    # /users/bulk-upload-jobs/{id}/credentials
+    credentials_available: bool = False
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
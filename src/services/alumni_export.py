@@ -0,0 +1,133 @@
+"""
+Streaming export of the alumni directory (CSV / Excel), in the same column
+layout that the bulk upload reads.
+"""
+
+import csv
+import io
+import tempfile
+from typing import Any, AsyncIterator, Iterable
+from sqlalchemy import select
+from starlette.concurrency import run_in_threadpool
+from src.core import settings
+from src.db.database import AsyncSessionLocal
+from src.models.user import Profile, User
+
+# Header row of exports; matches sample_alumni_upload.csv
+EXPORT_COLUMNS = [
+    "full_name",
+    "series",
+    "email",
+    "password",
+    "phone_number",
+    "blood_group",
+    "department",
+    "university_id",
+    "is_employed",
+    "current_company",
+    "designation",
+    "work_location",
+    "linkedin_profile",
+]
+
+_statement = (
+    select(
+        Profile.full_name,
+        Profile.series,
+        User.email,
+        Profile.phone_number,
+        Profile.blood_group,
+        Profile.department,
+        Profile.university_id,
+        Profile.is_employed,
+        Profile.current_company,
+        Profile.designation,
+        Profile.work_location,
+        Profile.linkedin_profile,
+    )
+    .join(User.profile)
+    .order_by(User.id)
+)
+
+
+def _export_row(row: Any) -> list[str]:
+    # Passwords can't be exported; left empty, the upload generates new ones
+    return [
+        row.full_name or "",
+        row.series or "",
+        row.email,
+        "",
+        row.phone_number or "",
+        row.blood_group.value if row.blood_group else "",
+        row.department or "",
+        row.university_id or "",
+        "true" if row.is_employed else "false",
+        row.current_company or "",
+        row.designation or "",
+        row.work_location or "",
+        row.linkedin_profile or "",
+    ]
+
+
+async def _iter_export_rows() -> AsyncIterator[list[list[str]]]:
+    # Rows come from a server-side cursor, `EXPORT_BATCH_SIZE` at a time, so
+    # memory doesn't grow with the directory. The session is opened here (not
+    # taken from the request) because streaming outlives the handler.
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(
+            _statement.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield [_export_row(row) for row in rows]
+
+
+async def stream_csv() -> AsyncIterator[bytes]:
+    """
+    The directory as CSV, one encoded batch of rows at a time.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in _iter_export_rows():
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _append_rows(worksheet: Any, rows: Iterable[list[str]]) -> None:
+    for row in rows:
+        worksheet.append(row)
+
+
+async def _write_xlsx(workbook: Any) -> AsyncIterator[bytes]:
+    worksheet = workbook.create_sheet("Alumni")
+    worksheet.append(EXPORT_COLUMNS)
+    async for rows in _iter_export_rows():
+        await run_in_threadpool(_append_rows, worksheet, rows)
+
+    with tempfile.TemporaryFile() as file:
+        await run_in_threadpool(workbook.save, file)
+        file.seek(0)
+        while chunk := await run_in_threadpool(file.read, 64 * 1024):
+            yield chunk
+
+
+def stream_xlsx() -> AsyncIterator[bytes]:
+    """
+    The directory as an Excel workbook.
+
+    An .xlsx is a zip archive that can only be finished once every row is
+    known, so rows go through openpyxl's write-only mode (which keeps them
+    in a temporary file, not in memory) and the saved file is streamed.
+    """
+    try:
+        import openpyxl
+    except ImportError:
+        raise RuntimeError(
+            "Excel support not installed. Please use CSV or install openpyxl."
+        )
+
+    return _write_xlsx(openpyxl.Workbook(write_only=True))
@@ -0,0 +1,424 @@
+"""
+Helpers for the bulk alumni import (CSV / Excel uploads).
+"""
+
+import csv
+import io
+import secrets
+import string
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, Iterator
+from sqlalchemy import and_, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.core import security
+from src.models.enums import BloodGroup, UserRole
+from src.models.user import Profile, User
+
+
+def _chunked(rows: Iterable[dict], chunk_size: int) -> Iterator[list[dict]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _iter_csv_rows(file: BinaryIO) -> Iterator[dict]:
+    # Decode incrementally instead of reading the whole upload into memory
+    text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        # Leave the underlying upload file open for its owner to close (if
+        # the owner closed it already, e.g. when a job was stopped midway,
+        # there is nothing to detach from)
+        if not text.closed:
+            text.detach()
+
+
+def _iter_excel_rows(file: BinaryIO) -> Iterator[dict[str, Any]]:
+    try:
+        import openpyxl
+    except ImportError:
+        raise RuntimeError(
+            "Excel support not installed. Please use CSV or install openpyxl."
+        )
+
+    # Read-only mode streams rows from the sheet XML instead of building the
+    # whole workbook in memory
+    workbook = openpyxl.load_workbook(file, read_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+
+        # Get headers from first row
+        headers = next(rows, None)
+        if headers is None:
+            return
+
+        for row in rows:
+            if any(row):  # Skip empty rows
+                # Empty cells are left out, like missing columns
+                yield {
+                    headers[i]: row[i]
+                    for i in range(len(headers))
+                    if i < len(row) and row[i] is not None
+                }
+    finally:
+        workbook.close()
+
+
+def iter_upload_rows(
+    file: BinaryIO, file_ext: str, chunk_size: int, skip_rows: int = 0
+) -> Iterator[list[dict]]:
+    """
+    Parse an uploaded CSV or Excel file lazily, yielding rows in chunks of
+    `chunk_size` dicts keyed by the header row.
+    The first `skip_rows` data rows are skipped (used to resume a job).
+    """
+    if file_ext == "csv":
+        rows = _iter_csv_rows(file)
+    else:
+        rows = _iter_excel_rows(file)
+    return _chunked(islice(rows, skip_rows, None), chunk_size)
+
+
+class EmailAllocator:
+    """
+    Hands out unique `base.series[.N]@alumni.rca.com` addresses for an import.
+
+    Existing addresses are looked up a chunk at a time: the chunk's explicit
+    emails, and every address under the stems (`base.series`) its generated
+    emails will use. After that every check is a set lookup, and addresses
+    claimed by earlier rows of the same file count as taken too.
+    """
+
+    domain = "alumni.rca.com"
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.taken: set[str] = set()
+        # Stems whose existing addresses are already in `taken`
+        self.loaded_stems: set[str] = set()
+        # Next numeric suffix to try for each `base.series` stem
+        self.next_suffix: dict[str, int] = {}
+
+    @staticmethod
+    def stem(full_name: str, series: str, university_id: str = "") -> str:
+        """The `base.series` part of a generated email"""
+        # Use university_id if available, otherwise use name
+        if university_id:
+            base = university_id.lower()
+        else:
+            # Take first name and last name
+            name_parts = full_name.lower().strip().split()
+            if len(name_parts) >= 2:
+                base = f"{name_parts[0]}.{name_parts[-1]}"
+            else:
+                base = name_parts[0] if name_parts else "alumni"
+        return f"{base}.{series}"
+
+    async def prefetch(self, emails: Iterable[str]) -> None:
+        """
+        Mark which of the given addresses already exist, with one query, so
+        `claim` can check them in memory.
+        """
+        lookup = {e for e in emails if e} - self.taken
+        if lookup:
+            self.taken.update(
+                await self.session.scalars(
+                    select(User.email).where(User.email.in_(lookup))
+                )
+            )
+
+    async def prefetch_stems(self, stems: Iterable[str]) -> None:
+        """
+        Mark the existing addresses starting with any of the given stems as
+        taken, with one query, so `generate` can pick free suffixes in memory.
+        Each stem is a range on the email index (`stem <= email < stem
+        + U+FFFF`) rather than a LIKE, which would scan it.
+        """
+        lookup = set(stems) - self.loaded_stems
+        if not lookup:
+            return
+        self.taken.update(
+            await self.session.scalars(
+                select(User.email).where(
+                    or_(
+                        *(
+                            and_(User.email >= stem, User.email < stem + "\uffff")
+                            for stem in lookup
+                        )
+                    )
+                )
+            )
+        )
+        self.loaded_stems |= lookup
+
+    def claim(self, email: str) -> bool:
+        """Reserve an address; returns False if it is already taken."""
+        if email in self.taken:
+            return False
+        self.taken.add(email)
+        return True
+
+    def generate(self, full_name: str, series: str, university_id: str = "") -> str:
+        """
+        Generate and reserve an email from name and series. Its stem must have
+        been passed to `prefetch_stems` first.
+        """
+        stem = self.stem(full_name, series, university_id)
+        counter = self.next_suffix.get(stem, 0)
+        email = f"{stem}@{self.domain}"
+        if counter:
+            email = f"{stem}.{counter}@{self.domain}"
+
+        # Add a number if the address is taken
+        while email in self.taken:
+            counter += 1
+            email = f"{stem}.{counter}@{self.domain}"
+
+        self.next_suffix[stem] = counter + 1
+        self.taken.add(email)
+        return email
+
+
+def bulk_create_alumni(session: Session, accounts: list[dict]) -> list[int]:
+    """
+    Insert alumni users and their profiles set-wise instead of row by row.
+
+    Each account is a dict with "email", "hashed_password" and "profile" (the
+    Profile column values). Users go in with one multi-row INSERT ... RETURNING,
+    then all profiles are inserted in a single executemany batch.
+    Returns the new user ids in the same order as `accounts`.
+    From an AsyncSession, call it through `session.run_sync`.
+    """
+    if not accounts:
+        return []
+
+    user_ids = session.scalars(
+        insert(User).returning(User.id, sort_by_parameter_order=True),
+        [
+            {
+                "email": account["email"],
+                "hashed_password": account["hashed_password"],
+                "role": UserRole.ALUMNI,
+                "is_active": True,
+            }
+            for account in accounts
+        ],
+    ).all()
+
+    session.execute(
+        insert(Profile),
+        [
+            {"user_id": user_id, **account["profile"]}
+            for user_id, account in zip(user_ids, accounts)
+        ],
+    )
+    return list(user_ids)
+
+
+def generate_password(length: int = 12) -> str:
+    """Generate a random secure password"""
+    alphabet = string.ascii_letters + string.digits
+    password = "".join(secrets.choice(alphabet) for _ in range(length))
+    return password
+
+
+def new_import_results() -> dict[str, Any]:
+    return {
+        "total": 0,
+        "success": 0,
+        "failed": 0,
+        "errors": [],
+        "created_users": [],
+        "auto_generated_credentials": [],
+    }
+
+
+class AlumniImporter:
+    """
+    Runs the bulk alumni import one chunk of rows at a time: validate rows,
+    allocate emails, hash passwords on the process pool and insert set-wise.
+    Outcomes accumulate in `results`; committing is left to the caller.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        results: dict[str, Any] | None = None,
+        rows_seen: int = 0,
+    ):
+        self.session = session
+        self.results = results or new_import_results()
+        # Rows of the file handled so far (used to number rows in errors)
+        self.rows_seen = rows_seen
+        # Tracks existing and already-claimed emails for the whole file
+        self.emails = EmailAllocator(session)
+
+    async def import_chunk(self, rows: list[dict]) -> None:
+        results = self.results
+        results["total"] += len(rows)
+        pending = []
+
+        # Look up the chunk's explicit emails, and the existing addresses its
+        # generated emails could clash with, in a query each
+        await self.emails.prefetch(str(row.get("email", "")).strip() for row in rows)
+        await self.emails.prefetch_stems(
+            EmailAllocator.stem(
+                str(row.get("full_name", "")).strip(),
+                str(row.get("series", "")).strip(),
+                str(row.get("university_id", "")).strip(),
+            )
+            for row in rows
+            if not str(row.get("email", "")).strip()
+        )
+
+        # Validate each row and collect the accounts to create
+        for idx, row in enumerate(rows, start=self.rows_seen + 1):
+            try:
+                # Get values with defaults
+                full_name = str(row.get("full_name", "")).strip()
+                series = str(row.get("series", "")).strip()
+                university_id = str(row.get("university_id", "")).strip()
+
+                # Validate minimum required fields
+                if not full_name or not series:
+                    results["errors"].append(
+                        {
+                            "row": idx,
+                            "error": "Missing required fields: full_name and series are mandatory",
+                            "data": {"full_name": full_name, "series": series},
+                        }
+                    )
+                    results["failed"] += 1
+                    continue
+
+                # Get or generate email
+                email = str(row.get("email", "")).strip()
+                email_generated = False
+                if not email:
+                    email = self.emails.generate(full_name, series, university_id)
+                    email_generated = True
+
+                # Check if user already exists
+                elif not self.emails.claim(email):
+                    results["errors"].append(
+                        {"row": idx, "email": email, "error": "User already exists"}
+                    )
+                    results["failed"] += 1
+                    continue
+
+                # Get or generate password
+                password = str(row.get("password", "")).strip()
+                password_generated = False
+                if not password:
+                    password = generate_password()
+                    password_generated = True
+
+                # Parse blood group if provided
+                blood_group = None
+                blood_group_str = str(row.get("blood_group", "")).strip()
+                if blood_group_str:
+                    try:
+                        # Convert A+ to A_POS format
+                        bg_map = {
+                            "A+": "A_POS",
+                            "A-": "A_NEG",
+                            "B+": "B_POS",
+                            "B-": "B_NEG",
+                            "O+": "O_POS",
+                            "O-": "O_NEG",
+                            "AB+": "AB_POS",
+                            "AB-": "AB_NEG",
+                        }
+                        blood_group = BloodGroup[
+                            bg_map.get(blood_group_str, blood_group_str.upper())
+                        ]
+                    except (KeyError, ValueError):
+                        pass  # Ignore invalid blood group
+
+                # Parse is_employed
+                is_employed_str = str(row.get("is_employed", "false")).strip().lower()
+                is_employed = is_employed_str in ["true", "yes", "1", "t", "y"]
+
+                pending.append(
+                    {
+                        "row": idx,
+                        "email": email,
+                        "password": password,
+                        "email_generated": email_generated,
+                        "password_generated": password_generated,
+                        "profile": {
+                            "full_name": full_name,
+                            "phone_number": str(row.get("phone_number", "")).strip()
+                            or None,
+                            "blood_group": blood_group,
+                            "university_id": university_id or "",
+                            "department": str(row.get("department", "")).strip() or "",
+                            "series": series,
+                            "is_employed": is_employed,
+                            "current_company": str(
+                                row.get("current_company", "")
+                            ).strip()
+                            or None,
+                            "designation": str(row.get("designation", "")).strip()
+                            or None,
+                            "work_location": str(row.get("work_location", "")).strip()
+                            or None,
+                            "linkedin_profile": str(
+                                row.get("linkedin_profile", "")
+                            ).strip()
+                            or None,
+                        },
+                    }
+                )
+
+            except Exception as e:
+                results["errors"].append(
+                    {"row": idx, "email": row.get("email", "N/A"), "error": str(e)}
+                )
+                results["failed"] += 1
+
+        self.rows_seen += len(rows)
+
+        # Hash the chunk's passwords in one batch on the process pool
+        hashed_passwords = await security.get_password_hashes(
+            [item["password"] for item in pending]
+        )
+
+        # Insert the chunk's users and profiles set-wise
+        await self.session.run_sync(
+            bulk_create_alumni,
+            [
+                {
+                    "email": item["email"],
+                    "hashed_password": hashed_password,
+                    "profile": item["profile"],
+                }
+                for item, hashed_password in zip(pending, hashed_passwords)
+            ],
+        )
+
+        for item in pending:
+            email = item["email"]
+            full_name = item["profile"]["full_name"]
+            series = item["profile"]["series"]
+
+            results["success"] += 1
+            user_info = {"email": email, "full_name": full_name, "series": series}
+            results["created_users"].append(user_info)
+
+            # Track auto-generated credentials
+            if item["email_generated"] or item["password_generated"]:
+                cred_info = {
+                    "row": item["row"],
+                    "email": email,
+                    "full_name": full_name,
+                }
+                if item["email_generated"]:
+                    cred_info["email_generated"] = True
+                if item["password_generated"]:
+                    # Include generated password
+                    cred_info["password"] = item["password"]
+                    cred_info["password_generated"] = True
+                results["auto_generated_credentials"].append(cred_info)
@@ -0,0 +1,100 @@
+"""
+Blood donor lookup for the alumni directory.
+"""
+
+from typing import Any, Iterator
+from fastapi import HTTPException
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
+from src.api.pagination import decode_cursor, encode_cursor
+from src.models.enums import COMPATIBLE_DONORS, BloodGroup
+from src.models.user import Profile, User
+
+CURSOR_COLUMNS = [Profile.blood_group, Profile.work_location, Profile.id]
+
+
+def _donor_queries(
+    statement: Select,
+    groups: tuple[BloodGroup, ...],
+    after: list[Any] | None,
+    located_only: bool = False,
+) -> Iterator[Select]:
+    # Yield ordered queries that together walk the donors in result order.
+    # Each one is a single range of ix_profiles_blood_group_work_location
+    # (id is the implicit last column), so it is a seek, never a sort.
+    # With `located_only` (the statement filters on a work location) the
+    # donors without one can't match, so they aren't queried.
+    if after is not None:
+        groups = groups[groups.index(after[0]) :]
+
+    for group in groups:
+        in_group = statement.where(Profile.blood_group == group)
+        with_location = in_group.where(Profile.work_location.is_not(None)).order_by(
+            Profile.work_location, Profile.id
+        )
+        without_location = in_group.where(Profile.work_location.is_(None)).order_by(
+            Profile.id
+        )
+
+        if after is None or after[0] != group:
+            yield with_location
+            tail = without_location
+        elif after[1] is not None:
+            yield with_location.where(
+                tuple_(Profile.work_location, Profile.id) > tuple_(after[1], after[2])
+            )
+            tail = without_location
+        else:
+            tail = without_location.where(Profile.id > after[2])
+        if not located_only:
+            yield tail
+        after = None
+
+
+async def find_donors(
+    session: AsyncSession,
+    needs: BloodGroup,
+    location: str | None = None,
+    cursor: str | None = None,
+    limit: int = 20,
+) -> dict[str, Any]:
+    """
+    Active users who can donate blood to a `needs` recipient, one page at a
+    time: donors of the preferred groups (see COMPATIBLE_DONORS) first, then
+    by work location and id. Returns `{"items", "next_cursor"}` like
+    `paginate`.
+    """
+    limit = max(1, min(limit, 100))
+    groups = COMPATIBLE_DONORS[needs]
+
+    after = None
+    if cursor:
+        after = decode_cursor(cursor, CURSOR_COLUMNS)
+        if after[0] not in groups or after[2] is None:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    statement = (
+        select(User)
+        .join(User.profile)
+        .options(contains_eager(User.profile))
+        .where(User.is_active.is_(True))
+    )
+    if location:
+        statement = statement.where(Profile.work_location == location)
+
+    # Fetch one extra row to know whether there is a next page
+    rows = []
+    for donors in _donor_queries(statement, groups, after, located_only=bool(location)):
+        rows += await session.scalars(donors.limit(limit + 1 - len(rows)))
+        if len(rows) > limit:
+            break
+
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1].profile
+        next_cursor = encode_cursor([getattr(last, c.key) for c in CURSOR_COLUMNS])
+
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,65 @@
+"""
+Facet counts for the alumni directory (profiles per series, department, ...).
+"""
+
+from sqlalchemy import String, cast, func, insert, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.models.enums import BloodGroup
+from src.models.user import PROFILE_FACET_COLUMNS, Profile, ProfileFacet
+
+
+def _count_profiles_by_facet():
+    # One GROUP BY per facet: (facet, value, count) rows straight from profiles
+    selects = []
+    for facet, column_name in PROFILE_FACET_COLUMNS.items():
+        column = cast(getattr(Profile, column_name), String)
+        selects.append(
+            select(
+                literal(facet, String).label("facet"),
+                column.label("value"),
+                func.count().label("count"),
+            )
+            .where(column.is_not(None), column != "")
+            .group_by(column)
+        )
+    return union_all(*selects)
+
+
+def rebuild_profile_facets(session: Session) -> int:
+    """
+    Recompute the facet table from scratch. Returns the number of facet values.
+    The caller commits.
+    """
+    session.query(ProfileFacet).delete()
+    result = session.execute(
+        insert(ProfileFacet).from_select(
+            ["facet", "value", "count"], _count_profiles_by_facet()
+        )
+    )
+    return result.rowcount
+
+
+async def read_profile_facets(session: AsyncSession) -> dict[str, list[dict]]:
+    """
+    Facet values with their profile counts, most common first.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        # Kept up to date by triggers, so this reads one row per facet value
+        rows = await session.execute(
+            select(ProfileFacet.facet, ProfileFacet.value, ProfileFacet.count)
+        )
+    else:
+        # No triggers outside SQLite: count on the fly
+        rows = await session.execute(_count_profiles_by_facet())
+
+    facets: dict[str, list[dict]] = {facet: [] for facet in PROFILE_FACET_COLUMNS}
+    for facet, value, count in rows:
+        if facet == "blood_group":
+            # Stored by enum name (e.g. "A_POS"); show the label ("A+")
+            value = BloodGroup[value].value
+        facets[facet].append({"value": value, "count": count})
+
+    for values in facets.values():
+        values.sort(key=lambda item: (-item["count"], item["value"]))
+    return facets
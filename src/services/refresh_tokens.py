@@ -0,0 +1,21 @@
+"""
+Housekeeping for the refresh_tokens table.
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import Delete, delete
+from src.models.user import RefreshToken
+
+
+def delete_expired_refresh_tokens(user_id: int | None = None) -> Delete:
+    """
+    DELETE of the refresh tokens past their expiry: one user's, or everyone's.
+    Spent tokens are kept until then, so presenting one again is still
+    detected as reuse.
+    """
+    statement = delete(RefreshToken).where(
+        RefreshToken.expires_at < datetime.now(timezone.utc)
+    )
+    if user_id is not None:
+        statement = statement.where(RefreshToken.user_id == user_id)
+    return statement
@@ -0,0 +1,340 @@
+"""
+Synthetic data for load and scale testing: alumni with profiles, events,
+notices and committee sessions, generated deterministically from a seed and
+bulk-loaded in batches.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Iterator
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import Session
+from src.models.committee import CommitteeMember, CommitteeSession
+from src.models.content import Event, Notice
+from src.models.enums import BloodGroup, UserRole
+from src.models.user import PROFILE_FACET_DDL, PROFILE_SEARCH_DDL, Profile, User
+from src.services.profile_facets import rebuild_profile_facets
+
+FIRST_NAMES = [
+    "Abdul", "Ahmed", "Amina", "Anika", "Arif", "Ayesha", "Farhan", "Fatima",
+    "Habib", "Hasan", "Imran", "Israt", "Jamal", "Karim", "Laila", "Mahmud",
+    "Maria", "Mehedi", "Nadia", "Nafis", "Nasrin", "Rafiq", "Rahim", "Rakib",
+    "Sabbir", "Sadia", "Sakib", "Samira", "Shahid", "Sumaiya", "Tanvir", "Zara",
+]  # fmt: skip
+LAST_NAMES = [
+    "Ahmed", "Akter", "Alam", "Chowdhury", "Das", "Haque", "Hossain", "Islam",
+    "Kabir", "Khan", "Mahmud", "Miah", "Rahman", "Roy", "Sarkar", "Siddique",
+    "Sultana", "Talukder", "Uddin", "Zaman",
+]  # fmt: skip
+DEPARTMENTS = ["CSE", "EEE", "CE", "ME", "IPE", "URP", "ARCH", "ETE", "MTE", "GCE"]
+COMPANIES = [
+    "Tech Corp", "Digital Solutions", "Global Tech", "Grameenphone", "Robi",
+    "bKash", "BRAC", "Walton", "Square Group", "Pathao", "Samsung R&D",
+    "Google", "Microsoft", "Amazon",
+]  # fmt: skip
+DESIGNATIONS = [
+    "Software Engineer", "Senior Software Engineer", "Team Lead",
+    "Electrical Engineer", "Civil Engineer", "Project Manager", "Lecturer",
+    "Data Scientist", "Consultant", "Architect",
+]  # fmt: skip
+LOCATIONS = [
+    "Dhaka", "Rajshahi", "Chittagong", "Khulna", "Sylhet", "Rangpur",
+    "Singapore", "Toronto", "London", "Berlin", "Sydney", "Tokyo",
+]  # fmt: skip
+POSITIONS = ["President", "Vice President", "General Secretary", "Treasurer"]
+
+# Graduation years alumni are spread over
+FIRST_SERIES = 1990
+LAST_SERIES = 2024
+
+# Fixed reference point for generated dates, so a seed always gives the
+# same rows regardless of when it runs
+EPOCH = datetime(2025, 1, 1)
+
+
+def alumni_series(user_id: int) -> str:
+    return str(FIRST_SERIES + user_id % (LAST_SERIES - FIRST_SERIES + 1))
+
+
+def alumni_university_id(user_id: int) -> str:
+    return f"{alumni_series(user_id)}{user_id:07d}"
+
+
+def alumni_email(user_id: int) -> str:
+    """
+    Email of the seeded alumni with this user id (as the bulk upload would
+    generate it from university id and series).
+    """
+    return f"{alumni_university_id(user_id)}.{alumni_series(user_id)}@alumni.rca.com"
+
+
+USER_COLUMNS = [
+    "id",
+    "email",
+    "hashed_password",
+    "role",
+    "is_active",
+    "token_version",
+    "created_at",
+    "updated_at",
+]
+PROFILE_COLUMNS = [
+    "id",
+    "user_id",
+    "full_name",
+    "phone_number",
+    "blood_group",
+    "university_id",
+    "department",
+    "series",
+    "is_employed",
+    "current_company",
+    "designation",
+    "work_location",
+    "linkedin_profile",
+    "created_at",
+    "updated_at",
+]
+
+# SQLite triggers that index each new profile for search and facet counts.
+# They are dropped for a bulk load and both indexes rebuilt set-wise after,
+# which is far faster than firing them row by row.
+PROFILE_INSERT_TRIGGERS = {
+    "profiles_fts_ai": PROFILE_SEARCH_DDL[1],
+    "profile_facets_ai": PROFILE_FACET_DDL[0],
+}
+
+
+def _bind(column: Any, dialect: Dialect) -> Callable[[Any], Any]:
+    # Converts a value to what the driver is given for this column
+    return column.type.bind_processor(dialect) or (lambda value: value)
+
+
+def _alumni(
+    rng: random.Random, user_ids: range, hashed_password: str, dialect: Dialect
+) -> tuple[list[tuple], list[tuple]]:
+    # Rows are tuples in USER_COLUMNS / PROFILE_COLUMNS order, already in
+    # driver form, so they can go to executemany without per-row processing
+    role = _bind(User.role, dialect)(UserRole.ALUMNI)
+    blood_groups = [_bind(Profile.blood_group, dialect)(g) for g in BloodGroup]
+    timestamp = _bind(User.created_at, dialect)
+
+    users, profiles = [], []
+    for user_id in user_ids:
+        employed = rng.random() < 0.75
+        created_at = timestamp(
+            EPOCH - timedelta(minutes=rng.randrange(5 * 365 * 24 * 60))
+        )
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        users.append(
+            (
+                user_id,
+                alumni_email(user_id),
+                hashed_password,
+                role,
+                rng.random() < 0.98,
+                0,
+                created_at,
+                created_at,
+            )
+        )
+        profiles.append(
+            (
+                user_id,
+                user_id,
+                f"{first} {last}",
+                f"+8801{rng.randrange(3, 10)}{rng.randrange(10**8):08d}",
+                rng.choice(blood_groups),
+                alumni_university_id(user_id),
+                rng.choice(DEPARTMENTS),
+                alumni_series(user_id),
+                employed,
+                rng.choice(COMPANIES) if employed else None,
+                rng.choice(DESIGNATIONS) if employed else None,
+                rng.choice(LOCATIONS) if rng.random() < 0.9 else None,
+                (
+                    f"https://linkedin.com/in/{first.lower()}-{last.lower()}-{user_id}"
+                    if rng.random() < 0.4
+                    else None
+                ),
+                created_at,
+                created_at,
+            )
+        )
+    return users, profiles
+
+
+def _insert_rows(
+    session: Session, table: Table, columns: list[str], rows: list[tuple]
+) -> None:
+    # One DB-API executemany, skipping SQLAlchemy's per-row parameter handling
+    connection = session.connection()
+    compiled = insert(table).compile(dialect=connection.dialect, column_keys=columns)
+    if not compiled.positional:
+        rows = [dict(zip(columns, row)) for row in rows]
+    connection.exec_driver_sql(str(compiled), rows)
+
+
+def _drop_profile_insert_triggers(session: Session) -> list[str]:
+    # Returns the dropped triggers (none outside SQLite or if missing)
+    if session.get_bind().dialect.name != "sqlite":
+        return []
+    existing = set(
+        session.scalars(
+            text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        ).all()
+    )
+    dropped = [name for name in PROFILE_INSERT_TRIGGERS if name in existing]
+    for name in dropped:
+        session.execute(text(f"DROP TRIGGER {name}"))
+    return dropped
+
+
+def _restore_profile_insert_triggers(session: Session, dropped: list[str]) -> None:
+    for name in dropped:
+        session.execute(text(PROFILE_INSERT_TRIGGERS[name]))
+    if "profiles_fts_ai" in dropped:
+        session.execute(
+            text("INSERT INTO profiles_fts(profiles_fts) VALUES ('rebuild')")
+        )
+    if "profile_facets_ai" in dropped:
+        rebuild_profile_facets(session)
+
+
+def _batched(rows: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _events(rng: random.Random, first: int, count: int) -> Iterator[dict]:
+    # Slugs are unique; `first` numbers them after the existing events
+    kinds = ["Freshers Reception", "Farewell", "Iftar Mahfil", "Reunion", "Seminar"]
+    for i in range(first, first + count):
+        kind = rng.choice(kinds)
+        when = EPOCH - timedelta(days=rng.randrange(-180, 15 * 365))
+        yield {
+            "title": f"{kind} {when.year}",
+            "slug": f"events/{kind.lower().replace(' ', '-')}-{when.year}-{i}",
+            "description": f"Join us for the {kind.lower()}. " * rng.randrange(5, 40),
+            "location": rng.choice(LOCATIONS),
+            "event_date": when,
+            "created_at": when - timedelta(days=30),
+            "updated_at": when - timedelta(days=30),
+        }
+
+
+def _notices(rng: random.Random, count: int, author_ids: list[int]) -> Iterator[dict]:
+    for i in range(count):
+        created_at = EPOCH - timedelta(hours=rng.randrange(10 * 365 * 24))
+        yield {
+            "title": f"Notice {i + 1}",
+            "content": "The association announces the following. "
+            * rng.randrange(10, 200),
+            "is_published": rng.random() < 0.9,
+            "is_pinned": rng.random() < 0.02,
+            "author_id": rng.choice(author_ids) if author_ids else None,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+def _committee_sessions(
+    session: Session, rng: random.Random, count: int, user_ids: list[int]
+) -> None:
+    # The most recent session becomes the active one, unless one already is
+    has_active = session.scalar(
+        select(CommitteeSession.id).where(CommitteeSession.is_active)
+    )
+    for i in range(count):
+        year = EPOCH.year - 1 - i
+        committee = CommitteeSession(
+            name=f"Executive Committee {year}-{(year + 1) % 100:02d}",
+            start_date=date(year, 1, 1),
+            end_date=date(year, 12, 31),
+            is_active=i == 0 and not has_active,
+            created_at=datetime(year, 1, 1),
+            updated_at=datetime(year, 1, 1),
+        )
+        session.add(committee)
+        session.flush()
+
+        positions = POSITIONS + ["Member"] * rng.randrange(6, 16)
+        session.execute(
+            insert(CommitteeMember),
+            [
+                {
+                    "session_id": committee.id,
+                    "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    "position": position,
+                    "rank": rank,
+                    "user_id": rng.choice(user_ids) if user_ids else None,
+                    "created_at": datetime(year, 1, 1),
+                    "updated_at": datetime(year, 1, 1),
+                }
+                for rank, position in enumerate(positions, start=1)
+            ],
+        )
+
+
+def seed_database(
+    session: Session,
+    *,
+    hashed_password: str,
+    users: int = 0,
+    events: int = 0,
+    notices: int = 0,
+    committee_sessions: int = 0,
+    seed: int = 0,
+    batch_size: int = 10_000,
+) -> dict[str, Any]:
+    """
+    Add generated data. The same seed and counts always produce the same
+    rows, and every user gets `hashed_password` (hash once, reuse it).
+
+    Users and profiles go in `batch_size` rows at a time, with ids assigned
+    up front so no per-row RETURNING is needed; this assumes nothing else
+    writes users meanwhile. On SQLite the search index and facet counts are
+    rebuilt once at the end instead of by triggers. The caller commits.
+    Returns the number of rows added per kind.
+    """
+    rng = random.Random(seed)
+    first_id = 1 + max(
+        session.scalar(select(func.max(User.id))) or 0,
+        session.scalar(select(func.max(Profile.id))) or 0,
+    )
+
+    # Profiles share the user's id, which keeps both sequences dense
+    dialect = session.get_bind().dialect
+    dropped = _drop_profile_insert_triggers(session) if users else []
+    for start in range(0, users, batch_size):
+        ids = range(first_id + start, first_id + min(start + batch_size, users))
+        user_rows, profile_rows = _alumni(rng, ids, hashed_password, dialect)
+        _insert_rows(session, User.__table__, USER_COLUMNS, user_rows)
+        _insert_rows(session, Profile.__table__, PROFILE_COLUMNS, profile_rows)
+    _restore_profile_insert_triggers(session, dropped)
+
+    user_ids = list(range(first_id, first_id + min(users, 1_000)))
+    author_ids = (
+        session.scalars(select(User.id).where(User.role == UserRole.ADMIN)).all()
+        or user_ids[:10]
+    )
+    first_event = session.scalar(select(func.max(Event.id))) or 0
+    for rows in _batched(_events(rng, first_event, events), batch_size):
+        session.execute(insert(Event.__table__), rows)
+    for rows in _batched(_notices(rng, notices, author_ids), batch_size):
+        session.execute(insert(Notice.__table__), rows)
+    _committee_sessions(session, rng, committee_sessions, user_ids)
+
+    return {
+        "users": users,
+        "events": events,
+        "notices": notices,
+        "committee_sessions": committee_sessions,
+    }
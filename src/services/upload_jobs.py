@@ -0,0 +1,316 @@
+"""
+Background processing for bulk alumni uploads.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import socket
+import time
+import uuid
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import iterate_in_threadpool
+from src.core import security, settings
+from src.db.database import AsyncSessionLocal
+from src.models.enums import UploadJobStatus
+from src.models.upload_job import (
+    BulkUploadCredentials,
+    BulkUploadJob,
+    BulkUploadJobError,
+)
+from src.services.alumni_import import (
+    AlumniImporter,
+    iter_upload_rows,
+    new_import_results,
+)
+
+logger = logging.getLogger(__name__)
+
+# Jobs running in this process, by id (also keeps their tasks from being
+# garbage collected)
+_running_jobs: dict[int, asyncio.Task] = {}
+
+# Identifies this worker process in the jobs it claims
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def save_upload(file: BinaryIO, file_ext: str) -> str:
+    """
+    Copy an uploaded file to the jobs directory and return its path.
+    """
+    os.makedirs(settings.UPLOAD_JOBS_DIR, exist_ok=True)
+    path = os.path.join(settings.UPLOAD_JOBS_DIR, f"{uuid.uuid4().hex}.{file_ext}")
+    with open(path, "wb") as out:
+        shutil.copyfileobj(file, out)
+    return path
+
+
+def start_upload_job(job_id: int) -> None:
+    """
+    Schedule a job on the running event loop, unless this process is already
+    running it.
+    """
+    if job_id in _running_jobs:
+        return
+    task = asyncio.create_task(run_upload_job(job_id))
+    _running_jobs[job_id] = task
+    task.add_done_callback(lambda _: _running_jobs.pop(job_id, None))
+
+
+async def stop_upload_jobs() -> None:
+    """
+    Cancel the jobs this process is running (at shutdown). Their committed
+    chunks are kept and the jobs are handed back as pending, so the next
+    worker to look for jobs continues them.
+    """
+    tasks = list(_running_jobs.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _claimable():
+    # Pending, or running under a lease its worker stopped renewing
+    expired = _utcnow() - timedelta(seconds=settings.UPLOAD_JOB_LEASE_SECONDS)
+    return or_(
+        BulkUploadJob.status == UploadJobStatus.PENDING,
+        and_(
+            BulkUploadJob.status == UploadJobStatus.RUNNING,
+            or_(BulkUploadJob.heartbeat.is_(None), BulkUploadJob.heartbeat < expired),
+        ),
+    )
+
+
+async def _claim(session: AsyncSession, job_id: int) -> bool:
+    """
+    Take the job for this worker. A single conditional UPDATE, so when
+    several workers try at once exactly one of them gets it.
+    """
+    now = _utcnow()
+    result = await session.execute(
+        update(BulkUploadJob)
+        .where(BulkUploadJob.id == job_id, _claimable())
+        .values(
+            status=UploadJobStatus.RUNNING,
+            claimed_by=WORKER_ID,
+            heartbeat=now,
+            started_at=func.coalesce(BulkUploadJob.started_at, now),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount == 1
+
+
+async def _update_claimed(session: AsyncSession, job_id: int, **values) -> bool:
+    """
+    Update the job and renew its lease, in the current transaction, if this
+    worker still holds it. Returns False if the job was taken over.
+    """
+    result = await session.execute(
+        update(BulkUploadJob)
+        .where(
+            BulkUploadJob.id == job_id,
+            BulkUploadJob.status == UploadJobStatus.RUNNING,
+            BulkUploadJob.claimed_by == WORKER_ID,
+        )
+        .values(heartbeat=_utcnow(), **values)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+async def _release(session: AsyncSession, job_id: int) -> None:
+    """
+    Hand the job back as pending, if this worker still holds it.
+    """
+    await session.execute(
+        update(BulkUploadJob)
+        .where(
+            BulkUploadJob.id == job_id,
+            BulkUploadJob.status == UploadJobStatus.RUNNING,
+            BulkUploadJob.claimed_by == WORKER_ID,
+        )
+        .values(status=UploadJobStatus.PENDING, claimed_by=None, heartbeat=None)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+
+def _add_chunk_outcome(
+    session: AsyncSession, job_id: int, results: dict[str, Any]
+) -> None:
+    """
+    Add the rows that failed and the credentials generated in the last chunk
+    to the session, and clear them from `results`: only the counters carry
+    over, so each progress commit writes just the new chunk's outcome.
+    """
+    session.add_all(
+        BulkUploadJobError(
+            job_id=job_id,
+            row=error["row"],
+            email=error.get("email"),
+            error=error["error"],
+        )
+        for error in results["errors"]
+    )
+    if results["auto_generated_credentials"]:
+        # Generated passwords are never stored in plaintext
+        session.add(
+            BulkUploadCredentials(
+                job_id=job_id,
+                data=security.encrypt_secret(
+                    json.dumps(results["auto_generated_credentials"]).encode()
+                ),
+            )
+        )
+    results["errors"] = []
+    results["created_users"] = []
+    results["auto_generated_credentials"] = []
+
+
+async def run_upload_job(job_id: int) -> None:
+    """
+    Import a saved upload chunk by chunk, committing the imported rows and the
+    job's progress together after each chunk.
+
+    The job is claimed first and does nothing if another worker holds it.
+    Every chunk is committed only while the claim is still ours, so a worker
+    whose job was taken over stops without importing rows twice.
+    """
+    session = AsyncSessionLocal()
+    file_path = None
+    finished = False
+    try:
+        if not await _claim(session, job_id):
+            return
+        job = await session.get(BulkUploadJob, job_id)
+        file_path = job.file_path
+
+        # Continue after the last committed chunk if the job was interrupted
+        resumed_from = job.processed_rows
+        results = new_import_results()
+        results.update(total=resumed_from, success=job.succeeded, failed=job.failed)
+        importer = AlumniImporter(session, results=results, rows_seen=resumed_from)
+        file_ext = file_path.rsplit(".", 1)[-1]
+        started = time.perf_counter()
+
+        with open(file_path, "rb") as file:
+            chunks = iter_upload_rows(
+                file, file_ext, settings.BULK_UPLOAD_CHUNK_SIZE, skip_rows=resumed_from
+            )
+            async for rows in iterate_in_threadpool(chunks):
+                await importer.import_chunk(rows)
+                _add_chunk_outcome(session, job_id, importer.results)
+
+                claimed = await _update_claimed(
+                    session,
+                    job_id,
+                    processed_rows=importer.rows_seen,
+                    succeeded=importer.results["success"],
+                    failed=importer.results["failed"],
+                    rows_per_second=(importer.rows_seen - resumed_from)
+                    / max(time.perf_counter() - started, 1e-6),
+                )
+                if not claimed:
+                    # Taken over after our lease expired; the new worker
+                    # redoes this chunk from the last committed progress
+                    await session.rollback()
+                    return
+                await session.commit()
+
+        finished = await _update_claimed(
+            session,
+            job_id,
+            status=UploadJobStatus.COMPLETED,
+            finished_at=_utcnow(),
+        )
+        await session.commit()
+
+    except asyncio.CancelledError:
+        # Stopped (at shutdown): drop the unfinished chunk and release the
+        # lease, so the job doesn't wait for it to expire
+        await session.rollback()
+        await _release(session, job_id)
+        raise
+
+    except Exception as e:
+        await session.rollback()
+        finished = await _update_claimed(
+            session,
+            job_id,
+            status=UploadJobStatus.FAILED,
+            error=f"Error processing file: {str(e)}",
+            finished_at=_utcnow(),
+        )
+        await session.commit()
+
+    finally:
+        if finished:
+            with suppress(FileNotFoundError):
+                os.remove(file_path)
+        await session.close()
+
+
+async def take_upload_credentials(
+    session: AsyncSession, job_id: int
+) -> list[dict[str, Any]]:
+    """
+    The credentials generated by a job, decrypted, in row order. They are
+    taken with a single DELETE ... RETURNING, so when two requests race
+    only the one whose DELETE removed the rows gets them.
+    """
+    stored = (
+        await session.execute(
+            delete(BulkUploadCredentials)
+            .where(BulkUploadCredentials.job_id == job_id)
+            .returning(BulkUploadCredentials.id, BulkUploadCredentials.data)
+        )
+    ).all()
+    await session.commit()
+    # RETURNING doesn't promise any order
+    stored.sort(key=lambda chunk: chunk.id)
+    return [
+        credential
+        for chunk in stored
+        for credential in json.loads(security.decrypt_secret(chunk.data))
+    ]
+
+
+async def resume_upload_jobs() -> None:
+    """
+    Restart jobs left unfinished by a worker process that stopped or is gone:
+    pending jobs, and running jobs whose lease expired. Jobs another live
+    worker is running are left alone.
+    """
+    async with AsyncSessionLocal() as session:
+        job_ids = (
+            await session.scalars(select(BulkUploadJob.id).where(_claimable()))
+        ).all()
+
+    for job_id in job_ids:
+        start_upload_job(job_id)
+
+
+async def watch_upload_jobs() -> None:
+    """
+    Resume unfinished jobs at startup, then every UPLOAD_JOB_SWEEP_SECONDS,
+    so a job whose worker died is taken over once its lease expires rather
+    than at the next restart. Runs until cancelled.
+    """
+    while True:
+        try:
+            await resume_upload_jobs()
+        except Exception:
+            logger.exception("Looking for unfinished upload jobs failed")
+        await asyncio.sleep(settings.UPLOAD_JOB_SWEEP_SECONDS)
@@ -0,0 +1,126 @@
+"""
+Shared fixtures. The app runs against a throwaway SQLite database, migrated
+to the latest revision, so tests see the same schema (and indexes) as
+production.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Settings are read when src is first imported, so point them at the test
+# database before anything imports it
+_tmp = Path(tempfile.mkdtemp(prefix="rca-tests-"))
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp / 'test.db'}"
+os.environ.pop("ASYNC_DATABASE_URL", None)
+os.environ["UPLOAD_JOBS_DIR"] = str(_tmp / "upload_jobs")
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from src.api import deps, response_cache
+from src.core.security import get_password_hash
+from src.db.database import SessionLocal, async_engine, engine
+from src.main import app
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ADMIN_EMAIL = "admin@rca.com"
+ADMIN_PASSWORD = "admin-password"
+
+
+class QueryCounter:
+    """
+    Statements (with their parameters) sent to the database while attached
+    to an engine.
+    """
+
+    def __init__(self):
+        self.queries: list[tuple[str, Any]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.queries.append((statement, parameters))
+
+    @property
+    def statements(self) -> list[str]:
+        return [statement for statement, _ in self.queries]
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def reset(self) -> None:
+        self.queries.clear()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    config = Config(str(ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    command.upgrade(config, "head")
+    yield
+    engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Cached principals, token versions and responses would make the queries
+    # a request runs depend on the tests that ran before
+    deps.principal_cache.clear()
+    deps.token_versions.clear()
+    response_cache.clear()
+
+
+@pytest.fixture(scope="session")
+def client(database):
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def admin(database) -> User:
+    with SessionLocal() as session:
+        user = User(
+            email=ADMIN_EMAIL,
+            hashed_password=get_password_hash(ADMIN_PASSWORD),
+            role=UserRole.ADMIN,
+            is_active=True,
+            profile=Profile(
+                full_name="Admin",
+                university_id="0000000000",
+                department="CSE",
+                series="2000",
+            ),
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        return user
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client, admin) -> dict[str, str]:
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": ADMIN_EMAIL, "password": ADMIN_PASSWORD},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def count_queries():
+    """
+    A QueryCounter recording every statement the API runs during the test.
+    """
+    counter = QueryCounter()
+    sync_engine = async_engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(sync_engine, "before_cursor_execute", counter)
@@ -0,0 +1,37 @@
+"""
+Query plan helpers shared by the tests (SQLite's EXPLAIN QUERY PLAN).
+"""
+
+from src.db.database import engine
+
+
+def query_plan(statement: str, parameters) -> list[str]:
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return [row.detail for row in rows]
+
+
+def plans_for(table: str, queries) -> list[list[str]]:
+    """
+    Plans of the captured SELECTs that read `table`.
+    """
+    plans = [
+        query_plan(statement, parameters)
+        for statement, parameters in queries
+        if statement.lstrip().upper().startswith("SELECT")
+        and f"FROM {table}" in statement
+    ]
+    assert plans, f"no query on {table}"
+    return plans
+
+
+def assert_searches(plan: list[str], table: str, index: str) -> None:
+    assert any(
+        step.startswith(f"SEARCH {table} USING INDEX {index} ") for step in plan
+    ), plan
+    assert not any(step.startswith("SCAN") for step in plan), plan
+
+
+def assert_walks_index(plan: list[str], table: str, index: str) -> None:
+    # A first page reads the index in order and stops after `limit` rows
+    assert plan == [f"SCAN {table} USING INDEX {index}"], plan
@@ -0,0 +1,108 @@
+"""
+Email allocation of the bulk alumni import.
+"""
+
+import asyncio
+
+from src.db.database import AsyncSessionLocal, SessionLocal
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+from src.services.alumni_import import AlumniImporter, EmailAllocator
+from tests.helpers import query_plan
+
+
+def add_alumni(*emails: str) -> None:
+    with SessionLocal() as session:
+        session.add_all(
+            User(
+                email=email,
+                hashed_password="!",
+                role=UserRole.ALUMNI,
+                is_active=True,
+                profile=Profile(
+                    full_name=email.split("@")[0],
+                    university_id="",
+                    department="CSE",
+                    series="2015",
+                ),
+            )
+            for email in emails
+        )
+        session.commit()
+
+
+def import_chunks(*chunks: list[dict]) -> dict:
+    # Passwords are hashed on the app's process pool (started by the `client`
+    # fixture's lifespan)
+    async def run() -> dict:
+        async with AsyncSessionLocal() as session:
+            importer = AlumniImporter(session)
+            for rows in chunks:
+                await importer.import_chunk(rows)
+            await session.commit()
+            return importer.results
+
+    return asyncio.run(run())
+
+
+def alumni_row(full_name: str, **values) -> dict:
+    return {"full_name": full_name, "series": "2015", "password": "pw", **values}
+
+
+def test_generated_emails_skip_taken_addresses(client):
+    add_alumni(
+        "rahim.uddin.2015@alumni.rca.com",
+        "rahim.uddin.2015.1@alumni.rca.com",
+        # Shares the prefix but not the stem
+        "rahim.uddin.20150@alumni.rca.com",
+    )
+
+    results = import_chunks(
+        [alumni_row("Rahim Uddin"), alumni_row("Rahim Uddin")],
+        [
+            # Claimed by an earlier row of the file
+            alumni_row("Karim Uddin", email="rahim.uddin.2015.4@alumni.rca.com"),
+            alumni_row("Rahim Uddin"),
+        ],
+    )
+
+    assert results["failed"] == 0, results["errors"]
+    assert [user["email"] for user in results["created_users"]] == [
+        "rahim.uddin.2015.2@alumni.rca.com",
+        "rahim.uddin.2015.3@alumni.rca.com",
+        "rahim.uddin.2015.4@alumni.rca.com",
+        "rahim.uddin.2015.5@alumni.rca.com",
+    ]
+
+
+def test_existing_explicit_email_is_rejected(client):
+    add_alumni("existing.2015@alumni.rca.com")
+
+    results = import_chunks(
+        [alumni_row("Existing Alumni", email="existing.2015@alumni.rca.com")]
+    )
+
+    assert results["success"] == 0
+    assert results["errors"][0]["error"] == "User already exists"
+
+
+def test_stem_lookup_searches_email_index(database, count_queries):
+    async def prefetch() -> None:
+        async with AsyncSessionLocal() as session:
+            allocator = EmailAllocator(session)
+            await allocator.prefetch_stems(["a.b.2015", "c.d.2015"])
+            # Stems are looked up once per import
+            await allocator.prefetch_stems(["a.b.2015"])
+
+    asyncio.run(prefetch())
+
+    ((statement, parameters),) = count_queries.queries
+    plan = query_plan(statement, parameters)
+    assert plan[0] == "MULTI-INDEX OR", plan
+    searches = [step for step in plan if not step.startswith(("MULTI", "INDEX "))]
+    # One range seek per stem
+    assert (
+        searches
+        == ["SEARCH users USING COVERING INDEX ix_users_email (email>? AND email<?)"]
+        * 2
+    ), plan
@@ -0,0 +1,121 @@
+"""
+Refresh token rotation, reuse detection and token revocation.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import update
+
+from src.core.security import get_password_hash
+from src.db.database import SessionLocal
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+
+PASSWORD = "a-password"
+
+
+@pytest.fixture
+def user(database) -> User:
+    with SessionLocal() as session:
+        user = User(
+            email=f"auth.{uuid.uuid4().hex[:8]}@alumni.rca.com",
+            hashed_password=get_password_hash(PASSWORD),
+            role=UserRole.ALUMNI,
+            is_active=True,
+            profile=Profile(
+                full_name="Auth Alumni",
+                university_id="",
+                department="CSE",
+                series="2014",
+            ),
+        )
+        session.add(user)
+        session.commit()
+        session.refresh(user)
+        return user
+
+
+def login(client, user: User) -> dict[str, str]:
+    response = client.post(
+        "/api/v1/auth/login", data={"username": user.email, "password": PASSWORD}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def refresh(client, tokens: dict[str, str]):
+    return client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+
+
+def read_me(client, tokens: dict[str, str]):
+    return client.get(
+        "/api/v1/users/me",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+
+
+def test_refresh_rotates_tokens(client, user):
+    tokens = login(client, user)
+
+    response = refresh(client, tokens)
+
+    assert response.status_code == 200
+    rotated = response.json()
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+    assert read_me(client, rotated).json()["email"] == user.email
+    assert refresh(client, rotated).status_code == 200
+
+
+def test_reused_refresh_token_revokes_all_tokens(client, user):
+    tokens = login(client, user)
+    rotated = refresh(client, tokens).json()
+    assert read_me(client, rotated).status_code == 200
+
+    # The spent token again: presumed stolen
+    assert refresh(client, tokens).status_code == 403
+
+    # Everything issued before is revoked, including the rotated pair
+    assert read_me(client, rotated).status_code == 403
+    assert read_me(client, tokens).status_code == 403
+    assert refresh(client, rotated).status_code == 403
+    # Logging in again works
+    assert read_me(client, login(client, user)).status_code == 200
+
+
+def test_tokens_of_deleted_user_are_rejected(client, admin_headers, user):
+    tokens = login(client, user)
+
+    response = client.delete(f"/api/v1/users/{user.id}", headers=admin_headers)
+    assert response.status_code == 200
+
+    assert read_me(client, tokens).status_code == 403
+    assert refresh(client, tokens).status_code == 403
+
+
+def test_tokens_with_old_version_are_rejected(client, user):
+    tokens = login(client, user)
+    # Revoked by another process: only the database knows (this process has
+    # no cached token version yet, see the clear_caches fixture)
+    with SessionLocal() as session:
+        session.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(token_version=User.token_version + 1)
+        )
+        session.commit()
+
+    assert read_me(client, tokens).status_code == 403
+    assert refresh(client, tokens).status_code == 403
+
+
+def test_access_token_is_not_a_refresh_token(client, user):
+    tokens = login(client, user)
+
+    response = client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["access_token"]}
+    )
+
+    assert response.status_code == 403
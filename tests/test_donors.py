@@ -0,0 +1,102 @@
+"""
+Blood donor lookup: the queries it runs, and that its cursor walks every
+compatible donor exactly once.
+"""
+
+import pytest
+from sqlalchemy import func, select
+
+from src.db.database import SessionLocal
+from src.models.enums import COMPATIBLE_DONORS, BloodGroup, UserRole
+from src.models.user import Profile, User
+
+LOCATION = "Donor Town"
+
+
+@pytest.fixture(scope="module")
+def donors(database):
+    with SessionLocal() as session:
+        session.add_all(
+            User(
+                email=f"donor.{i}@alumni.rca.com",
+                hashed_password="!",
+                role=UserRole.ALUMNI,
+                is_active=True,
+                profile=Profile(
+                    full_name=f"Donor {i}",
+                    university_id="",
+                    department="CSE",
+                    series="2015",
+                    blood_group=group,
+                    # Every other donor hasn't said where they work
+                    work_location=LOCATION if i % 2 else None,
+                ),
+            )
+            for i, group in enumerate(
+                [BloodGroup.O_NEG, BloodGroup.A_NEG, BloodGroup.AB_NEG] * 4
+            )
+        )
+        session.commit()
+
+
+def read_donors(client, **params) -> dict:
+    response = client.get("/api/v1/users/donors", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_location_filter_skips_unlocated_donors(client, donors, count_queries):
+    page = read_donors(client, needs="AB-", location=LOCATION, limit=100)
+
+    assert {item["profile"]["work_location"] for item in page["items"]} == {LOCATION}
+    assert len(page["items"]) == 6
+    assert page["next_cursor"] is None
+    # One query per compatible group, none for donors without a location
+    assert count_queries.count == len(COMPATIBLE_DONORS[BloodGroup.AB_NEG])
+    assert not any("IS NULL" in s for s in count_queries.statements)
+
+
+def test_location_filter_pages(client, donors):
+    seen = []
+    page = read_donors(client, needs="AB-", location=LOCATION, limit=4)
+    seen += page["items"]
+    while page["next_cursor"]:
+        page = read_donors(
+            client, needs="AB-", location=LOCATION, limit=4, cursor=page["next_cursor"]
+        )
+        seen += page["items"]
+
+    assert len(seen) == 6
+    assert len({item["id"] for item in seen}) == 6
+
+
+def test_pages_walk_every_compatible_donor_once(client, donors):
+    seen = []
+    page = read_donors(client, needs="AB-", limit=3)
+    seen += page["items"]
+    while page["next_cursor"]:
+        page = read_donors(client, needs="AB-", limit=3, cursor=page["next_cursor"])
+        seen += page["items"]
+
+    with SessionLocal() as session:
+        expected = session.scalar(
+            select(func.count())
+            .select_from(User)
+            .join(User.profile)
+            .where(
+                User.is_active.is_(True),
+                Profile.blood_group.in_(COMPATIBLE_DONORS[BloodGroup.AB_NEG]),
+            )
+        )
+    assert len(seen) == expected
+    assert len({item["id"] for item in seen}) == expected
+    # Preferred groups first; within a group, located donors before the rest
+    order = list(COMPATIBLE_DONORS[BloodGroup.AB_NEG])
+    keys = [
+        (
+            order.index(item["profile"]["blood_group"]),
+            item["profile"]["work_location"] is None,
+        )
+        for item in seen
+    ]
+    assert keys == sorted(keys)
@@ -0,0 +1,60 @@
+"""
+The /metrics endpoint: requests show up in it by route template, and it
+asks for METRICS_TOKEN when one is configured.
+"""
+
+import pytest
+
+from src.core.config import settings
+from src.core.metrics import render_metrics, request_metrics
+
+EVENT_ROUTE = "/api/v1/content/events/{event_id}"
+
+
+@pytest.fixture
+def metrics():
+    request_metrics.clear()
+    yield request_metrics
+    request_metrics.clear()
+
+
+def test_requests_are_counted_by_route_template(client, metrics):
+    for event_id in (987654, 987655):
+        assert client.get(f"/api/v1/content/events/{event_id}").status_code == 404
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    labels = f'method="GET",route="{EVENT_ROUTE}"'
+    assert f'http_requests_total{{{labels},status="404"}} 2' in lines
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"http_response_size_bytes_count{{{labels}}} 2" in lines
+    # Raw paths never become labels
+    assert "987654" not in response.text
+
+
+def test_render_metrics_includes_the_metrics_request(client, metrics):
+    client.get("/metrics")
+
+    # The scrape itself is recorded once it has finished
+    assert (
+        'http_requests_total{method="GET",route="/metrics",status="200"} 1'
+        in render_metrics().splitlines()
+    )
+
+
+def test_metrics_token(client, metrics, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+
+    response = client.get("/metrics")
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == "Bearer"
+    response = client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-token"})
+    assert response.status_code == 200
+    assert "http_requests_total" in response.text
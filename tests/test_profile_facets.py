@@ -0,0 +1,182 @@
+"""
+Directory facet counts. On SQLite they are read from `profile_facets`, which
+triggers on `profiles` keep up to date; they must always equal a GROUP BY
+over the profiles themselves.
+"""
+
+import pytest
+from sqlalchemy import delete, func, select, update
+
+from src.db.database import SessionLocal, async_engine
+from src.models.enums import BloodGroup, UserRole
+from src.models.user import PROFILE_FACET_COLUMNS, Profile, ProfileFacet, User
+from src.services.alumni_import import bulk_create_alumni
+from src.services.profile_facets import rebuild_profile_facets
+from src.services.seed import seed_database
+
+
+def counted_facets() -> dict[str, dict[str, int]]:
+    """
+    Facet counts straight from `profiles`, as /users/facets reports them.
+    """
+    facets = {}
+    with SessionLocal() as session:
+        for facet, column_name in PROFILE_FACET_COLUMNS.items():
+            column = getattr(Profile, column_name)
+            rows = session.execute(
+                select(column, func.count())
+                .where(column.is_not(None), column != "")
+                .group_by(column)
+            )
+            facets[facet] = {
+                value.value if isinstance(value, BloodGroup) else value: count
+                for value, count in rows
+            }
+    return facets
+
+
+def served_facets(client) -> dict[str, dict[str, int]]:
+    response = client.get("/api/v1/users/facets")
+    assert response.status_code == 200
+    return {
+        facet: {item["value"]: item["count"] for item in values}
+        for facet, values in response.json().items()
+    }
+
+
+def add_alumni(email: str, **profile) -> int:
+    with SessionLocal() as session:
+        user = User(
+            email=email,
+            hashed_password="!",
+            role=UserRole.ALUMNI,
+            is_active=True,
+            profile=Profile(
+                **{
+                    "full_name": "Facet Alumni",
+                    "university_id": "",
+                    "department": "CSE",
+                    "series": "2011",
+                    **profile,
+                }
+            ),
+        )
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def update_profile(user_id: int, **values) -> None:
+    with SessionLocal() as session:
+        session.execute(
+            update(Profile).where(Profile.user_id == user_id).values(**values)
+        )
+        session.commit()
+
+
+@pytest.fixture(autouse=True)
+def facets_match_profiles(client):
+    yield
+    assert served_facets(client) == counted_facets()
+
+
+def test_insert(client):
+    add_alumni(
+        "facet.insert@alumni.rca.com",
+        department="Facet Dept",
+        current_company="Facet Corp",
+        work_location="Facetville",
+        blood_group=BloodGroup.AB_NEG,
+    )
+    # Empty and missing values aren't counted
+    add_alumni("facet.empty@alumni.rca.com", department="", current_company=None)
+
+    facets = served_facets(client)
+    assert facets["department"]["Facet Dept"] == 1
+    assert facets["employer"]["Facet Corp"] == 1
+    assert "" not in facets["department"]
+
+
+def test_update_of_faceted_columns(client):
+    user_id = add_alumni(
+        "facet.update@alumni.rca.com",
+        series="1971",
+        current_company="Before Corp",
+        blood_group=BloodGroup.O_POS,
+    )
+
+    update_profile(
+        user_id,
+        series="1972",
+        current_company="",
+        work_location="Aftertown",
+        blood_group=None,
+    )
+    # Unchanged faceted values stay counted once
+    update_profile(user_id, full_name="Renamed", department="CSE")
+
+    facets = served_facets(client)
+    assert "1971" not in facets["series"]
+    assert facets["series"]["1972"] == 1
+    assert "Before Corp" not in facets["employer"]
+    assert facets["work_location"]["Aftertown"] == 1
+
+
+def test_delete(client, admin_headers):
+    user_id = add_alumni("facet.delete@alumni.rca.com", series="1969")
+    assert served_facets(client)["series"]["1969"] == 1
+
+    response = client.delete(f"/api/v1/users/{user_id}", headers=admin_headers)
+    assert response.status_code == 200
+
+    assert "1969" not in served_facets(client)["series"]
+
+
+def test_bulk_insert_and_seed(client):
+    with SessionLocal() as session:
+        bulk_create_alumni(
+            session,
+            [
+                {
+                    "email": f"facet.bulk.{i}@alumni.rca.com",
+                    "hashed_password": "!",
+                    "profile": {
+                        "full_name": "Facet Bulk",
+                        "university_id": "",
+                        "department": "Bulk Dept",
+                        "series": "1968",
+                    },
+                }
+                for i in range(3)
+            ],
+        )
+        # Drops the insert triggers and rebuilds the counts afterwards
+        seed_database(session, hashed_password="!", users=20, seed=14)
+        session.commit()
+
+    assert served_facets(client)["department"]["Bulk Dept"] == 3
+
+
+def test_rebuild(client):
+    add_alumni("facet.rebuild@alumni.rca.com", series="1967")
+    with SessionLocal() as session:
+        # Counts gone out of sync
+        session.execute(delete(ProfileFacet).where(ProfileFacet.facet == "series"))
+        session.add(ProfileFacet(facet="employer", value="Phantom Corp", count=4))
+        session.commit()
+    assert served_facets(client) != counted_facets()
+
+    with SessionLocal() as session:
+        values = rebuild_profile_facets(session)
+        session.commit()
+
+    facets = counted_facets()
+    assert values == sum(len(counts) for counts in facets.values())
+
+
+def test_counted_on_the_fly_without_triggers(client, monkeypatch):
+    add_alumni("facet.fallback@alumni.rca.com", series="1966")
+    # Outside SQLite the endpoint runs the GROUP BYs itself
+    monkeypatch.setattr(async_engine.sync_engine.dialect, "name", "postgresql")
+
+    assert served_facets(client) == counted_facets()
@@ -0,0 +1,84 @@
+"""
+Queries per request of the user endpoints. A budget that grows with the
+page size is an N+1 query (e.g. a profile lazily loaded per user).
+"""
+
+import pytest
+
+from src.db.database import SessionLocal
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+
+
+@pytest.fixture(scope="module")
+def alumni(database):
+    with SessionLocal() as session:
+        session.add_all(
+            User(
+                email=f"budget.{i}@alumni.rca.com",
+                # Never logged in with; a real hash would only slow the test
+                hashed_password="!",
+                role=UserRole.ALUMNI,
+                is_active=True,
+                profile=Profile(
+                    full_name=f"Budget Alumni {i}",
+                    university_id=f"19{i:08d}",
+                    department="EEE",
+                    series="2019",
+                ),
+            )
+            for i in range(30)
+        )
+        session.commit()
+
+
+@pytest.mark.parametrize("limit", [1, 10, 25])
+def test_read_users_page_runs_two_queries(client, alumni, count_queries, limit):
+    response = client.get("/api/v1/users/", params={"limit": limit})
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == limit
+    assert all(item["profile"] is not None for item in items)
+    # The page, then the profiles of all its users
+    assert count_queries.count == 2, count_queries.statements
+
+
+def test_read_users_next_page_runs_two_queries(client, alumni, count_queries):
+    first = client.get("/api/v1/users/", params={"limit": 10}).json()
+    count_queries.reset()
+
+    response = client.get(
+        "/api/v1/users/", params={"limit": 10, "cursor": first["next_cursor"]}
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 10
+    assert count_queries.count == 2, count_queries.statements
+
+
+def test_read_user_me(client, admin_headers, count_queries):
+    response = client.get("/api/v1/users/me", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert response.json()["profile"]["full_name"] == "Admin"
+    # The token version check, then the user with its profile
+    assert count_queries.count == 2, count_queries.statements
+
+    # The token version is cached from then on
+    count_queries.reset()
+    client.get("/api/v1/users/me", headers=admin_headers)
+    assert count_queries.count == 1, count_queries.statements
+
+
+def test_create_user(client, admin_headers, count_queries):
+    response = client.post(
+        "/api/v1/users/",
+        headers=admin_headers,
+        json={"email": "budget.new@alumni.rca.com", "password": "a-password"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["profile"]["full_name"] == "budget.new"
+    # Token version, email check, user and profile inserts, and the reload
+    assert count_queries.count == 5, count_queries.statements
@@ -0,0 +1,137 @@
+"""
+Query plans of the routes served by the hot path indexes (migration
+947e2f98da01). Each test captures the statements a request actually runs and
+checks SQLite's EXPLAIN QUERY PLAN for them: cursor pages must seek into the
+index (SEARCH ... USING INDEX), not scan the table.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from typer.testing import CliRunner
+
+import manage
+from src.db.database import SessionLocal, engine
+from src.models.committee import CommitteeMember, CommitteeSession
+from src.models.content import Event, Notice
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+from tests.helpers import assert_searches, assert_walks_index, plans_for
+
+
+@pytest.fixture(scope="module")
+def content(database):
+    started = datetime(2024, 1, 1)
+    with SessionLocal() as session:
+        session.add_all(
+            Event(
+                title=f"Plan Event {i}",
+                slug=f"events/plan-{i}",
+                event_date=started + timedelta(days=i),
+            )
+            for i in range(30)
+        )
+        session.add_all(
+            Notice(
+                title=f"Plan Notice {i}",
+                content="Notice",
+                is_published=i % 3 != 0,
+                created_at=started + timedelta(days=i),
+            )
+            for i in range(30)
+        )
+        for i in range(10):
+            session.add(
+                CommitteeSession(
+                    name=f"EC {2000 + i}",
+                    start_date=date(2000 + i, 1, 1),
+                    is_active=i == 9,
+                    members=[
+                        CommitteeMember(
+                            name=f"Member {rank}", position="Member", rank=rank
+                        )
+                        for rank in range(5)
+                    ],
+                )
+            )
+        session.commit()
+
+
+@pytest.mark.parametrize(
+    "url, table, index",
+    [
+        ("/api/v1/content/events", "events", "ix_events_event_date_id"),
+        (
+            "/api/v1/content/notices",
+            "notices",
+            "ix_notices_published_created_at_id",
+        ),
+        (
+            "/api/v1/committees/history",
+            "committee_sessions",
+            "ix_committee_sessions_start_date_id",
+        ),
+    ],
+)
+def test_listing_pages_use_index(client, content, count_queries, url, table, index):
+    response = client.get(url, params={"limit": 5})
+    assert response.status_code == 200
+    (plan,) = plans_for(table, count_queries.queries)
+    assert_walks_index(plan, table, index)
+
+    count_queries.reset()
+    response = client.get(
+        url, params={"limit": 5, "cursor": response.json()["next_cursor"]}
+    )
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 5
+    for plan in plans_for(table, count_queries.queries):
+        assert_searches(plan, table, index)
+
+
+def test_active_committee_uses_indexes(client, content, count_queries):
+    response = client.get("/api/v1/committees/active")
+
+    assert response.status_code == 200
+    assert len(response.json()["members"]) == 5
+    (plan,) = plans_for("committee_sessions", count_queries.queries)
+    assert_searches(plan, "committee_sessions", "ix_committee_sessions_active")
+    assert_searches(plan, "committee_members_1", "ix_committee_members_session_id_rank")
+
+
+def test_list_users_filter_uses_index(database):
+    with SessionLocal() as session:
+        session.add(
+            User(
+                email="plan.alumni@alumni.rca.com",
+                hashed_password="!",
+                role=UserRole.ALUMNI,
+                is_active=True,
+                profile=Profile(
+                    full_name="Plan Alumni",
+                    university_id="1800000001",
+                    department="ME",
+                    series="2018",
+                ),
+            )
+        )
+        session.commit()
+
+    queries = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        queries.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = CliRunner().invoke(
+            manage.app, ["list-users", "--series", "2018", "--department", "ME"]
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert result.exit_code == 0, result.output
+    assert "plan.alumni@alumni.rca.com" in result.output
+    (plan,) = plans_for("users", queries)
+    assert_searches(plan, "profiles", "ix_profiles_series_department")
@@ -0,0 +1,170 @@
+"""
+Cached public responses must not outlive the writes they depend on.
+"""
+
+import pytest
+from sqlalchemy import update
+
+from src.core import settings
+from src.db.database import SessionLocal
+from src.models.committee import CommitteeMember, CommitteeSession
+from src.models.content import Notice
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+
+
+@pytest.fixture
+def active_committee(database):
+    """
+    Make a new committee the only active one for the test (the previously
+    active ones are restored afterwards).
+    """
+    with SessionLocal() as session:
+        active_ids = session.scalars(
+            update(CommitteeSession)
+            .where(CommitteeSession.is_active)
+            .values(is_active=False)
+            .returning(CommitteeSession.id)
+        ).all()
+        committee = CommitteeSession(name="EC Cache", is_active=True)
+        session.add(committee)
+        session.commit()
+        committee_id = committee.id
+    yield committee_id
+    with SessionLocal() as session:
+        session.execute(update(CommitteeSession).values(is_active=False))
+        session.execute(
+            update(CommitteeSession)
+            .where(CommitteeSession.id.in_(active_ids))
+            .values(is_active=True)
+        )
+        session.commit()
+
+
+def test_deleting_user_drops_cached_links(client, admin_headers, active_committee):
+    with SessionLocal() as session:
+        user = User(
+            email="cache.author@alumni.rca.com",
+            hashed_password="!",
+            role=UserRole.ALUMNI,
+            is_active=True,
+            profile=Profile(
+                full_name="Cache Author",
+                university_id="1700000001",
+                department="CSE",
+                series="2017",
+            ),
+        )
+        session.add(user)
+        session.flush()
+        notice = Notice(title="Cache Notice", content="Notice", author_id=user.id)
+        session.add(notice)
+        session.add(
+            CommitteeMember(
+                session_id=active_committee,
+                name="Cache Author",
+                position="Member",
+                user_id=user.id,
+            )
+        )
+        session.commit()
+        user_id, notice_id = user.id, notice.id
+
+    def notice_author() -> int | None:
+        items = client.get("/api/v1/content/notices").json()["items"]
+        return next(item["author_id"] for item in items if item["id"] == notice_id)
+
+    def member_user() -> int | None:
+        committee = client.get("/api/v1/committees/active").json()
+        return committee["members"][0]["user_id"]
+
+    # Both responses are cached now
+    assert notice_author() == user_id
+    assert member_user() == user_id
+
+    response = client.delete(f"/api/v1/users/{user_id}", headers=admin_headers)
+
+    assert response.status_code == 200
+    assert notice_author() is None
+    assert member_user() is None
+
+
+def test_matching_etag_gets_not_modified(client):
+    url = "/api/v1/content/events"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    # Served from the cache: same representation, same ETag
+    assert client.get(url).headers["ETag"] == etag
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        revalidated = client.get(url, headers={"If-None-Match": if_none_match})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["ETag"] == etag
+
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_each_encoding_has_its_own_etag(client, monkeypatch):
+    monkeypatch.setattr(settings, "COMPRESSION_MIN_SIZE", 0)
+    url = "/api/v1/content/events"
+
+    plain = client.get(url, headers={"Accept-Encoding": "identity"})
+    gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    for response in (plain, gzipped):
+        assert response.headers["Vary"] == "Accept-Encoding"
+    assert gzipped.headers["ETag"] == plain.headers["ETag"][:-1] + '-gzip"'
+    # httpx decodes the body; both are the same JSON
+    assert gzipped.content == plain.content
+
+    # A tag is only good for its own encoding
+    response = client.get(
+        url,
+        headers={
+            "Accept-Encoding": "identity",
+            "If-None-Match": gzipped.headers["ETag"],
+        },
+    )
+    assert response.status_code == 200
+
+
+def assert_write_changes_etag(client, url: str, write) -> None:
+    etag = client.get(url).headers["ETag"]
+
+    write()
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_writes_change_etags(client, admin_headers, active_committee):
+    def post(url: str, body: dict) -> None:
+        response = client.post(url, headers=admin_headers, json=body)
+        assert response.status_code == 200, response.text
+
+    assert_write_changes_etag(
+        client,
+        "/api/v1/content/events",
+        lambda: post(
+            "/api/v1/content/events", {"title": "Cached", "slug": "events/cached"}
+        ),
+    )
+    assert_write_changes_etag(
+        client,
+        "/api/v1/content/notices",
+        lambda: post("/api/v1/content/notices", {"title": "Cached", "content": "-"}),
+    )
+    assert_write_changes_etag(
+        client,
+        "/api/v1/committees/active",
+        lambda: post(
+            "/api/v1/committees/sessions", {"name": "EC Cached", "is_active": True}
+        ),
+    )
@@ -0,0 +1,149 @@
+"""
+Directory search. On SQLite it reads the external-content FTS5 index, which
+triggers keep in sync with `profiles`; a stale index fails silently (missing
+or phantom results), so every way profiles are written is checked here.
+"""
+
+import pytest
+from sqlalchemy import select, text, update
+
+from src.db.database import SessionLocal, async_engine
+from src.models.enums import UserRole
+from src.models.user import Profile, User
+from src.services.alumni_import import bulk_create_alumni
+from src.services.seed import seed_database
+
+
+def add_alumni(email: str, full_name: str, **profile) -> int:
+    with SessionLocal() as session:
+        user = User(
+            email=email,
+            hashed_password="!",
+            role=UserRole.ALUMNI,
+            is_active=True,
+            profile=Profile(
+                full_name=full_name,
+                university_id="",
+                department="CSE",
+                series="2013",
+                **profile,
+            ),
+        )
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def search(client, q: str) -> list[str]:
+    response = client.get("/api/v1/users/search", params={"q": q})
+    assert response.status_code == 200
+    return [user["email"] for user in response.json()]
+
+
+@pytest.fixture(autouse=True)
+def index_matches_profiles():
+    # FTS5 compares the index with the content table (rank 1)
+    yield
+    with SessionLocal() as session:
+        session.execute(
+            text(
+                "INSERT INTO profiles_fts(profiles_fts, rank) "
+                "VALUES ('integrity-check', 1)"
+            )
+        )
+
+
+def test_inserted_profile_is_found(client):
+    add_alumni(
+        "zephyrine@alumni.rca.com",
+        "Zephyrine Quixote",
+        current_company="Nimbus Works",
+    )
+
+    assert search(client, "Zephyrine") == ["zephyrine@alumni.rca.com"]
+    # Prefix match, and terms from different fields
+    assert search(client, "zeph nimbus") == ["zephyrine@alumni.rca.com"]
+    assert search(client, "zeph nowhere") == []
+
+
+def test_updated_profile_is_reindexed(client):
+    user_id = add_alumni("oldname@alumni.rca.com", "Barnaby Oldname")
+
+    with SessionLocal() as session:
+        session.execute(
+            update(Profile)
+            .where(Profile.user_id == user_id)
+            .values(full_name="Barnaby Newname", work_location="Reykjavik")
+        )
+        session.commit()
+
+    assert search(client, "Oldname") == []
+    assert search(client, "Newname Reykjavik") == ["oldname@alumni.rca.com"]
+
+
+def test_deleted_profile_is_dropped(client, admin_headers):
+    user_id = add_alumni("deleted@alumni.rca.com", "Ottoline Deletable")
+    assert search(client, "Ottoline") == ["deleted@alumni.rca.com"]
+
+    response = client.delete(f"/api/v1/users/{user_id}", headers=admin_headers)
+    assert response.status_code == 200
+
+    assert search(client, "Ottoline") == []
+
+
+def test_bulk_created_profiles_are_found(client):
+    with SessionLocal() as session:
+        bulk_create_alumni(
+            session,
+            [
+                {
+                    "email": f"bulk.search.{i}@alumni.rca.com",
+                    "hashed_password": "!",
+                    "profile": {
+                        "full_name": f"Bulkington Searchable{i}",
+                        "university_id": "",
+                        "department": "EEE",
+                        "series": "2012",
+                    },
+                }
+                for i in range(3)
+            ],
+        )
+        session.commit()
+
+    assert sorted(search(client, "Bulkington")) == [
+        f"bulk.search.{i}@alumni.rca.com" for i in range(3)
+    ]
+    assert search(client, "Searchable1") == ["bulk.search.1@alumni.rca.com"]
+
+
+def test_seeded_profiles_are_found_and_triggers_restored(client):
+    with SessionLocal() as session:
+        seed_database(session, hashed_password="!", users=20, seed=13)
+        session.commit()
+        # A seeded alumni, found by name and series (names repeat)
+        email, full_name, series = session.execute(
+            select(User.email, Profile.full_name, Profile.series)
+            .join(User.profile)
+            .order_by(User.id.desc())
+        ).first()
+
+    assert email in search(client, f"{full_name} {series}")
+
+    # The seed dropped the insert trigger for the bulk load; it is back
+    add_alumni("after.seed@alumni.rca.com", "Wilhelmina Afterseed")
+    assert search(client, "Afterseed") == ["after.seed@alumni.rca.com"]
+
+
+def test_substring_fallback_without_fts(client, monkeypatch):
+    add_alumni(
+        "fallback@alumni.rca.com",
+        "Cornelius Fallback",
+        designation="Harbour Pilot",
+    )
+    # Outside SQLite the endpoint matches substrings with ILIKE instead
+    monkeypatch.setattr(async_engine.sync_engine.dialect, "name", "postgresql")
+
+    assert search(client, "elius fallb") == ["fallback@alumni.rca.com"]
+    assert search(client, "harbour PILOT") == ["fallback@alumni.rca.com"]
+    assert search(client, "cornelius nowhere") == []
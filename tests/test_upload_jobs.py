@@ -0,0 +1,142 @@
+"""
+Background bulk upload jobs: stopping, resuming and taking credentials.
+"""
+
+import asyncio
+import io
+
+import pytest
+from sqlalchemy import func, select
+
+from src.core import settings
+from src.db.database import AsyncSessionLocal
+from src.models.enums import UploadJobStatus
+from src.models.upload_job import BulkUploadJob
+from src.models.user import User
+from src.services import upload_jobs
+
+ROWS = 10
+
+
+def upload_csv(prefix: str) -> bytes:
+    lines = ["full_name,series,university_id"]
+    lines += [f"Job Alumni {i},2016,{prefix}{i:04d}" for i in range(ROWS)]
+    return "\n".join(lines).encode()
+
+
+async def create_job(prefix: str) -> int:
+    file_path = upload_jobs.save_upload(io.BytesIO(upload_csv(prefix)), "csv")
+    async with AsyncSessionLocal() as session:
+        job = BulkUploadJob(filename="alumni.csv", file_path=file_path)
+        session.add(job)
+        await session.commit()
+        return job.id
+
+
+async def load_job(job_id: int) -> BulkUploadJob:
+    async with AsyncSessionLocal() as session:
+        return await session.get(BulkUploadJob, job_id)
+
+
+async def count_users(prefix: str) -> int:
+    async with AsyncSessionLocal() as session:
+        return await session.scalar(
+            select(func.count()).select_from(User).where(User.email.startswith(prefix))
+        )
+
+
+async def wait_for_job(job_id: int) -> None:
+    task = upload_jobs._running_jobs.get(job_id)
+    if task is not None:
+        await task
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(settings, "BULK_UPLOAD_CHUNK_SIZE", 2)
+
+
+def test_stopped_job_is_released_and_resumed(client, small_chunks):
+    # Passwords are hashed on the app's process pool (started by `client`)
+    async def run() -> None:
+        job_id = await create_job("71")
+        upload_jobs.start_upload_job(job_id)
+
+        # Stop it once some, but not all, chunks are committed
+        while (await load_job(job_id)).processed_rows == 0:
+            await asyncio.sleep(0.01)
+        await upload_jobs.stop_upload_jobs()
+
+        job = await load_job(job_id)
+        assert job.status == UploadJobStatus.PENDING
+        assert job.claimed_by is None and job.heartbeat is None
+        assert 0 < job.processed_rows < ROWS
+        assert await count_users("71") == job.processed_rows
+
+        # Picked up straight away, not after the lease expires
+        await upload_jobs.resume_upload_jobs()
+        await wait_for_job(job_id)
+
+        job = await load_job(job_id)
+        assert job.status == UploadJobStatus.COMPLETED, job.error
+        assert (job.processed_rows, job.succeeded, job.failed) == (ROWS, ROWS, 0)
+        assert await count_users("71") == ROWS
+
+    asyncio.run(run())
+
+
+def test_job_running_here_is_not_started_twice(client, small_chunks):
+    async def run() -> None:
+        job_id = await create_job("72")
+        upload_jobs.start_upload_job(job_id)
+        task = upload_jobs._running_jobs[job_id]
+
+        upload_jobs.start_upload_job(job_id)
+
+        assert upload_jobs._running_jobs[job_id] is task
+        await wait_for_job(job_id)
+        assert (await load_job(job_id)).status == UploadJobStatus.COMPLETED
+        assert await count_users("72") == ROWS
+
+    asyncio.run(run())
+
+
+def run_job(prefix: str) -> int:
+    async def run() -> int:
+        job_id = await create_job(prefix)
+        await upload_jobs.run_upload_job(job_id)
+        return job_id
+
+    return asyncio.run(run())
+
+
+def test_credentials_are_downloaded_once(client, admin_headers):
+    job_id = run_job("73")
+    url = f"/api/v1/users/bulk-upload-jobs/{job_id}/credentials"
+
+    response = client.get(url, headers=admin_headers)
+
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines[0] == "row,email,full_name,password"
+    # Every row got a generated email and password
+    assert len(lines) == ROWS + 1
+    assert all(line.split(",")[3] for line in lines[1:])
+
+    assert client.get(url, headers=admin_headers).status_code == 410
+
+
+def test_concurrent_takes_get_credentials_once(client):
+    job_id = run_job("74")
+
+    async def take() -> list[dict]:
+        async with AsyncSessionLocal() as session:
+            return await upload_jobs.take_upload_credentials(session, job_id)
+
+    async def race() -> list[list[dict]]:
+        return await asyncio.gather(take(), take())
+
+    taken = sorted(asyncio.run(race()), key=len)
+
+    assert taken[0] == []
+    assert [credential["row"] for credential in taken[1]] == list(range(1, ROWS + 1))